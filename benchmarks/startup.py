@@ -0,0 +1,85 @@
+"""Measure the time needed to import Athena in a fresh interpreter.
+
+Compare the headless import (`import Athena`, used by `Athena.batch`) with the import of the ui module, and ensure
+that no Qt binding is imported by the headless import.
+
+Usage:
+    python benchmarks/startup.py [--runs 10]
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+
+SOURCE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+QT_BINDINGS = ('PySide2', 'PyQt5', 'PySide6', 'PyQt6')
+
+SNIPPET = '''
+import sys, json, time
+start = time.time()
+{statement}
+duration = time.time() - start
+print(json.dumps({{'duration': duration, 'qt': [name for name in {bindings!r} if name in sys.modules]}}))
+'''
+
+
+def measure(statement, runs):
+    """Import the given statement in `runs` new interpreters and return the durations and the Qt bindings loaded."""
+
+    environment = dict(os.environ)
+    environment['PYTHONPATH'] = os.pathsep.join(filter(None, (SOURCE_PATH, environment.get('PYTHONPATH'))))
+
+    durations = []
+    bindings = set()
+    for _ in range(runs):
+        process = subprocess.Popen(
+            [sys.executable, '-c', SNIPPET.format(statement=statement, bindings=QT_BINDINGS)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=environment
+        )
+        out, err = process.communicate()
+        if process.returncode:
+            return None, err.decode('utf-8', 'replace').strip().splitlines()[-1]
+
+        result = json.loads(out.decode('utf-8').strip().splitlines()[-1])
+        durations.append(result['duration'])
+        bindings.update(result['qt'])
+
+    return sorted(durations), sorted(bindings)
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10, help='Number of interpreters to start for each measure.')
+    args = parser.parse_args()
+
+    failed = False
+    for label, statement in (('headless', 'import Athena'), ('ui', 'import Athena; from Athena.AtGui import AtUi')):
+        durations, bindings = measure(statement, args.runs)
+
+        if durations is None:
+            print('{0:<10} could not be imported: {1}'.format(label, bindings))
+            continue
+
+        print('{0:<10} min {1:8.2f} ms - median {2:8.2f} ms - Qt: {3}'.format(
+            label,
+            durations[0] * 1000,
+            durations[len(durations) // 2] * 1000,
+            ', '.join(bindings) or 'None'
+        ))
+
+        if label == 'headless' and bindings:
+            failed = True
+            print('`import Athena` should not import any Qt binding.')
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,232 @@
+"""asyncio API to run the blueprints without blocking the event loop. (Python 3 only)
+
+The process methods are blocking, they are run in an executor (the loop default thread pool if None) and awaited with
+an optional timeout. Cancelling the awaiting task or reaching the timeout also cancel the process, it is stopped the
+next time it poll its `AtCore.CancellationToken`. (see `AtCore.Process.poll`)
+"""
+
+import asyncio
+import weakref
+import functools
+import threading
+
+from Athena import AtCore
+from Athena import AtBatch
+from Athena import AtConstants
+
+# One lock per blueprint, a process can't run two of its methods at the same time.
+_LOCKS = weakref.WeakKeyDictionary()
+_LOCKS_LOCK = threading.Lock()
+
+
+def getLock(blueprint):
+    """Get the lock used to prevent the given blueprint to run in more than one thread at a time."""
+
+    with _LOCKS_LOCK:
+        lock = _LOCKS.get(blueprint, None)
+        if lock is None:
+            lock = _LOCKS[blueprint] = threading.Lock()
+
+    return lock
+
+
+async def runInExecutor(function, *args, timeout=None, executor=None, **kwargs):
+    """Run the given function in an executor and wait for its result.
+
+    Parameters
+    -----------
+    function: callable
+        The blocking function to run.
+    *args:
+        Arguments of the function.
+    timeout: float, optional
+        Maximum number of seconds to wait for the result, `asyncio.TimeoutError` is raised when it is reached.
+    executor: concurrent.futures.Executor, optional
+        The executor to run the function in, the loop default executor is used if None.
+    **kwargs:
+        Keyword arguments of the function.
+
+    Returns
+    --------
+    type
+        The value returned by the function.
+    """
+
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(executor, functools.partial(function, *args, **kwargs))
+
+    return await asyncio.wait_for(future, timeout)
+
+
+async def runBlueprint(blueprint, method, *args, timeout=None, executor=None, **kwargs):
+    """Run a method of the given blueprint in an executor, the blueprint is locked while it run.
+
+    Parameters
+    -----------
+    blueprint: AtCore.Blueprint
+        The blueprint to run.
+    method: str
+        The name of the blueprint method to run. (check, fix or tool)
+    *args:
+        Arguments of the method.
+    timeout: float, optional
+        Maximum number of seconds to wait for the method, `asyncio.TimeoutError` is raised when it is reached.
+    executor: concurrent.futures.Executor, optional
+        The executor to run the method in, the loop default executor is used if None.
+    **kwargs:
+        Keyword arguments of the method.
+
+    Returns
+    --------
+    type
+        The value returned by the blueprint method.
+    """
+
+    def run():
+        with getLock(blueprint):
+            return getattr(blueprint, method)(*args, **kwargs)
+
+    try:
+        return await runInExecutor(run, timeout=timeout, executor=executor)
+    except (asyncio.CancelledError, asyncio.TimeoutError):
+        blueprint.cancel()
+        raise
+
+
+async def check(blueprint, links=True, force=False, timeout=None, executor=None):
+    """Awaitable version of `AtCore.Blueprint.check`, see `runBlueprint` for `timeout` and `executor`."""
+
+    return await runBlueprint(blueprint, AtConstants.CHECK, links=links, force=force, timeout=timeout, executor=executor)
+
+
+async def fix(blueprint, links=True, timeout=None, executor=None):
+    """Awaitable version of `AtCore.Blueprint.fix`, see `runBlueprint` for `timeout` and `executor`."""
+
+    return await runBlueprint(blueprint, AtConstants.FIX, links=links, timeout=timeout, executor=executor)
+
+
+async def gather(blueprints, method=AtConstants.CHECK, timeout=None, executor=None, returnExceptions=False):
+    """Run the same method of all the given blueprints concurrently, like `asyncio.gather`.
+
+    Blueprints connected by links can trigger each other, they are run serially in the env `header` order and the
+    groups of blueprints that are not connected are run concurrently. (see `AtCore.LinkGraph.getGroups`)
+
+    Parameters
+    -----------
+    blueprints: list
+        The blueprints of an env, in the env `header` order.
+    method: str
+        The name of the blueprint method to run. (default: 'check')
+    timeout: float, optional
+        Maximum number of seconds to wait for each blueprint.
+    executor: concurrent.futures.Executor, optional
+        The executor to run the methods in, the loop default executor is used if None.
+    returnExceptions: bool
+        If True, the exceptions raised by the blueprints are returned as result instead of being raised.
+
+    Returns
+    --------
+    list
+        The value returned by each blueprint method, in the order of the given blueprints.
+    """
+
+    blueprints = list(blueprints)
+    results = [None] * len(blueprints)
+
+    async def runGroup(group):
+        for index in group:
+            try:
+                results[index] = await runBlueprint(blueprints[index], method, timeout=timeout, executor=executor)
+            except (Exception, asyncio.TimeoutError) as exception:
+                if not returnExceptions:
+                    raise
+                results[index] = exception
+
+    await asyncio.gather(*(runGroup(group) for group in getGroups(blueprints)))
+
+    return results
+
+
+async def batch(context, env, timeout=None, executor=None, register=None, verbose=False):
+    """Awaitable version of `Athena.batch`, the groups of blueprints connected by links are run concurrently.
+
+    Parameters
+    -----------
+    context: str
+        The context containing the env to run.
+    env: str
+        The env to run.
+    timeout: float, optional
+        Maximum number of seconds to wait for each group of blueprints, `asyncio.TimeoutError` is raised when it is
+        reached.
+    executor: concurrent.futures.Executor, optional
+        The executor to run the blueprints in, the loop default executor is used if None.
+    register: AtCore.Register, optional
+        The register to get the blueprints from, a new one is created if None.
+    verbose: bool
+        Define if the blueprints errors should be logged. (default: False)
+
+    Returns
+    --------
+    list
+        List of tuple containing the blueprint name and its feedback for the blueprints that still have errors after
+        their fix, in the env `header` order.
+    """
+
+    if register is None:
+        register = await runInExecutor(AtCore.Register, verbose=verbose, executor=executor)
+    blueprints = await runInExecutor(register.getBlueprints, context, env, executor=executor)
+
+    # The token stop the groups between two blueprints and cancelling the blueprints stop those that are running.
+    token = AtCore.CancellationToken()
+    groups = AtBatch.getGroups(register.linkGraph)
+    try:
+        results = await asyncio.gather(*(
+            runInExecutor(AtBatch.runGroup, blueprints, group, verbose=verbose, token=token, timeout=timeout, executor=executor)
+            for group in groups
+        ))
+    except (asyncio.CancelledError, asyncio.TimeoutError):
+        token.cancel()
+        for blueprint in blueprints:
+            blueprint.cancel()
+        raise
+
+    errors = sorted((error for groupResult in results for error in groupResult), key=lambda error: error[0])
+
+    return [(blueprints[index].name, result) for index, result in errors]
+
+
+def getGroups(blueprints):
+    """Get the indexes of the given blueprints grouped by links, blueprints without LinkGraph are alone in their group.
+
+    Parameters
+    -----------
+    blueprints: list
+        The blueprints to group.
+
+    Returns
+    --------
+    list
+        List of list of indexes in the given blueprints, each group is sorted in the env `header` order.
+    """
+
+    positions = {id(blueprint): index for index, blueprint in enumerate(blueprints)}
+
+    groups = []
+    linkGraphs = []
+    for index, blueprint in enumerate(blueprints):
+        linkGraph = blueprint._linkGraph
+        if linkGraph is None:
+            groups.append([index])
+            continue
+
+        if any(linkGraph is each for each in linkGraphs):
+            continue
+        linkGraphs.append(linkGraph)
+
+        for group in linkGraph.getGroups():
+            group = [positions[id(linkGraph.blueprints[each])] for each in group if id(linkGraph.blueprints[each]) in positions]
+            if group:
+                groups.append(group)
+
+    return groups
@@ -0,0 +1,404 @@
+import sys
+import logging
+import itertools
+import traceback
+
+import six
+
+from Athena import AtCore
+from Athena import AtUtils
+from Athena import AtConstants
+
+LOGGER = logging.getLogger(AtConstants.PROGRAM_NAME)
+
+
+class BatchExecutor(object):
+    """Run the batch enabled blueprints of an env without ui, running independent blueprints concurrently.
+
+    Blueprints connected by links can trigger each other so they are grouped and each group is run serially, the
+    exact same way a serial batch would run them: all checks first, then the fix and a new check of each blueprint
+    that found errors. Groups that are not connected are independent and are dispatched to a pool of threads or
+    processes. Whatever the order the groups finish in, the result is sorted in the env `header` order.
+    With a single worker, the groups are not used: all the checks of the env are run first and then all the fixes.
+
+    The concurrency is read from the env `parameters` (`workers` and `executor`) and can be overridden at init.
+    """
+
+    def __init__(self, context, env, workers=None, executor=None, register=None, resultCache=None, progress=None, verbose=False):
+        """Get the blueprints of the given env and the concurrency to use.
+
+        Parameters
+        -----------
+        context: str
+            The context containing the env to run.
+        env: str
+            The env to run.
+        workers: int, optional
+            Number of blueprints groups to run at the same time, 1 run them serially. If None, use the `workers` value
+            of the env parameters. (default: `AtConstants.BATCH_WORKERS`)
+        executor: str, optional
+            'thread' to run the groups in threads, for processes that mostly wait for IO, or 'process' to run them in
+            processes. If None, use the `executor` value of the env parameters. (default: 'thread')
+        register: AtCore.Register, optional
+            The register to get the blueprints from, a new one is created if None.
+        resultCache: AtCache.ResultCache, optional
+            Persistent cache used by the blueprints to reuse their checks feedback, only used if `register` is None.
+        progress: AtProgress.ProgressSink or callable, optional
+            Sink the progress of all the blueprints is sent to, it is not used by the 'process' executor with more than
+            one worker. (a warning is logged)
+        verbose: bool
+            Define if the executor should log informations about its process. (default: False)
+        """
+
+        self.context = context
+        self.env = env
+        self.verbose = verbose
+
+        self._register = register if register is not None else AtCore.Register(verbose=verbose, resultCache=resultCache)
+        self._blueprints = self._register.getBlueprints(context, env)
+
+        parameters = self._register.getData('parameters') or {}
+        self.workers = max(1, int(workers if workers is not None else parameters.get('workers', AtConstants.BATCH_WORKERS)))
+        self.executor = executor if executor is not None else parameters.get('executor', AtConstants.BATCH_EXECUTORS[0])
+
+        if self.executor not in AtConstants.BATCH_EXECUTORS:
+            raise ValueError('Unknown executor "{0}", should be one of {1}'.format(self.executor, AtConstants.BATCH_EXECUTORS))
+
+        if progress is not None:
+            # The worker processes build their own blueprints, their progress can't be sent to the sink.
+            if self.executor == 'process' and self.workers > 1:
+                LOGGER.warning('The progress sink is not used by the blueprints run in worker processes.')
+
+            for blueprint in self._blueprints:
+                blueprint.progress.addSink(progress)
+
+    def __repr__(self):
+        """Return the representation of the BatchExecutor"""
+
+        return "<{0} {1}.{2} - {3} {4}(s)>".format(self.__class__.__name__, self.context, self.env, self.workers, self.executor)
+
+    @property
+    def blueprints(self):
+        """Get the blueprints of the env"""
+        return self._blueprints
+
+    def getGroups(self):
+        """Get the indexes of the blueprints to run, grouped by links.
+
+        Returns
+        --------
+        list
+            List of list of blueprints indexes, sorted in the env `header` order.
+        """
+
+        return getGroups(self._register.linkGraph)
+
+    def run(self):
+        """Run all groups and return the feedback of the blueprints that still have errors after their fix.
+
+        Returns
+        --------
+        list
+            List of tuple containing the blueprint name and its feedback, in the env `header` order.
+        """
+
+        groups = self.getGroups()
+
+        if self.workers == 1 or len(groups) < 2:
+            # Run serially, all the checks come first and then the fixes, like a batch that does not use groups.
+            indexes = sorted(index for group in groups for index in group)
+            results = [runGroup(self._blueprints, indexes, verbose=self.verbose)]
+
+        elif self.executor == 'thread':
+            from multiprocessing.pool import ThreadPool  # Only imported when needed, it is slow to import.
+
+            pool = ThreadPool(min(self.workers, len(groups)))
+            try:
+                results = pool.map(lambda group: runGroup(self._blueprints, group, verbose=self.verbose), groups)
+            finally:
+                pool.close()
+                pool.join()
+
+        else:
+            import multiprocessing  # Only imported when needed, it is slow to import.
+
+            # The blueprints can't be sent to another process, each worker build its own from the packages imported here.
+            packages = [packageData['import'] for packageData in AtUtils.getPackages().values()]
+            pool = multiprocessing.Pool(
+                min(self.workers, len(groups)),
+                initializer=_initWorker,
+                initargs=(packages, self.context, self.env, self._register.resultCache, self.verbose)
+            )
+            try:
+                results = pool.map(_runWorkerGroup, groups)
+            finally:
+                pool.close()
+                pool.join()
+
+        errors = sorted((error for groupResult in results for error in groupResult), key=lambda error: error[0])
+
+        return [(self._blueprints[index].name, result) for index, result in errors]
+
+    def reset(self):
+        """Reset the state of all blueprints processes, to run them again on other data."""
+
+        for blueprint in self._blueprints:
+            blueprint.reset()
+
+
+def getGroups(linkGraph):
+    """Group the batch enabled blueprints that are connected by links.
+
+    Parameters
+    -----------
+    linkGraph: AtCore.LinkGraph
+        The compiled links of the env blueprints.
+
+    Returns
+    --------
+    list
+        List of list of blueprints indexes. Each group and the groups are sorted in the env `header` order.
+    """
+
+    groups = []
+    for group in linkGraph.getGroups():
+        group = [index for index in group if isBatchable(linkGraph.blueprints[index])]
+        if group:
+            groups.append(group)
+
+    return groups
+
+
+def isBatchable(blueprint):
+    """Get if the given blueprint have to be run in batch."""
+    return blueprint._isCheckable and not blueprint._isNonBlocking and blueprint._inBatch
+
+
+def runGroup(blueprints, indexes, verbose=False, token=None):
+    """Run the check of the given blueprints, then fix and check again those that found errors.
+
+    Parameters
+    -----------
+    blueprints: list
+        The blueprints of an env, in the env `header` order.
+    indexes: list
+        Indexes of the blueprints to run, in the env `header` order.
+    verbose: bool
+        Define if the function should log the errors raised by the blueprints. (default: False)
+    token: AtCore.CancellationToken, optional
+        If this token is cancelled, the blueprints left are not run.
+
+    Returns
+    --------
+    list
+        List of tuple containing the blueprint index and its feedback for each blueprint that still have errors or
+        that exceeded its timeout. (see `getTimeoutFeedback`)
+
+    Notes
+    -----
+    The timeout of a process is only detected when it poll its token (`Process.poll` or `Process.setProgressValue`),
+    a process that never poll it run until it return.
+    """
+
+    toFix = []
+    errors = []
+    for index in indexes:
+        if token is not None and token.isCancelled:
+            return errors
+
+        try:
+            result, state = blueprints[index].check()
+            if state:
+                toFix.append(index)
+
+        except AtCore.ProcessTimeout as exception:
+            addTimeout(errors, blueprints, index, exception)
+
+        except Exception:
+            if verbose:
+                LOGGER.exception('Check of "{0}" failed'.format(blueprints[index].name))
+
+    for index in toFix:
+        if token is not None and token.isCancelled:
+            return errors
+
+        try:
+            blueprints[index].fix()
+            result, state = blueprints[index].check()
+
+            if state:
+                errors.append((index, result))
+
+        except AtCore.ProcessTimeout as exception:
+            addTimeout(errors, blueprints, index, exception)
+
+        except Exception:
+            if verbose:
+                LOGGER.exception('Fix of "{0}" failed'.format(blueprints[index].name))
+
+    return errors
+
+
+def addTimeout(errors, blueprints, index, exception):
+    """Add the timeout feedback to the errors of `runGroup`, for the blueprint that exceeded its timeout.
+
+    The exception can come from a blueprint run by the links of the blueprint at the given index, the timeout is
+    reported for the blueprint carried by the exception, only once.
+
+    Parameters
+    -----------
+    errors: list
+        The list of tuple containing the blueprint index and its feedback to add the timeout to.
+    blueprints: list
+        The blueprints of an env, in the env `header` order.
+    index: int
+        The index of the blueprint that was run.
+    exception: AtCore.ProcessTimeout
+        The exception raised by the process.
+    """
+
+    for blueprintIndex, blueprint in enumerate(blueprints):
+        if blueprint is exception.blueprint:
+            index = blueprintIndex
+            break
+
+    if all(errorIndex != index for errorIndex, _ in errors):
+        errors.append((index, getTimeoutFeedback(exception)))
+
+
+def getTimeoutFeedback(exception):
+    """Get the feedback reported for a blueprint that exceeded its timeout.
+
+    Parameters
+    -----------
+    exception: AtCore.ProcessTimeout
+        The exception raised by the process.
+
+    Returns
+    --------
+    list
+        A feedback, like those returned by `AtCore.Blueprint.check`, with a `Timeout` title.
+    """
+
+    return [{'title': AtConstants.TIMEOUT, 'toDisplay': [str(exception)], 'toSelect': [], 'documentation': None}]
+
+
+def batchFiles(context, env, paths, openFile, workers=None, chunksize=1, resultCache=None, verbose=False):
+    """Run the blueprints of an env on each of the given files, in a pool of worker processes.
+
+    Each worker build the Register and the blueprints once and then validate many files: for each file, the `openFile`
+    hook is called with the file path, the blueprints processes are reset and the blueprints are run serially. The
+    results are streamed back as soon as they are available, in the order of the given paths.
+    The paths are read by slices of `AtConstants.BATCH_FILES_SLICES` chunks per worker, a generator of paths is never
+    read entirely up front.
+
+    Parameters
+    -----------
+    context: str
+        The context containing the env to run.
+    env: str
+        The env to run.
+    paths: iterable
+        The paths of the files to validate, it can be a generator.
+    openFile: callable or str
+        The function that open a file from its path, it have to be picklable (a module level function) or be the
+        python import string of the function. (e.g. 'my_package.utils.openFile')
+    workers: int, optional
+        Number of worker processes, if None the number of cpu is used.
+    chunksize: int
+        Number of files sent at once to a worker, increase it for a lot of small files. (default: 1)
+    resultCache: AtCache.ResultCache, optional
+        Persistent cache used by the blueprints to reuse their checks feedback.
+    verbose: bool
+        Define if the workers should log informations about their process. (default: False)
+
+    Yields
+    -------
+    tuple
+        The file path, the list of blueprints that still have errors (as returned by `BatchExecutor.run`) and the
+        traceback of the exception raised while validating the file or None.
+    """
+
+    import multiprocessing  # Only imported when needed, it is slow to import.
+
+    workers = workers or multiprocessing.cpu_count()
+
+    packages = [packageData['import'] for packageData in AtUtils.getPackages().values()]
+    pool = multiprocessing.Pool(
+        workers,
+        initializer=_initFileWorker,
+        initargs=(packages, context, env, openFile, resultCache, verbose)
+    )
+    try:
+        # The pool read the whole iterable given to `imap` at once, the paths are given by bounded slices instead.
+        paths = iter(paths)
+        sliceSize = workers * chunksize * AtConstants.BATCH_FILES_SLICES
+        while True:
+            pathsSlice = list(itertools.islice(paths, sliceSize))
+            if not pathsSlice:
+                break
+
+            for result in pool.imap(_runWorkerFile, pathsSlice, chunksize):
+                yield result
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def getCallable(callableOrStr):
+    """Get a callable from itself or its python import string. (e.g. 'my_package.utils.openFile')"""
+
+    if not isinstance(callableOrStr, six.string_types):
+        return callableOrStr
+
+    moduleStr, _, name = callableOrStr.rpartition('.')
+    return getattr(AtUtils.importFromStr(moduleStr), name)
+
+
+# Blueprints of the env run by a worker process, built once by `_initWorker`.
+_WORKER_BLUEPRINTS = None
+_WORKER_VERBOSE = False
+
+def _initWorker(packages, context, env, resultCache, verbose):
+    """Import the Athena packages and build the blueprints of the env in a worker process."""
+
+    global _WORKER_BLUEPRINTS, _WORKER_VERBOSE
+
+    for package in packages:
+        if package not in sys.modules:
+            AtUtils.importFromStr(package, verbose=verbose)
+
+    _WORKER_BLUEPRINTS = AtCore.Register(verbose=verbose, resultCache=resultCache).getBlueprints(context, env)
+    _WORKER_VERBOSE = verbose
+
+def _runWorkerGroup(indexes):
+    """Run a group of blueprints in a worker process, the feedback must be picklable to be sent back."""
+
+    return runGroup(_WORKER_BLUEPRINTS, indexes, verbose=_WORKER_VERBOSE)
+
+
+# Executor and hook of a worker process running `batchFiles`, built once by `_initFileWorker`.
+_WORKER_EXECUTOR = None
+_WORKER_OPEN_FILE = None
+
+def _initFileWorker(packages, context, env, openFile, resultCache, verbose):
+    """Import the Athena packages and build the executor of the env in a worker process."""
+
+    global _WORKER_EXECUTOR, _WORKER_OPEN_FILE
+
+    for package in packages:
+        if package not in sys.modules:
+            AtUtils.importFromStr(package, verbose=verbose)
+
+    _WORKER_EXECUTOR = BatchExecutor(context, env, workers=1, resultCache=resultCache, verbose=verbose)
+    _WORKER_OPEN_FILE = getCallable(openFile)
+
+def _runWorkerFile(path):
+    """Open a file and run the blueprints on it in a worker process, the feedback must be picklable to be sent back."""
+
+    _WORKER_EXECUTOR.reset()
+    try:
+        _WORKER_OPEN_FILE(path)
+        return path, _WORKER_EXECUTOR.run(), None
+    except Exception:
+        return path, [], traceback.format_exc()
@@ -0,0 +1,257 @@
+import os
+import json
+import time
+import hashlib
+import sqlite3
+import logging
+import threading
+
+from Athena import AtUtils
+from Athena import AtConstants
+
+LOGGER = logging.getLogger(AtConstants.PROGRAM_NAME)
+
+
+class ResultCache(object):
+    """Persistent cache of the checks feedback, stored in a local sqlite database.
+
+    A feedback is stored for a check of a process in an env with the hash of the process module source, the check
+    arguments and the process fingerprint. (see `AtCore.Process.fingerprint`) As long as none of them changed, the
+    feedback can be reused, even from another session. Validating the same assets again then only cost their
+    fingerprint, that should be a hash of the asset content. (see `AtUtils.getFileHash`)
+
+    Only the checks of processes that implement a fingerprint are cached and their feedback have to be serializable.
+    When the cache is full, the least recently used results are removed.
+    """
+
+    def __init__(self, path=None, maxEntries=AtConstants.RESULT_CACHE_SIZE):
+        """Open the cache database, it is created if it does not exists.
+
+        Parameters
+        -----------
+        path: str, optional
+            Path to the database file. (default: `AtConstants.CACHE_DIRECTORY`/`AtConstants.RESULT_CACHE`)
+        maxEntries: int
+            Maximum number of results to keep. (default: `AtConstants.RESULT_CACHE_SIZE`)
+        """
+
+        self.path = path or os.path.join(AtConstants.CACHE_DIRECTORY, AtConstants.RESULT_CACHE)
+        self.maxEntries = maxEntries
+
+        self._lock = threading.Lock()
+        self._sourceHashes = {}
+
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        # The connection is shared between the threads of the batch, accesses are serialized with the lock.
+        self._connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS results ('
+                'key TEXT PRIMARY KEY, context TEXT, env TEXT, process TEXT, feedback TEXT, accessed REAL)'
+            )
+            self._connection.execute('CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)')
+
+    def __repr__(self):
+        """Return the representation of the cache"""
+
+        return "<{0} '{1}' - {2} result(s)>".format(self.__class__.__name__, self.path, len(self))
+
+    def __len__(self):
+        """Get the number of results in the cache"""
+
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+    def __getstate__(self):
+        """Only send the path and the size to other processes, the connection is opened again by `__setstate__`."""
+        return {'path': self.path, 'maxEntries': self.maxEntries}
+
+    def __setstate__(self, state):
+        """Open the cache in another process from the state returned by `__getstate__`."""
+        self.__init__(**state)
+
+    def getKey(self, context, env, processStr, arguments, fingerprint):
+        """Get the key of a check result.
+
+        Parameters
+        -----------
+        context: str
+            The context of the env.
+        env: str
+            The env containing the blueprint.
+        processStr: str
+            The python import string of the process class.
+        arguments: tuple
+            The args and kwargs of the check.
+        fingerprint: object
+            The fingerprint of the process, its `repr` is used so it must be the same from one session to another.
+
+        Returns
+        --------
+        str or NoneType
+            The key of the result or None if the process module source can't be found.
+        """
+
+        sourceHash = self.getSourceHash(processStr.rpartition('.')[0])
+        if sourceHash is None:
+            return None
+
+        data = repr((context, env, processStr, sourceHash, arguments, fingerprint))
+        return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+    def getSourceHash(self, moduleStr):
+        """Get the hash of the source of the given module, it is computed again only when the file is modified.
+
+        Parameters
+        -----------
+        moduleStr: str
+            The python import string of the module.
+
+        Returns
+        --------
+        str or NoneType
+            The hash of the module source or None if it can't be found.
+        """
+
+        path = AtUtils.getModulePath(moduleStr)
+        if path is None:
+            return None
+
+        try:
+            modificationTime = os.path.getmtime(path)
+        except (IOError, OSError):
+            return None
+
+        cached = self._sourceHashes.get(path, None)
+        if cached is not None and cached[0] == modificationTime:
+            return cached[1]
+
+        sourceHash = AtUtils.getFileHash(path)
+        self._sourceHashes[path] = (modificationTime, sourceHash)
+
+        return sourceHash
+
+    def get(self, key):
+        """Get the feedback stored for the given key.
+
+        Parameters
+        -----------
+        key: str
+            The key of the result, from `getKey`.
+
+        Returns
+        --------
+        list or NoneType
+            The feedback of the check or None if it is not in the cache, or if the database can't be read.
+        """
+
+        # A locked or corrupted database must not fail the check, it is only a cache miss.
+        try:
+            with self._lock, self._connection:
+                row = self._connection.execute('SELECT feedback FROM results WHERE key = ?', (key,)).fetchone()
+                if row is None:
+                    return None
+
+                self._connection.execute('UPDATE results SET accessed = ? WHERE key = ?', (time.time(), key))
+
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError) as exception:
+            LOGGER.warning('Unable to read the result cache "{0}": {1}'.format(self.path, exception))
+            return None
+
+    def set(self, key, feedback, context=None, env=None, processStr=None):
+        """Store the feedback of a check, removing the least recently used results if the cache is full.
+
+        Parameters
+        -----------
+        key: str
+            The key of the result, from `getKey`.
+        feedback: list
+            The filtered feedback of the check.
+        context: str, optional
+            The context of the env, used by `invalidate`.
+        env: str, optional
+            The env containing the blueprint, used by `invalidate`.
+        processStr: str, optional
+            The python import string of the process class, used by `invalidate`.
+
+        Returns
+        --------
+        bool
+            True if the feedback have been stored, False if it can't be serialized or the database can't be written.
+        """
+
+        try:
+            data = json.dumps(feedback, separators=(',', ':'), default=toSerializable)
+        except (TypeError, ValueError):
+            return False
+
+        # The result is simply not cached if the database is locked or corrupted, the check itself succeeded.
+        try:
+            with self._lock, self._connection:
+                self._connection.execute(
+                    'INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)',
+                    (key, context, env, processStr, data, time.time())
+                )
+
+                excess = self._connection.execute('SELECT COUNT(*) FROM results').fetchone()[0] - self.maxEntries
+                if excess > 0:
+                    self._connection.execute(
+                        'DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY accessed LIMIT ?)', (excess,)
+                    )
+        except sqlite3.Error as exception:
+            LOGGER.warning('Unable to write the result cache "{0}": {1}'.format(self.path, exception))
+            return False
+
+        return True
+
+    def invalidate(self, context=None, env=None, processStr=None):
+        """Remove the results matching all the given filters, all results are removed if no filter is given.
+
+        Parameters
+        -----------
+        context: str, optional
+            Only remove the results of this context.
+        env: str, optional
+            Only remove the results of this env.
+        processStr: str, optional
+            Only remove the results of this process.
+
+        Returns
+        --------
+        int
+            Number of results removed.
+        """
+
+        filters = [(column, value) for column, value in (('context', context), ('env', env), ('process', processStr)) if value is not None]
+
+        query = 'DELETE FROM results'
+        if filters:
+            query += ' WHERE ' + ' AND '.join('{0} = ?'.format(column) for column, _ in filters)
+
+        with self._lock, self._connection:
+            return self._connection.execute(query, [value for _, value in filters]).rowcount
+
+    def clear(self):
+        """Remove all results from the cache."""
+
+        self.invalidate()
+
+    def close(self):
+        """Close the connection to the database."""
+
+        with self._lock:
+            self._connection.close()
+
+
+def toSerializable(value):
+    """Convert the objects that json can't serialize by itself, like the compact `AtCore.Feedback`."""
+
+    toDict = getattr(value, 'toDict', None)
+    if toDict is None:
+        raise TypeError('{0!r} is not JSON serializable'.format(value))
+
+    return toDict()
@@ -1,3 +1,5 @@
+import os
+
 PROGRAM_NAME = 'Athena'
 
 VERSION = '1.0.0-beta'
@@ -16,6 +18,40 @@ ENV_TEMPLATE = '{package}.{athenaPackage}.{software}.envs'
 
 PROGRESSBAR_FORMAT = '  %p% - {0}'
 
+PROGRESS_INTERVAL = 0.05
+
+PROGRESS_DELTA = 1.0
+
+CACHE_DIRECTORY = os.environ.get('ATHENA_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.{0}'.format(PROGRAM_NAME.lower())))
+
+DISCOVERY_MANIFEST = 'discovery.json'
+
+MANIFEST_VERSION = 1
+
+COMPILED_ENV_EXTENSION = '.atenv'
+
+RESULT_CACHE = 'results.sqlite'
+
+RESULT_CACHE_SIZE = 10000
+
+PREFETCH_WORKERS = 8
+
+BATCH_WORKERS = 1
+
+UI_WORKERS = 1
+
+WIDGET_RELEASE_DISTANCE = 3
+
+BATCH_EXECUTORS = ('thread', 'process')
+
+BATCH_FILES_SLICES = 4
+
+TIMEOUT = 'Timeout'
+
+FEEDBACK_CHUNK_SIZE = 1000
+
+FEEDBACK_MAX_ROWS = 20
+
 PROCESS_TEMPLATE = \
 '''
 from Athena import AtCore
@@ -59,6 +95,7 @@ class {ProcessName}(AtCore.Process):
 
 BLUEPRINT_TEMPLATE = {
 	'process': '', 
+	'category': '',
 	'arguments': {'': ([], {})},
 	'tags': [[]], 
 	'links': [[]],
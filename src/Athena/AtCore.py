@@ -1,10 +1,17 @@
+import os
 import re
-import numbers
+import ast
+import types
+import array
+import itertools
+import threading
 import six
 
 from pprint import pprint
 
 from Athena import AtUtils
+from Athena import AtManifest
+from Athena import AtProgress
 from Athena import AtConstants
 
 
@@ -28,13 +35,17 @@ class Process(object):
         if cls is Process:
             raise NotImplementedError('Can not instantiate abstract class')
 
-        # Create the instance
-        instance = super(Process, cls).__new__(cls, *args, **kwargs)
+        # Create the instance, `object.__new__` does not accept the `__init__` arguments.
+        instance = super(Process, cls).__new__(cls)
 
         # Private instance attributes (Used for internal management)
         instance._name = instance.__class__.__name__
         instance._feedback = []
-        instance._progressbar = None
+        instance._nodeTable = NodeTable()
+        instance._progress = None
+        instance._token = None
+        instance._maxErrors = None
+        instance._errorCount = 0
 
         # Public instance attribute (To be used by user to manage process data)
         instance.toCheck = []
@@ -63,6 +74,21 @@ class Process(object):
     def tool(self):
         raise NotImplementedError
 
+    def fingerprint(self, *args, **kwargs):
+        """Get a digest of everything the check depends on, to skip the check if nothing changed since the last one.
+
+        Override this method to return any hashable object that change when the data the check look at change (e.g.
+        the modification time of the files to check or a scene dirty counter), it have to be a lot faster than the
+        check itself. It receive the same arguments than the check.
+
+        Returns
+        --------
+        object or NoneType
+            The digest of the check inputs, or None to always run the check. (default)
+        """
+
+        return None
+
     @property
     def name(self):
         """Return the process name, default name is class name"""
@@ -73,28 +99,103 @@ class Process(object):
         """Define the process name """
         self._name = str(value)
 
+    @property
+    def token(self):
+        """Get the CancellationToken of the running method, None if the process is not run through a Blueprint"""
+        return self._token
+
+    @property
+    def maxErrors(self):
+        """Get the maximum number of objects the feedback of the check can contain, None if there is no limit"""
+        return self._maxErrors
+
+    @property
+    def errorsLeft(self):
+        """Get the number of objects that can still be added to the feedback, None if there is no limit"""
+
+        if self._maxErrors is None:
+            return None
+        return max(0, self._maxErrors - self._errorCount)
+
+    @property
+    def isBudgetReached(self):
+        """Get if the feedback already contain the maximum number of objects, the check can stop looking for errors"""
+        return self._maxErrors is not None and self._errorCount >= self._maxErrors
+
+    def poll(self):
+        """Stop the process if it have been cancelled or if it exceeded its timeout.
+
+        Call this method regularly in long loops, it is already called by `setProgressValue`.
+
+        Raises
+        -------
+        ProcessCancelled
+            The execution of the process have been cancelled.
+        ProcessTimeout
+            The execution of the process exceeded its `timeout` option.
+        """
+
+        if self._token is not None:
+            self._token.poll()
+
     def setProgressValue(self, value, text=None):
-        """Set the progress value of the process progressBar if exist.
-        
+        """Set the progress value of the process, it is sent to the progressBar and the other sinks if it changed enough.
+
+        This is also where the process is stopped if it have been cancelled or if it exceeded its timeout.
+        It is cheap enough to be called for each object checked, the values are rate limited by the blueprint
+        `AtProgress.ProgressReporter`.
+
         Parameters
         -----------
         value: numbres.Number
-            The value to set the progress to.
+            The value to set the progress to, in percent.
         text: str or None
-            Text to display in the progressBar, if None, the Default is used.
+            Text to display in the progressBar, if None, the last one is kept.
         """
 
-        if self._progressbar is None:
-            return
+        self.poll()
 
-        assert isinstance(value, numbers.Number), 'Argument `value` is not numeric'
-        
-        self._progressbar.setValue(float(value))
-        
-        if text and text != self._progressbar.text():
-            self._progressbar.setFormat(AtConstants.PROGRESSBAR_FORMAT.format(text))
+        if self._progress is not None:
+            self._progress.update(value, text)
+
+    def progress(self, iterable, text=None, total=None, start=0.0, stop=100.0):
+        """Iterate over the given iterable and set the progress value for each item, from `start` to `stop`.
+
+        Parameters
+        -----------
+        iterable: <iterable>
+            The objects to iterate over.
+        text: str or None
+            Text to display in the progressBar, if None, the last one is kept.
+        total: int or None
+            The number of items of the iterable, if None `len` is used. If the iterable does not have a length, the
+            progress is only set to `stop` at the end.
+        start: float
+            The progress value of the first item. (default: 0)
+        stop: float
+            The progress value once all items are read. (default: 100)
+
+        Yields
+        -------
+        object
+            The items of the iterable.
+        """
+
+        if total is None:
+            total = len(iterable) if hasattr(iterable, '__len__') else 0
+
+        step = (stop - start) / float(total) if total else 0.0
+        setProgressValue = self.setProgressValue
+
+        value = start
+        for item in iterable:
+            setProgressValue(value, text)
+            yield item
+            value += step
+
+        setProgressValue(stop, text)
 
-    def addFeedback(self, title, toDisplay, toSelect=None, documentation=None):
+    def addFeedback(self, title, toDisplay, toSelect=None, documentation=None, found=None):
         """Add a new feedback for the process to display
 
         Parameters
@@ -105,45 +206,760 @@ class Process(object):
             Iterable object containing all objects found for this title, these objetcs will be displayed
             and used for selection if `toSelect` is None.
             If toDisplay is Ellipsis, this feedback can be used to only display a title.
+            If toDisplay is an iterator (e.g. a generator), the objects are only retrieved when the feedback is read.
+            (see `FeedbackStream`)
         toSelect: <iterable> or None
             If an iterable is provided it should be ordered like the `toDisplay` iterable to match display
             and selection. If set to None, the objects used for selection will be thoses used for display.
         documentation: str or None
             This allow to affect a documentation for this feedback.
+        found: int or None
+            The number of objects found for this title if the check stopped before giving all of them, the feedback
+            is then marked as truncated.
+
+        Notes
+        -----
+        If the blueprint have a `maxErrors` option, only the objects that fit in what is left of it are kept and the
+        feedback is marked as truncated. The objects of a stream are not counted, it is only read up to the number
+        of errors left when it is added.
+
+        Returns
+        --------
+        bool
+            True if the maximum number of errors is reached, the check can stop looking for errors.
         """
 
         assert title, 'A title is required to add a new feedback'
 
-        if not toDisplay:
-            return
+        if not toDisplay and not found:
+            return self.isBudgetReached
 
         # If toDisplay is not None check if it is necessary to conform it. Else, add None to the value to handle a no display.
         if toDisplay is not Ellipsis:
 
-            # Check if toDisplay is conform, if it is not a list or a tuple, cast it to tuple.
-            if not hasattr(toDisplay, '__iter__'):
-                toDisplay = (toDisplay,)
+            # Iterators can't be measured without consuming them, they are read on demand through a stream.
+            if isIterator(toDisplay) or isIterator(toSelect):
+                toDisplay = FeedbackStream(toDisplay, toSelect, limit=self.errorsLeft)
+                toSelect = toDisplay.selection
+
+            else:
+                # Check if toDisplay is conform, if it is not a list or a tuple, cast it to tuple.
+                if not hasattr(toDisplay, '__iter__'):
+                    toDisplay = (toDisplay,)
+
+                # Check toSelect, if it have not been given, set it to be equal to toDisplay, if it is not a list or a tuple cast it to tuple.
+                if toSelect is None:
+                    toSelect = toDisplay
+                elif not hasattr(toSelect, '__iter__'):
+                    toSelect = (toSelect,)
+
+                # Check if there is the same amount of object toDisplay and toSelect.
+                if len(toSelect) != len(toDisplay):
+                    toSelect = toDisplay
+
+                # Only keep the objects that fit in the errors left, the others are only counted.
+                found = max(found or 0, len(toDisplay))
+                errorsLeft = self.errorsLeft
+                if errorsLeft is not None and len(toDisplay) > errorsLeft:
+                    isSame = toSelect is toDisplay
+                    toDisplay = list(itertools.islice(toDisplay, errorsLeft))
+                    toSelect = toDisplay if isSame else list(itertools.islice(toSelect, errorsLeft))
+
+                self._errorCount += len(toDisplay)
+
+        # Streams are read on demand, they are stored as is. Other feedback are compacted in the process node table.
+        if isinstance(toDisplay, FeedbackStream):
+            self._feedback.append({
+                'title': title,
+                'toDisplay': toDisplay,
+                'toSelect': toSelect,
+                'documentation': documentation
+            })
+        else:
+            self._feedback.append(Feedback(title, toDisplay, toSelect, documentation, found=found, nodeTable=self._nodeTable))
+
+        return self.isBudgetReached
+
+    def collectFeedback(self, feedback):
+        """Add the feedback yielded by a check written as a generator.
+
+        Each item yielded is a tuple with the title and the object to display, and optionally the object to select.
+        The objects are grouped by title, in the order the titles are first yielded, and are added to the compact
+        Feedback of their title as they are yielded. If the blueprint have a `maxErrors` option, the iterable is closed
+        as soon as one more error is yielded and its feedback is truncated.
+
+        Parameters
+        -----------
+        feedback: <iterable>
+            Iterable of tuple(title, toDisplay) or tuple(title, toDisplay, toSelect).
+        """
+
+        byTitle = {}
+        for item in feedback:
+            self.poll()
+
+            title = item[0]
 
-            # Check toSelect, if it have not been given, set it to be equal to toDisplay, if it is not a list or a tuple cast it to tuple.
-            if toSelect is None:
-                toSelect = toDisplay
-            elif not hasattr(toSelect, '__iter__'):
-                toSelect = (toSelect,)
+            # The feedback is created with the first object of its title, the check usually clear its feedback after
+            # it started so it can't be created before.
+            titleFeedback = byTitle.get(title, None)
+            if titleFeedback is None:
+                titleFeedback = byTitle[title] = Feedback(title, (), nodeTable=self._nodeTable)
+                self._feedback.append(titleFeedback)
 
-            # Check if there is the same amount of object toDisplay and toSelect.
-            if len(toSelect) != len(toDisplay):
-                toSelect = toDisplay
+            # The budget is reached, the check does not have to look for more errors.
+            if self.isBudgetReached:
+                titleFeedback.found = titleFeedback.count + 1
+                if hasattr(feedback, 'close'):
+                    feedback.close()
+                break
 
-        self._feedback.append({
-            'title': title,
-            'toDisplay': toDisplay,
-            'toSelect': toSelect,
-            'documentation': documentation
-        })
+            titleFeedback.append(item[1], item[2] if len(item) > 2 else None)
+            self._errorCount += 1
 
     def clearFeedback(self):
         """Clear all feedback for this process"""
         self._feedback = []
+        self._nodeTable = NodeTable()
+        self._errorCount = 0
+
+
+def isIterator(value):
+    """Get if the given value is an iterator, that can only be read once. (e.g. a generator)"""
+    return value is not None and value is not Ellipsis and hasattr(value, '__iter__') and iter(value) is value
+
+
+def getFoundCount(feedback):
+    """Get the number of objects found for the given feedback as a string, ending with `+` if it is a minimum.
+
+    A feedback is a minimum if it is truncated by the `maxErrors` option or if it is a stream not entirely read.
+
+    Parameters
+    -----------
+    feedback: Feedback or dict
+        A feedback of a check result.
+
+    Returns
+    --------
+    str
+        The number of objects found. (e.g. '12' or '500+')
+    """
+
+    toDisplay = feedback['toDisplay']
+    if isinstance(toDisplay, FeedbackStream):
+        return '{0}{1}'.format(toDisplay.found, '+' if toDisplay.isTruncated or not toDisplay.isExhausted else '')
+
+    count = len(toDisplay) if toDisplay and toDisplay is not Ellipsis else 0
+    found = max(count, feedback.get('found', None) or 0) if isinstance(feedback, dict) else feedback.found
+
+    return '{0}{1}'.format(found, '+' if found > count else '')
+
+
+def isTruncated(feedback):
+    """Get if the given feedback only contain the first objects found, because of the `maxErrors` option."""
+
+    toDisplay = feedback['toDisplay']
+    if isinstance(toDisplay, FeedbackStream):
+        return toDisplay.isTruncated
+
+    return getFoundCount(feedback).endswith('+')
+
+
+class FeedbackStream(object):
+    """Objects of a feedback retrieved from an iterator only when they are read.
+
+    A check that find a lot of errors can give a generator to `Process.addFeedback` instead of building the lists of
+    objects to display and select. The objects are read by chunks when a consumer need them (e.g. the ui display the
+    first chunk and the next ones on demand) and kept so the stream can be read again.
+    Iterating the stream give the objects to display and iterating its `selection` the objects to select, the number
+    of objects is only known once the stream have been read entirely.
+    """
+
+    def __init__(self, toDisplay, toSelect=None, limit=None):
+        """Create the stream from the iterables of objects to display and to select.
+
+        Parameters
+        -----------
+        toDisplay: <iterable>
+            The objects to display.
+        toSelect: <iterable> or NoneType
+            The objects to select, in the same order than `toDisplay`. If None, the displayed objects are selected.
+        limit: int or NoneType
+            The maximum number of objects to read, the stream is truncated if the iterator contain more objects.
+        """
+
+        self._iterator = iter(toDisplay) if toSelect is None else six.moves.zip(toDisplay, toSelect)
+        self._isPaired = toSelect is not None
+        self._limit = limit
+        self._isTruncated = False
+
+        self._displays = []
+        self._selections = [] if self._isPaired else self._displays
+
+    def __repr__(self):
+        """Return the representation of the stream"""
+
+        return '<{0} {1}{2} object(s)>'.format(self.__class__.__name__, self.count, '' if self.isExhausted and not self._isTruncated else '+')
+
+    def __iter__(self):
+        """Iterate over the objects to display, reading the stream when needed"""
+        return self._iterate(self._displays)
+
+    def __bool__(self):
+        """Get if the stream contain any object, read the first one if needed"""
+
+        if not self._displays:
+            self.read(1)
+        return bool(self._displays)
+
+    __nonzero__ = __bool__
+
+    def __getstate__(self):
+        """Read the whole stream to send it to another process, an iterator can't be pickled."""
+
+        self.readAll()
+        return {
+            '_iterator': None,
+            '_isPaired': self._isPaired,
+            '_limit': self._limit,
+            '_isTruncated': self._isTruncated,
+            '_displays': self._displays,
+            '_selections': self._selections
+        }
+
+    def __setstate__(self, state):
+        """Restore the stream from the state returned by `__getstate__`"""
+
+        self.__dict__.update(state)
+        if not self._isPaired:
+            self._selections = self._displays
+
+    @property
+    def count(self):
+        """Get the number of objects read so far"""
+        return len(self._displays)
+
+    @property
+    def isExhausted(self):
+        """Get if all the objects have been read"""
+        return self._iterator is None
+
+    @property
+    def isTruncated(self):
+        """Get if the stream reached its limit while the iterator still contained objects"""
+        return self._isTruncated
+
+    @property
+    def found(self):
+        """Get the minimum number of objects found, one more than those read if the stream is truncated"""
+        return self.count + 1 if self._isTruncated else self.count
+
+    @property
+    def selection(self):
+        """Get an iterable over the objects to select, reading the stream when needed"""
+        return _FeedbackStreamSelection(self)
+
+    def read(self, size=AtConstants.FEEDBACK_CHUNK_SIZE):
+        """Read the next objects from the iterator.
+
+        Parameters
+        -----------
+        size: int
+            The maximum number of objects to read. (default: `AtConstants.FEEDBACK_CHUNK_SIZE`)
+
+        Returns
+        --------
+        list
+            The objects read as tuple(toDisplay, toSelect), an empty list if the stream is exhausted.
+        """
+
+        if self._iterator is None:
+            return []
+
+        start = len(self._displays)
+        for item in self._iterator:
+            # One more object than the limit exist, the stream is truncated and the iterator released.
+            if self._limit is not None and len(self._displays) >= self._limit:
+                self._isTruncated = True
+                self._iterator = None
+                break
+
+            if self._isPaired:
+                self._displays.append(item[0])
+                self._selections.append(item[1])
+            else:
+                self._displays.append(item)
+
+            if len(self._displays) - start >= size:
+                break
+        else:
+            self._iterator = None
+
+        return self.items(start)
+
+    def readAll(self):
+        """Read all the objects left in the stream."""
+
+        while self.read():
+            pass
+
+    def head(self, size=AtConstants.FEEDBACK_CHUNK_SIZE):
+        """Get the first objects to display, reading them if needed.
+
+        Parameters
+        -----------
+        size: int
+            The number of objects to get. (default: `AtConstants.FEEDBACK_CHUNK_SIZE`)
+
+        Returns
+        --------
+        list
+            The first objects to display, less than `size` if the stream does not contain enough objects.
+        """
+
+        if len(self._displays) < size:
+            self.read(size - len(self._displays))
+        return self._displays[:size]
+
+    def items(self, start=0, stop=None):
+        """Get the objects already read, as tuple(toDisplay, toSelect), without reading the stream.
+
+        Parameters
+        -----------
+        start: int
+            The index of the first object to get.
+        stop: int or NoneType
+            The index after the last object to get, all the objects read are returned if None.
+
+        Returns
+        --------
+        list
+            The objects read in the given range.
+        """
+
+        return list(six.moves.zip(self._displays[start:stop], self._selections[start:stop]))
+
+    def _iterate(self, objects):
+        """Iterate over the given objects list of the stream, reading the next chunk when needed."""
+
+        index = 0
+        while index < len(objects) or self.read():
+            yield objects[index]
+            index += 1
+
+
+class _FeedbackStreamSelection(object):
+    """Iterable over the objects to select of a FeedbackStream, used as `toSelect` of a streamed feedback."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def __iter__(self):
+        return self.stream._iterate(self.stream._selections)
+
+
+class NodeTable(object):
+    """Table of the objects found by the checks of a process, each string is stored once and referred by its index.
+
+    The component strings (e.g. 'pCube1.f[12]') are split in the node part ('pCube1.f') stored in the table and the
+    component index (12) so a mesh with a lot of faces found is stored once. (see `Feedback`)
+    Only the strings are shared, the other objects are stored as they are given even if they compare equal to another
+    one (e.g. `1` and `True`), so the feedback always give back the objects the check found.
+    """
+
+    __slots__ = ('_objects', '_indexes')
+
+    COMPONENT_REGEX = re.compile(r'^(.+)\[(0|[1-9][0-9]*)\]$')
+
+    def __init__(self):
+        self._objects = []
+        self._indexes = {}
+
+    def __len__(self):
+        """Get the number of objects in the table"""
+        return len(self._objects)
+
+    def add(self, value):
+        """Add the given object to the table and get its reference.
+
+        Parameters
+        -----------
+        value: object
+            The object to add, component strings are split in a node and a component index. Only strings are
+            shared with the equal strings already in the table.
+
+        Returns
+        --------
+        tuple
+            The index of the object in the table and the component index, or -1 if the object is not a component.
+        """
+
+        if not isinstance(value, six.string_types):
+            self._objects.append(value)
+            return len(self._objects) - 1, -1
+
+        component = -1
+        match = self.COMPONENT_REGEX.match(value)
+        if match is not None:
+            value, component = match.group(1), int(match.group(2))
+
+        index = self._indexes.get(value, None)
+        if index is None:
+            index = self._indexes[value] = len(self._objects)
+            self._objects.append(value)
+
+        return index, component
+
+    def get(self, index, component=-1):
+        """Get the object from its reference in the table, the component strings are rendered here.
+
+        Parameters
+        -----------
+        index: int
+            The index of the object in the table.
+        component: int
+            The component index or -1 if the object is not a component.
+
+        Returns
+        --------
+        object
+            The object added to the table.
+        """
+
+        value = self._objects[index]
+        if component < 0:
+            return value
+
+        return '{0}[{1}]'.format(value, component)
+
+
+class Feedback(object):
+    """Compact feedback of a check, the objects are stored as references to the process NodeTable.
+
+    A feedback used to be a dict containing lists of objects to display and select, a lot of them being the same long
+    strings. The Feedback store two integer arrays by list instead (the object index in the table and the component
+    index) and only create the objects when they are read. It can be used like the dict it replace, with the `title`,
+    `toDisplay`, `toSelect` and `documentation` keys.
+    """
+
+    __slots__ = ('title', 'documentation', '_found', '_nodeTable', '_toDisplay', '_toSelect')
+
+    KEYS = ('title', 'toDisplay', 'toSelect', 'documentation')
+
+    def __init__(self, title, toDisplay, toSelect=None, documentation=None, found=None, nodeTable=None):
+        """Store the given objects in the node table.
+
+        Parameters
+        -----------
+        title: str
+            The title linked to this feedback.
+        toDisplay: <iterable> or Ellipsis
+            The objects to display, or Ellipsis for a feedback that only display its title.
+        toSelect: <iterable> or NoneType
+            The objects to select, in the same order than `toDisplay`. If None, the displayed objects are selected.
+        documentation: str or NoneType
+            The documentation of this feedback.
+        found: int or NoneType
+            The number of objects found, if more than those given the feedback is truncated.
+        nodeTable: NodeTable, optional
+            The table to store the objects in, to share it between all the feedback of a process.
+        """
+
+        self.title = title
+        self.documentation = documentation
+
+        self._nodeTable = nodeTable if nodeTable is not None else NodeTable()
+        self._toDisplay = None
+        self._toSelect = None
+
+        self['toDisplay'] = toDisplay
+        self['toSelect'] = toSelect if toSelect is not toDisplay else None
+
+        self._found = max(found or 0, self.count)
+
+    def __repr__(self):
+        """Return the representation of the feedback"""
+
+        return "<{0} '{1}' - {2}{3} object(s)>".format(self.__class__.__name__, self.title, self.count, '+' if self.isTruncated else '')
+
+    def __getitem__(self, key):
+        """Get the value of the given key, like the feedback dict."""
+
+        if key == 'title':
+            return self.title
+        elif key == 'documentation':
+            return self.documentation
+        elif key == 'toDisplay':
+            return FeedbackObjects(self._nodeTable, self._toDisplay)
+        elif key == 'toSelect':
+            return FeedbackObjects(self._nodeTable, self._toSelect if self._toSelect is not None else self._toDisplay)
+
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        """Set the value of the given key, like the feedback dict. `toSelect` is the same than `toDisplay` if None."""
+
+        if key == 'title':
+            self.title = value
+        elif key == 'documentation':
+            self.documentation = value
+        elif key == 'toDisplay':
+            self._toDisplay = self._encode(() if value is Ellipsis or value is None else value)
+        elif key == 'toSelect':
+            self._toSelect = None if value is None or value is Ellipsis else self._encode(value)
+            if self._toSelect is not None and self._toSelect == self._toDisplay:
+                self._toSelect = None  # Only store the selection if it differ from the display.
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in self.KEYS
+
+    def __iter__(self):
+        """Iterate over the keys, like the feedback dict."""
+        return iter(self.KEYS)
+
+    def __getstate__(self):
+        """Get the state used to pickle the feedback, the objects are decoded."""
+        return self.toDict()
+
+    def __setstate__(self, state):
+        """Restore the feedback from the state returned by `__getstate__`"""
+        self.__init__(state['title'], state['toDisplay'], state['toSelect'], state['documentation'], found=state.get('found', None))
+
+    @property
+    def count(self):
+        """Get the number of objects of the feedback"""
+        return len(self._toDisplay[0])
+
+    @property
+    def found(self):
+        """Get the number of objects found by the check, it can be more than those stored if the feedback is truncated"""
+        return self._found
+
+    @found.setter
+    def found(self, value):
+        """Set the number of objects found by the check, it can't be less than those stored"""
+        self._found = max(value or 0, self.count)
+
+    @property
+    def isTruncated(self):
+        """Get if the check found more objects than those stored, because of the blueprint `maxErrors` option"""
+        return self._found > self.count
+
+    def keys(self):
+        """Get the keys of the feedback, like the feedback dict."""
+        return list(self.KEYS)
+
+    def append(self, toDisplay, toSelect=None):
+        """Add an object at the end of the feedback, used to fill it while the check is still running.
+
+        Parameters
+        -----------
+        toDisplay: object
+            The object to display.
+        toSelect: object or NoneType
+            The object to select, if None the displayed object is selected.
+        """
+
+        indexes, components = self._toDisplay
+        index, component = self._nodeTable.add(toDisplay)
+        indexes.append(index)
+        components.append(component)
+
+        if toSelect is None or toSelect is toDisplay:
+            selectIndex, selectComponent = index, component
+        else:
+            selectIndex, selectComponent = self._nodeTable.add(toSelect)
+
+        # The selection is only stored once an object differ from the displayed one.
+        if self._toSelect is None and (selectIndex, selectComponent) != (index, component):
+            self._toSelect = (array.array('l', indexes[:-1]), array.array('l', components[:-1]))
+
+        if self._toSelect is not None:
+            self._toSelect[0].append(selectIndex)
+            self._toSelect[1].append(selectComponent)
+
+        self._found = max(self._found, len(indexes))
+
+    def get(self, key, default=None):
+        """Get the value of the given key or the default value if the key does not exists."""
+
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def toDict(self):
+        """Get the feedback as a dict with lists of objects, and the number of objects found if it is truncated."""
+
+        data = {key: list(self[key]) if key in ('toDisplay', 'toSelect') else self[key] for key in self.KEYS}
+        if self.isTruncated:
+            data['found'] = self._found
+
+        return data
+
+    def _encode(self, objects):
+        """Store the given objects in the node table and return the arrays of their references."""
+
+        indexes = array.array('l')
+        components = array.array('l')
+        for value in objects:
+            index, component = self._nodeTable.add(value)
+            indexes.append(index)
+            components.append(component)
+
+        return indexes, components
+
+
+class FeedbackObjects(object):
+    """Read only sequence of the objects of a Feedback, they are retrieved from the NodeTable when accessed."""
+
+    __slots__ = ('_nodeTable', '_indexes', '_components')
+
+    def __init__(self, nodeTable, references):
+        self._nodeTable = nodeTable
+        self._indexes, self._components = references
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def __len__(self):
+        return len(self._indexes)
+
+    def __iter__(self):
+        get = self._nodeTable.get
+        for index, component in six.moves.zip(self._indexes, self._components):
+            yield get(index, component)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return self._nodeTable.get(self._indexes[index], self._components[index])
+
+    def __eq__(self, other):
+        try:
+            return len(self) == len(other) and all(a == b for a, b in six.moves.zip(self, other))
+        except TypeError:
+            return False
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+
+class ProcessInterrupted(Exception):
+    """Raised in a process to stop its execution, see `CancellationToken`.
+
+    The `blueprint` attribute is the Blueprint which process have been stopped, it is set by the Blueprint when the
+    exception leave the process. A linked blueprint can be the one stopped while running the links of another one.
+    """
+
+    blueprint = None
+
+
+class ProcessCancelled(ProcessInterrupted):
+    """Raised in a process when its execution have been cancelled."""
+
+
+class ProcessTimeout(ProcessInterrupted):
+    """Raised in a process when its execution exceeded its `timeout` option."""
+
+
+class CancellationToken(object):
+    """Token given to a process during the execution of one of its methods to stop it cooperatively.
+
+    The token can be cancelled from another thread (e.g. the ui or an asyncio task) and can expire after a timeout, the
+    process will be stopped the next time it poll the token. (see `Process.poll` and `Process.setProgressValue`)
+    """
+
+    def __init__(self, timeout=None):
+        """Start the countdown of the token if a timeout is given.
+
+        Parameters
+        -----------
+        timeout: numbers.Number, optional
+            Number of seconds after which the token expire, it never expire if None.
+        """
+
+        self.timeout = timeout
+        self._deadline = AtUtils.getTime() + timeout if timeout else None
+        self._isCancelled = False
+
+    def __repr__(self):
+        """Return the representation of the token"""
+
+        state = 'cancelled' if self._isCancelled else 'expired' if self.isExpired else 'active'
+        return '<{0} {1}>'.format(self.__class__.__name__, state)
+
+    @property
+    def isCancelled(self):
+        """Get if the token have been cancelled"""
+        return self._isCancelled
+
+    @property
+    def isExpired(self):
+        """Get if the token timeout have been reached"""
+        return self._deadline is not None and AtUtils.getTime() > self._deadline
+
+    def cancel(self):
+        """Cancel the token, the process will be stopped the next time it poll it."""
+        self._isCancelled = True
+
+    def poll(self):
+        """Raise if the token have been cancelled or have expired.
+
+        Raises
+        -------
+        ProcessCancelled
+            The token have been cancelled.
+        ProcessTimeout
+            The token timeout have been reached.
+        """
+
+        if self._isCancelled:
+            raise ProcessCancelled('The execution have been cancelled.')
+
+        if self.isExpired:
+            raise ProcessTimeout('The execution exceeded its timeout of {0}s.'.format(self.timeout))
+
+
+class _ExecutionScope(object):
+    """Context manager that give the process of a Blueprint a new CancellationToken, using the `timeout` option.
+
+    A scope entered while the Blueprint is already in one keep the token of the outermost scope, so all the process
+    methods run in it can be cancelled together and count toward the same timeout. (e.g. the fingerprint and the check)
+    """
+
+    __slots__ = ('blueprint', 'process', 'isOutermost')
+
+    def __init__(self, blueprint):
+        self.blueprint = blueprint
+        self.process = None
+        self.isOutermost = False
+
+    def __enter__(self):
+        blueprint = self.blueprint
+        self.process = process = blueprint.getProcessInstance()
+
+        self.isOutermost = blueprint._token is None
+        if self.isOutermost:
+            blueprint._token = process._token = CancellationToken(timeout=blueprint._options.get('timeout', None))
+            process._maxErrors = blueprint._options.get('maxErrors', None)
+            blueprint._progress.reset()
+
+        return process
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        # Only the innermost blueprint is kept, the exception can go through the blueprints that run the links.
+        if isinstance(exception_value, ProcessInterrupted) and exception_value.blueprint is None:
+            exception_value.blueprint = self.blueprint
+
+        if self.isOutermost:
+            self.blueprint._token = self.process._token = None
+            self.process._maxErrors = None
+            self.blueprint._progress.flush()
 
 
 # Automatic Decorator
@@ -173,7 +989,10 @@ def automatic(cls):
             self.toFix = type(self.toFix)()
             self.data = type(self.data)()
 
-            check_(self, *args, **kwargs)
+            # A check written as a generator yield its feedback, it have to be read entirely here.
+            feedback = check_(self, *args, **kwargs)
+            if isinstance(feedback, types.GeneratorType):
+                self.collectFeedback(feedback)
 
             self.isChecked = True
 
@@ -200,6 +1019,153 @@ def automatic(cls):
     return cls
 
 
+# Static metadata of the processes classes, by module path: {path: (mtime, {className: metadata})}
+_PROCESS_METADATA = {}
+
+def getProcessMetadata(processStr):
+    """Retrieve the data describing a process class by reading its module source, without importing it.
+
+    The module source is parsed to find the process class, its docstring and the `check`, `fix` and `tool` methods
+    overridden in it or in its parents. The parents have to be defined in the same module (or be the `Process` class)
+    to be resolved. The result is cached until the module file is modified.
+
+    Parameters
+    ----------
+    processStr: str
+        The full python import string of the process class.
+
+    Returns
+    -------
+    dict or NoneType
+        Dict with `name`, `docstring`, `methods` and `path` keys or None if the process can't be resolved statically,
+        in this case the module have to be imported.
+    """
+
+    moduleStr, _, className = processStr.rpartition('.')
+
+    path = AtUtils.getModulePath(moduleStr)
+    if path is None:
+        return None
+
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+
+    cached = _PROCESS_METADATA.get(path, None)
+    if cached is None or cached[0] != mtime:
+        cached = _PROCESS_METADATA[path] = (mtime, _parseProcessModule(path))
+
+    classes = cached[1]
+    if classes is None:
+        return None
+
+    return classes.get(className, None)
+
+
+def _parseProcessModule(path):
+    """Parse the given module source to get the metadata of all the processes classes defined in it.
+
+    Parameters
+    ----------
+    path: str
+        Path to the python source file to parse.
+
+    Returns
+    -------
+    dict or NoneType
+        Metadata of each process class that could be resolved by class name or None if the module can't be parsed.
+    """
+
+    try:
+        with open(path, 'rb') as sourceFile:
+            tree = ast.parse(sourceFile.read(), path)
+    except (IOError, OSError, SyntaxError, ValueError, TypeError):
+        return None
+
+    # Find how `Athena.AtCore` and `Athena.AtCore.Process` are named in the module.
+    coreNames = set(['Athena.AtCore'])
+    processNames = set()
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.level == 0:
+            for alias in node.names:
+                if node.module == 'Athena' and alias.name == 'AtCore':
+                    coreNames.add(alias.asname or alias.name)
+                elif node.module == 'Athena.AtCore' and alias.name == 'Process':
+                    processNames.add(alias.asname or alias.name)
+
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.name == 'Athena.AtCore' and alias.asname:
+                    coreNames.add(alias.asname)
+
+    processNames.update('{0}.Process'.format(name) for name in coreNames)
+
+    classNodes = dict((node.name, node) for node in tree.body if isinstance(node, ast.ClassDef))
+
+    def getChain(classNode, visited):
+        """Get the class nodes of the given class and its parents up to `Process` or None if it can't be resolved."""
+
+        if classNode.name in visited or not classNode.bases:
+            return None
+        visited = visited | set([classNode.name])
+
+        chain = [classNode]
+        for base in classNode.bases:
+            baseName = _getDottedName(base)
+            if baseName in processNames:
+                continue
+
+            baseNode = classNodes.get(baseName, None)
+            if baseNode is None:
+                return None
+
+            baseChain = getChain(baseNode, visited)
+            if baseChain is None:
+                return None
+            chain.extend(baseChain)
+
+        return chain
+
+    overridable = (AtConstants.CHECK, AtConstants.FIX, AtConstants.TOOL)
+
+    classes = {}
+    for className, classNode in classNodes.items():
+        chain = getChain(classNode, set())
+        if chain is None:
+            continue
+
+        methods = set()
+        for node in chain:
+            for statement in node.body:
+                if isinstance(statement, ast.FunctionDef) and statement.name in overridable:
+                    methods.add(statement.name)
+                elif isinstance(statement, ast.Assign):
+                    methods.update(target.id for target in statement.targets if isinstance(target, ast.Name) and target.id in overridable)
+
+        classes[className] = {
+            'name': className,
+            'docstring': ast.get_docstring(classNode, clean=False),
+            'methods': tuple(sorted(methods)),
+            'path': path,
+        }
+
+    return classes
+
+
+def _getDottedName(node):
+    """Get the dotted name represented by an `ast.Name` or `ast.Attribute` node, or None for any other node."""
+
+    if isinstance(node, ast.Name):
+        return node.id
+
+    if isinstance(node, ast.Attribute):
+        value = _getDottedName(node.value)
+        return '{0}.{1}'.format(value, node.attr) if value is not None else None
+
+    return None
+
+
 #TODO: Think about an implementation of a data feature (Share data between checks.)
 class Data(object):
 
@@ -214,30 +1180,42 @@ class Register(object):
     to work with like contexts and software.
     """
 
-    def __init__(self, verbose=False):
+    def __init__(self, verbose=False, useManifest=True, resultCache=None):
         """Get the software and setup data.
 
         Parameters
         -----------
         verbose: bool
             Define if the function should log informations about its process. (default: False)
+        useManifest: bool
+            Define if the envs should be retrieved from the discovery manifest when it is up to date instead of
+            importing all env modules. (default: True)
+        resultCache: AtCache.ResultCache, optional
+            Persistent cache the blueprints will use to store and reuse their checks feedback. (default: None)
         """
 
         self.verbose = verbose
+        self.resultCache = resultCache
         
-        self._software = AtUtils.getSoftware()
+        with AtUtils.PROFILER.profile('getSoftware'):
+            self._software = AtUtils.getSoftware()
+        self._manifest = AtManifest.DiscoveryManifest() if useManifest else None
 
         self._data = {}
         self._packages = {}
         self._contexts = []
 
         self._blueprints = []
+        self._linkGraph = None
 
         self._context = None
         self._env = None
 
         self._setup()
 
+        # Get notified when a new package is imported to add its context.
+        AtUtils.PackageRegistry().subscribe(self._addPackage)
+
     def __repr__(self):
         """Return the representation of the Register"""
 
@@ -305,6 +1283,11 @@ class Register(object):
         """Get all Register blueprints"""
         return self._blueprints
 
+    @property
+    def linkGraph(self):
+        """Get the LinkGraph of the current env blueprints"""
+        return self._linkGraph
+
     @property
     def contexts(self):
         """Get all Register contexts"""
@@ -320,6 +1303,15 @@ class Register(object):
         """Get the current env the register are pointing on"""
         return self._env
 
+    def update(self):
+        """Add the contexts of the packages imported since the register have been setup.
+
+        The existing data are kept, only the new contexts are added. This is also done automatically each time the
+        package registry is updated, e.g. by another register.
+        """
+
+        AtUtils.PackageRegistry().update()
+
     def reload(self):
         """Reload data for the register instance.
         
@@ -331,32 +1323,96 @@ class Register(object):
             Define if the function should log informations about its process. (default: False)
         """
 
-        self._data = {}
+        self._data = {}
+
+        self._setup()
+
+    def _setup(self):
+        """Setup data for the register instance.
+        
+        Setup the register internal data from packages.
+        The data contain all informations needed to make the tool work like each contexts, envs, blueprints and processes.
+        Here only the contexts and envs are retrieved. To get blueprints, getBlueprints should be called.
+
+        Parameters
+        -----------
+        verbose: bool
+            Define if the function should log informations about its process. (default: False)
+        """
+
+        with AtUtils.PROFILER.profile('getPackages'):
+            self._packages = packages = AtUtils.getPackages()
+
+        for context, packageData in packages.items():
+            envs = self._getEnvs(packageData)
+            
+            self._data[context] = packageData
+            self._data[context]['envs'] = envs
+
+        if self._manifest is not None:
+            self._manifest.save()
+
+        self._contexts = packages.keys()
+
+    def _addPackage(self, context, packageData):
+        """Add the context of a new package to the register data. (Called by `AtUtils.PackageRegistry`)
+
+        Parameters
+        -----------
+        context: str
+            Name of the context to add.
+        packageData: dict
+            Package data as returned by `AtUtils.getPackages`.
+        """
+
+        if context in self._data:
+            return
+
+        # This is called by the import of the package, from code that is not related to this register.
+        try:
+            packageData['envs'] = self._getEnvs(packageData)
+        except Exception:
+            AtUtils.LOGGER.exception('Envs of "{0}" can not be retrieved, context "{1}" not added to {2}'.format(packageData['import'], context, self))
+            return
+
+        self._packages[context] = self._data[context] = packageData
+        self._contexts = self._packages.keys()
 
-        self._setup()
+        if self._manifest is not None:
+            self._manifest.save()
 
-    def _setup(self):
-        """Setup data for the register instance.
-        
-        Setup the register internal data from packages.
-        The data contain all informations needed to make the tool work like each contexts, envs, blueprints and processes.
-        Here only the contexts and envs are retrieved. To get blueprints, getBlueprints should be called.
+        if self.verbose:
+            AtUtils.LOGGER.info('Context "{0}" added to {1}'.format(context, self))
+
+    def _getEnvs(self, packageData):
+        """Get the envs of the given package, from the discovery manifest if it is up to date.
 
         Parameters
         -----------
-        verbose: bool
-            Define if the function should log informations about its process. (default: False)
+        packageData: dict
+            Package data as returned by `AtUtils.getPackages`.
+
+        Returns
+        -------
+        dict
+            Envs for the given package and the register software. (see `AtUtils.getEnvs`)
         """
 
-        self._packages = packages = AtUtils.getPackages()
+        with AtUtils.PROFILER.profile('getEnvs', packageData['import']):
+            manifest = self._manifest
+            if manifest is None:
+                return AtUtils.getEnvs(packageData['import'], software=self._software)
+
+            envs = manifest.getEnvs(packageData, self._software)
+            if envs is not None:
+                if self.verbose:
+                    AtUtils.LOGGER.info('Envs of "{0}" retrieved from the discovery manifest'.format(packageData['import']))
+                return envs
 
-        for context, packageData in packages.items():
             envs = AtUtils.getEnvs(packageData['import'], software=self._software)
-            
-            self._data[context] = packageData
-            self._data[context]['envs'] = envs
+            manifest.setEnvs(packageData, self._software, envs)
 
-        self._contexts = packages.keys()
+            return envs
     
     def getEnvs(self, context):
         """Return envs stored in the given context.
@@ -386,7 +1442,7 @@ class Register(object):
 
         return envData.keys()
 
-    def getBlueprints(self, context, env, forceReload=False):
+    def getBlueprints(self, context, env, forceReload=False, lazy=False, prefetch=None):
         """Get the blueprint object for the given context and env.
         
         Try to retrieve the blueprints for the specified env in the specified context. If there is already a blueprints,
@@ -400,6 +1456,11 @@ class Register(object):
             Env from which get the blueprint object.
         forceReload: bool
             Define if the function should reload its blueprints or not.
+        lazy: bool
+            Define if the blueprints should defer the instantiation of their process until it is executed.
+        prefetch: bool or NoneType
+            Define if the processes modules files should be read concurrently before creating the blueprints, this
+            speed up their import from slow file systems. If None, use the `prefetch` value of the env parameters.
 
         Returns
         -------
@@ -410,6 +1471,7 @@ class Register(object):
         assert context in self._contexts, '"{0}" Are not registered yet in this Register'.format(context)
 
         self._blueprints = []
+        self._linkGraph = None
         self._context = context
 
         # Get the dict for the specified context in self._data
@@ -431,36 +1493,31 @@ class Register(object):
         # Get the blueprint in self._data[context]['envs'][env]. If one is found, return it.  #TODO: It seems there is an error
         blueprints = envData.get('blueprints', None)
         if blueprints is not None and not forceReload: # If not forceReload, return the existing blueprints. #FIXME: self._blueprints is empty outside dev
+            self._linkGraph = blueprints['graph']
             return blueprints['objects']
 
-        # Get the env module to retrieve the blueprint from.
-        envModule = envData.get('module', None)
-        if envModule is None:
-            
-            # Get the string path to the env package in self._data[context]['envs'][env]['import']
-            envStr = envData.get('import', None)
-            if envStr is None:
-                return {}
-
-            # Load the env module from the string path stored.
-            envModule = AtUtils.importFromStr('{}.{}'.format(envStr, envData), verbose=self.verbose)
-            if envModule is None:
-                return {}
-            envData['module'] = envModule
-
-        # If force reload are enabled, this will reload the env module.
-        if forceReload:
-            reload(envModule)
+        blueprints = self._getRegister(contextData, env, forceReload=forceReload)
+        if blueprints is None:
+            return {}
 
-        # Try to access the `blueprints` variable in the env module
-        blueprints = getattr(envModule, 'register', {})
-        ID.flush()
+        # Warm the processes modules files in the OS cache, importing them will then be a lot faster.
+        if prefetch is None:
+            prefetch = envData.get('parameters', {}).get('prefetch', False)
+        if prefetch:
+            moduleStrs = [blueprints[i]['process'].rpartition('.')[0] for i in range(len(blueprints)) if blueprints[i].get('process')]
+            AtUtils.prefetchModules(moduleStrs)
 
         # Generate a blueprint object for each process retrieved in the `blueprint` variable of the env module.
         self._blueprints = blueprintObjects = []
         for i in range(len(blueprints)):
-            blueprintObjects.append(Blueprint(blueprint=blueprints[i], verbose=self.verbose))
+            blueprintObject = Blueprint(blueprint=blueprints[i], verbose=self.verbose, lazy=lazy)
+            if self.resultCache is not None:
+                blueprintObject.setResultCache(self.resultCache, context, env)
+            blueprintObjects.append(blueprintObject)
         
+        # Compile the links to check them for cycles, the graph will then schedule the links execution.
+        self._linkGraph = LinkGraph(blueprintObjects)
+
         # Default resolve for blueprints if available in batch, call the `resolveLinks` method from blueprints to change the targets functions.
         batchLinkResolveBlueprints = [blueprintObject if blueprintObject._inBatch else None for blueprintObject in blueprintObjects]
         for blueprint in blueprintObjects:
@@ -470,10 +1527,67 @@ class Register(object):
         envData['blueprints'] = {
                 'data': blueprints,
                 'objects': blueprintObjects,
+                'graph': self._linkGraph,
         }
 
         return self._blueprints
 
+    def _getRegister(self, contextData, env, forceReload=False):
+        """Get the `register` data of the given env, from its compiled manifest if it is up to date or its module.
+
+        Parameters
+        ----------
+        contextData: dict
+            The data of the context the env belongs to, from the register data.
+        env: str
+            The env to get the register of.
+        forceReload: bool
+            If True, the compiled manifest is ignored and the env module is reloaded.
+
+        Returns
+        -------
+        dict or list or NoneType
+            The `register` of the env, indexed by blueprint ID or None if the env module can't be imported.
+        """
+
+        envsData = contextData['envs']
+        envData = envsData[env]
+
+        # A compiled env can be used as is without executing the env module. (see `AtManifest.compileEnv`)
+        if not forceReload:
+            compiledEnv = AtManifest.loadCompiledEnv(envData['path'], env)
+            if compiledEnv is not None:
+                if 'parameters' not in envData:
+                    envData['parameters'] = compiledEnv['parameters']
+                return compiledEnv['register']
+
+        # Get the env module to retrieve the blueprint from, envs are lazy so this is where the module is imported.
+        # IDs are flushed first so the env module IDs start from 0 whatever the env imported before.
+        isLoaded = getattr(envData, 'isLoaded', True)
+        if not isLoaded:
+            ID.flush()
+
+        envModule = envData.get('module', None)
+        if envModule is None:
+            return None
+
+        # Now that the module is imported its parameters are known, update the manifest to record them.
+        if not isLoaded and self._manifest is not None:
+            # `setEnvs` only record the parameters already retrieved, the module is imported so they can be now.
+            envData['parameters'] = envData.get('parameters', {})
+            if self._manifest.setEnvs(contextData, self._software, envsData):
+                self._manifest.save()
+
+        # If force reload are enabled, this will reload the env module.
+        if forceReload:
+            reload(envModule)
+
+        # Try to access the `blueprints` variable in the env module
+        register = getattr(envModule, 'register', {})
+        ID.flush()
+
+        return register
+
     def reloadBlueprintsModules(self):
         """Reload the Blueprints's source modules to reload the Processes in it
         
@@ -485,7 +1599,7 @@ class Register(object):
             Lis of all reloaded modules.
         """
 
-        modules = list(set([blueprint._module for blueprint in self._blueprints]))
+        modules = list(set([blueprint._module for blueprint in self._blueprints if blueprint._module is not None]))
         for module in modules:
             reload(module)
 
@@ -577,7 +1691,7 @@ class Blueprint(object):
     if it can run a check, a fix, if it has a ui, its name, docstring and a lot more.
     """
 
-    def __init__(self, blueprint, verbose=False):
+    def __init__(self, blueprint, verbose=False, lazy=False):
         """Get the software and setup data.
 
         Parameters
@@ -586,6 +1700,11 @@ class Blueprint(object):
             Dict containing the process string and the object (optional).
         verbose: bool
             Define if the function should log informations about its process. (default: False)
+        lazy: bool
+            If True, the process will only be imported and instantiated the first time it is needed (e.g. to run its
+            check), all the data displayed before are retrieved from the process module source or from the process
+            class if the source can't be resolved. The name is also taken from the class name until the process is
+            instantiated, so a name defined in the process `__init__` is only used from there. (default: False)
         """
 
         self.verbose = verbose
@@ -594,14 +1713,31 @@ class Blueprint(object):
         self.processStr = blueprint.get('process', None)
         self.category = blueprint.get('category', 'Other')
 
-        initArgs, initKwargs = self.getArguments('__init__')
         self._module = None
-        self._process = self.getProcess(initArgs, initKwargs)
+        self._metadata = getProcessMetadata(self.processStr) if lazy and self.processStr else None
+        self._processClass = self.getProcessClass() if self._metadata is None else None
+        self._process = None
+        self._progressbar = None
+        self._progress = AtProgress.ProgressReporter()
         self._links = {AtConstants.CHECK: [], AtConstants.FIX: [], AtConstants.TOOL: []}
+        self._linkGraph = None
+        self._fingerprint = None
+        self._checkResult = None
+        self._isCachedResult = False
+        self._token = None
+        self._resultCache = None
+        self._resultCacheScope = (None, None)
         self._options = blueprint.get('options', {})
 
-        self._name = AtUtils.camelCaseSplit(self._process._name)
-        self._docstring = self.createDocstring()
+        self._name = AtUtils.camelCaseSplit(self.processStr.rpartition('.')[-1])
+        self._docstring = None
+
+        self._progress.name = self._name
+
+        if not lazy:
+            self.getProcessInstance()
+        else:
+            self._docstring = self.createDocstring()
 
         self._check = None
         self._fix = None
@@ -626,7 +1762,22 @@ class Blueprint(object):
     def __repr__(self):
         """Return the representation of the object."""
 
-        return "<{0} '{1}' object at {2}'>".format(self.__class__.__name__, self._process.__class__.__name__, hex(id(self)))
+        return "<{0} '{1}' object at {2}'>".format(self.__class__.__name__, self.processStr.rpartition('.')[-1], hex(id(self)))
+
+    @property
+    def process(self):
+        """Get the Blueprint's process instance, it is created on first access"""
+        return self.getProcessInstance()
+
+    @property
+    def isInstantiated(self):
+        """Get if the Blueprint's process have already been instantiated"""
+        return self._process is not None
+
+    @property
+    def progress(self):
+        """Get the Blueprint's `AtProgress.ProgressReporter`, add sinks to it to follow the process progress"""
+        return self._progress
 
     @property
     def options(self):
@@ -678,13 +1829,19 @@ class Blueprint(object):
         """Get the Blueprint's non blocking state"""
         return self._isNonBlocking
         
-    def check(self, links=True):
+    def check(self, links=True, force=False):
         """This is a wrapper for the process check that will automatically execute it with the right parameters.
 
+        If the process implement `Process.fingerprint` and the digest it return did not change since the last check,
+        the check is not run and its last feedback is returned. The fingerprint is run with the check CancellationToken,
+        it can be cancelled and count toward the `timeout` option.
+
         Parameters
         ----------
         links: bool
             Should the wrapper launch the connected links or not.
+        force: bool
+            If True, the check is run even if the process fingerprint did not change. (default: False)
 
         Returns
         -------
@@ -698,15 +1855,106 @@ class Blueprint(object):
             return None, None
         
         args, kwargs = self.getArguments(AtConstants.CHECK)
-        returnValue = self._check(*args, **kwargs)  #TODO: Not used !!
 
-        result = self.filterResult(self._process._feedback)
+        # The fingerprint can be as slow as the check, it is run with the same token and count toward the timeout.
+        with _ExecutionScope(self) as process:
+            fingerprint = process.fingerprint(*args, **kwargs)
+            if fingerprint is not None and not force and self._fingerprint is not None and fingerprint == self._fingerprint:
+                result = self._checkResult
+            else:
+                # The cache is cleared first so it is not used if the check raise.
+                self.invalidate()
+
+                # The persistent cache can only be used with a fingerprint, it is what identify the checked data.
+                cacheKey = None
+                result = None
+                if fingerprint is not None and self._resultCache is not None:
+                    # The `maxErrors` option change the feedback, it is part of the key like the check arguments.
+                    arguments = (args, kwargs, self._options.get('maxErrors', None))
+                    cacheKey = self._resultCache.getKey(*(self._resultCacheScope + (self.processStr, arguments, fingerprint)))
+                    if cacheKey is not None and not force:
+                        result = self._resultCache.get(cacheKey)
+
+                if result is not None:
+                    self._isCachedResult = True
+                else:
+                    returnValue = self._execute(self._check, args, kwargs)  #TODO: Not used !!
+                    result = self.filterResult(process._feedback)
+
+                    if cacheKey is not None:
+                        self._resultCache.set(cacheKey, result, *(self._resultCacheScope + (self.processStr,)))
+
+                if fingerprint is not None:
+                    self._fingerprint = fingerprint
+                    self._checkResult = result
 
         if links:
             self.runLinks(AtConstants.CHECK)
         
         return result, bool(result)
 
+    def checkAsync(self, links=True, force=False, timeout=None, executor=None):
+        """Get an awaitable that run the check in an executor, see `AtAsync.check`. (Python 3 only)
+
+        Parameters
+        ----------
+        links: bool
+            Should the wrapper launch the connected links or not.
+        force: bool
+            If True, the check is run even if the process fingerprint did not change. (default: False)
+        timeout: float, optional
+            Maximum number of seconds to wait for the check, `asyncio.TimeoutError` is raised when it is reached.
+        executor: concurrent.futures.Executor, optional
+            The executor to run the check in, the loop default executor is used if None.
+
+        Returns
+        -------
+        coroutine
+            The coroutine returning the check feedback and state.
+        """
+
+        from Athena import AtAsync  # asyncio is only available with Python 3.
+
+        return AtAsync.check(self, links=links, force=force, timeout=timeout, executor=executor)
+
+    def fixAsync(self, links=True, timeout=None, executor=None):
+        """Get an awaitable that run the fix in an executor, see `AtAsync.fix`. (Python 3 only)
+
+        Parameters
+        ----------
+        links: bool
+            Should the wrapper launch the connected links or not.
+        timeout: float, optional
+            Maximum number of seconds to wait for the fix, `asyncio.TimeoutError` is raised when it is reached.
+        executor: concurrent.futures.Executor, optional
+            The executor to run the fix in, the loop default executor is used if None.
+
+        Returns
+        -------
+        coroutine
+            The coroutine returning the value returned by the fix.
+        """
+
+        from Athena import AtAsync  # asyncio is only available with Python 3.
+
+        return AtAsync.fix(self, links=links, timeout=timeout, executor=executor)
+
+    def invalidate(self):
+        """Forget the fingerprint of the last check, the next check will be run whatever the fingerprint."""
+
+        self._fingerprint = None
+        self._checkResult = None
+        self._isCachedResult = False
+
+    def reset(self):
+        """Forget the process instance and its last check, a new process will be created the next time it is needed.
+
+        This allow to run the same Blueprint on another data (e.g. another file) without any state left by the last run.
+        """
+
+        self.invalidate()
+        self._process = None
+
     def fix(self, links=True):
         """This is a wrapper for the process fix that will automatically execute it with the right parameters.
         
@@ -724,8 +1972,15 @@ class Blueprint(object):
         if self._fix is None:
             return None
 
+        # The fix may need the data retrieved by the check, they are not available if the feedback came from the cache.
+        if self._isCachedResult:
+            self.check(links=False, force=True)
+
+        # The fix change the data the check look at, even if the fingerprint does not reflect it.
+        self.invalidate()
+
         args, kwargs = self.getArguments(AtConstants.FIX)
-        returnValue = self._fix(*args, **kwargs)
+        returnValue = self._execute(self._fix, args, kwargs)
 
         if links:
             self.runLinks(AtConstants.FIX)
@@ -750,18 +2005,80 @@ class Blueprint(object):
             return
 
         args, kwargs = self.getArguments(AtConstants.TOOL)
-        result = self._tool(*args, **kwargs)
+        result = self._execute(self._tool, args, kwargs)
 
         if links:
             self.runLinks(AtConstants.TOOL)
 
         return result
 
+    def cancel(self):
+        """Cancel the running method of the process, it will be stopped the next time it poll its token.
+
+        Returns
+        -------
+        bool
+            True if a running method have been cancelled, False if the process was not running.
+        """
+
+        token = self._token
+        if token is None:
+            return False
+
+        token.cancel()
+        return True
+
+    def _execute(self, method, args, kwargs):
+        """Run the given method of the process with a new CancellationToken, using the `timeout` option.
+
+        The token of the check is the one already given to the process fingerprint. (see `check`)
+
+        Parameters
+        ----------
+        method: str
+            The name of the process method to run.
+        args: list
+            The arguments of the method.
+        kwargs: dict
+            The keyword arguments of the method.
+
+        Returns
+        -------
+        type
+            The value returned by the method.
+        """
+
+        with _ExecutionScope(self) as process:
+            if method == self._check:
+                # Each check have the full budget, even if the process does not clear its feedback itself.
+                process._errorCount = 0
+
+            returnValue = getattr(process, method)(*args, **kwargs)
+
+            # A check written as a generator yield its feedback, it is read while the token is still available.
+            if method == self._check and isinstance(returnValue, types.GeneratorType):
+                process.collectFeedback(returnValue)
+                returnValue = None
+
+            return returnValue
+
     def runLinks(self, which):
+        """Run the methods linked to the given method of this Blueprint.
 
-        links = self._links[which]
+        If the Blueprint belong to a LinkGraph, the graph schedule all the methods triggered by this one, directly or
+        not, so each of them is run only once. Otherwise, the linked methods are simply called in order.
 
-        for link in links:
+        Parameters
+        ----------
+        which: str
+            The name of the method that have been run. (check, fix or tool)
+        """
+
+        if self._linkGraph is not None:
+            self._linkGraph.run(self, which)
+            return
+
+        for _, link in self._links[which]:
             link()
 
     def getArguments(self, method):
@@ -810,6 +2127,17 @@ class Blueprint(object):
             An instance of the process class.
         """
 
+        return self.getProcessClass()(*args, **kwargs)
+
+    def getProcessClass(self):
+        """Retrieve the process path and import the process class.
+
+        Returns
+        -------
+        type
+            The process class, a subclass of `Process`.
+        """
+
         if self.processStr is None:
             raise RuntimeError() #TODO Add an error message here
 
@@ -822,28 +2150,68 @@ class Blueprint(object):
         if not issubclass(processClass, Process):
             raise RuntimeError('Class {0} from {1} is not a subclass of {2}'.format(processStr, moduleStr, Process))
 
-        return processClass(*args, **kwargs)
+        return processClass
+
+    def getProcessInstance(self):
+        """Get the process instance, create it with the `__init__` arguments if it does not exists yet.
+
+        Once the process is created, the progressbar is connected to it, the name is updated with the process name and
+        the docstring is generated again to use the process `_docFormat_`.
+
+        Returns
+        -------
+        Process
+            The instance of the Blueprint's process.
+        """
+
+        if self._process is not None:
+            return self._process
+
+        # With static metadata, the process module is only imported now.
+        if self._processClass is None:
+            self._processClass = self.getProcessClass()
+
+        initArgs, initKwargs = self.getArguments('__init__')
+        with AtUtils.PROFILER.profile('Process.__init__', self.processStr):
+            self._process = process = self._processClass(*initArgs, **initKwargs)
+        process._progress = self._progress
+
+        # The process can define its own name in its `__init__`, the class name was only used until now.
+        self._name = self._progress.name = AtUtils.camelCaseSplit(process._name)
+
+        self._docstring = self.createDocstring()
+
+        return process
 
     def setupCore(self):
         """Setup all data for the wrapping method (check, fix, tool...) and bool to know if isCheckable, isFixable, 
         hasTool...
 
-        Retrieve all overridden methods and set the instance attributes with the retrieved data.
+        Retrieve all methods overridden in the process class (or any of its parents) and set the instance attributes
+        with the retrieved data. This only use the class, or the static metadata, so the process does not need to be
+        instantiated.
         """
-        
-        overriddenMethods = AtUtils.getOverriddedMethods(self._process.__class__, Process)
 
-        if overriddenMethods.get(AtConstants.CHECK, False):
+        if self._processClass is None:
+            overriddenMethods = self._metadata['methods']
+        else:
+            overriddenMethods = []
+            for method in (AtConstants.CHECK, AtConstants.FIX, AtConstants.TOOL):
+                function = six.get_unbound_function(getattr(self._processClass, method))
+                if function is not six.get_unbound_function(getattr(Process, method)):
+                    overriddenMethods.append(method)
+
+        if AtConstants.CHECK in overriddenMethods:
             self._isCheckable = True
-            self._check = self._process.check
+            self._check = AtConstants.CHECK
 
-        if overriddenMethods.get(AtConstants.FIX, False):
+        if AtConstants.FIX in overriddenMethods:
             self._isFixable = True
-            self._fix = self._process.fix
+            self._fix = AtConstants.FIX
 
-        if overriddenMethods.get(AtConstants.TOOL, False):
+        if AtConstants.TOOL in overriddenMethods:
             self._hasTool = True
-            self._tool = self._process.tool
+            self._tool = AtConstants.TOOL
 
     def setupTags(self):
         """Setup the tags used by this process
@@ -903,29 +2271,66 @@ class Blueprint(object):
         if links is None:
             return
 
-        assert all([hasattr(link, '__iter__') for link in links]), 'Links should be of type tuple(int, str, str)'
-        for link in links:
-            index, _driver, _driven = link
-            if linkedObjects[index] is None:
-                continue
+        with AtUtils.PROFILER.profile('resolveLinks', self.processStr):
+            assert all([hasattr(link, '__iter__') for link in links]), 'Links should be of type tuple(int, str, str)'
+            for link in links:
+                index, _driver, _driven = link
+                if linkedObjects[index] is None:
+                    continue
+
+                driven = _driven
+                driven = check if _driven == Link.CHECK else driven
+                driven = fix if _driven == Link.FIX else driven
+                driven = tool if _driven == Link.TOOL else driven
+
+                # The linked method is stored with the node it target in the LinkGraph. (blueprint index, method name)
+                self._links[_driver].append(((index, _driven), getattr(linkedObjects[index], driven)))
 
-            driven = _driven
-            driven = check if _driven == Link.CHECK else driven
-            driven = fix if _driven == Link.FIX else driven
-            driven = tool if _driven == Link.TOOL else driven
+    def setResultCache(self, resultCache, context, env):
+        """Set the persistent cache used to store and reuse the check feedback.
 
-            self._links[_driver].append(getattr(linkedObjects[index], driven))
+        Parameters
+        ----------
+        resultCache: AtCache.ResultCache or NoneType
+            The cache to use, or None to disable it.
+        context: str
+            The context of the env this Blueprint belong to.
+        env: str
+            The env this Blueprint belong to.
+        """
+
+        self._resultCache = resultCache
+        self._resultCacheScope = (context, env)
+
+    def setLinkGraph(self, linkGraph):
+        """Set the LinkGraph that schedule the links of this Blueprint.
+
+        Parameters
+        ----------
+        linkGraph: LinkGraph or NoneType
+            The graph of the links of the env this Blueprint belong to, if None the links are run recursively.
+        """
+
+        self._linkGraph = linkGraph
 
     def setProgressbar(self, progressbar):
         """ Called in the ui this method allow to give access to the progress bar for the user
 
         Parameters
         ----------
-        progressbar: QtWidgets.QProgressBar
-            QProgressBar object to connect to the process to display check and fix progression.
+        progressbar: QtWidgets.QProgressBar, AtProgress.ProgressSink or NoneType
+            QProgressBar object to connect to the process to display check and fix progression, None to disconnect it.
+            A sink is used as is, it allow the ui to send the values to the progress bar from another thread.
         """
 
-        self._process._progressbar = progressbar
+        if self._progressbar is not None:
+            self._progress.removeSink(self._progressbar)
+
+        self._progressbar = None
+        if isinstance(progressbar, AtProgress.ProgressSink):
+            self._progressbar = self._progress.addSink(progressbar)
+        elif progressbar is not None:
+            self._progressbar = self._progress.addSink(AtProgress.WidgetSink(progressbar))
 
     def createDocstring(self):
         """Generate the Blueprint doc from Process docstring and data in the `_docFormat_` variable.
@@ -936,15 +2341,24 @@ class Blueprint(object):
             Return the formatted docstring to be more readable and also display the path of the process.
         """
 
-        docstring = self._process.__doc__ or AtConstants.NO_DOCUMENTATION_AVAILABLE
-        docstring += '\n {0} '.format(self.processStr)
+        with AtUtils.PROFILER.profile('createDocstring', self.processStr):
+            if self._processClass is not None:
+                docstring = self._processClass.__doc__
+            else:
+                docstring = self._metadata['docstring']
+
+            docstring = docstring or AtConstants.NO_DOCUMENTATION_AVAILABLE
+            docstring += '\n {0} '.format(self.processStr)
 
-        docFormat = {}
-        for match in re.finditer(r'\{(\w+)\}', docstring):
-            matchStr = match.group(1)
-            docFormat[matchStr] = self._process._docFormat_.get(matchStr, '')
+            # The `_docFormat_` is defined on instance, until the process is created the values are left empty.
+            processDocFormat = self._process._docFormat_ if self._process is not None else {}
 
-        return docstring.format(**docFormat)
+            docFormat = {}
+            for match in re.finditer(r'\{(\w+)\}', docstring):
+                matchStr = match.group(1)
+                docFormat[matchStr] = processDocFormat.get(matchStr, '')
+
+            return docstring.format(**docFormat)
 
     def filterResult(self, result):
         """ Filter the data ouputed by a process to keep only these that is not empty.
@@ -963,6 +2377,11 @@ class Blueprint(object):
 
         filtered_result = []
         for feedback in result:
+            # A Feedback created from Ellipsis have no object but have to be kept to display its title.
+            if isinstance(feedback, Feedback):
+                filtered_result.append(feedback)
+                continue
+
             toDisplay = feedback['toDisplay']
             if not toDisplay:
                 continue
@@ -975,6 +2394,261 @@ class Blueprint(object):
         return filtered_result
 
 
+class LinkGraph(object):
+    """Compiled links of an env, used to validate them and to schedule their execution.
+
+    Each node of the graph is a method of a Blueprint, as a tuple (blueprint index, method name), and each link of the
+    env `register` is an edge from the driver method to the driven one. The graph is built when the blueprints are
+    created so a cycle in the links is detected before anything is run instead of recursing until the stack overflow.
+
+    When a Blueprint method is run, the graph run all the methods it trigger, directly or through other links, as one
+    wave: each method is run only once per wave and only after all the methods of the wave that trigger it.
+    """
+
+    # Order of the methods of a same blueprint when they have no dependency between them.
+    METHODS_ORDER = (AtConstants.CHECK, AtConstants.FIX, AtConstants.TOOL)
+
+    def __init__(self, blueprints):
+        """Compile the links of the given blueprints and check them for cycles.
+
+        Parameters
+        -----------
+        blueprints: list
+            The blueprints of an env, in the env `header` order.
+
+        Raises
+        -------
+        RuntimeError
+            A link target an unknown blueprint or the links contain a cycle.
+        """
+
+        self._blueprints = list(blueprints)
+        self._indexes = {id(blueprint): index for index, blueprint in enumerate(self._blueprints)}
+
+        self._edges = {}
+        for index, blueprint in enumerate(self._blueprints):
+            for link in blueprint.blueprint.get('links', None) or ():
+                target, driver, driven = link
+                if not 0 <= target < len(self._blueprints):
+                    raise RuntimeError('Link {0!r} of "{1}" target an unknown blueprint.'.format(link, blueprint.name))
+
+                targets = self._edges.setdefault((index, driver), [])
+                if (target, driven) not in targets:
+                    targets.append((target, driven))
+
+        self._order = self._sort()
+        self._wave = threading.local()
+
+        for blueprint in self._blueprints:
+            blueprint.setLinkGraph(self)
+
+    def __repr__(self):
+        """Return the representation of the LinkGraph"""
+
+        return '<{0} - {1} node(s), {2} edge(s)>'.format(self.__class__.__name__, len(self._order), len(self.edges))
+
+    def __str__(self):
+        """Return a readable description of each link of the graph"""
+
+        lines = []
+        for (index, driver), (target, driven) in self.edges:
+            lines.append('{0}.{1} -> {2}.{3}'.format(self._blueprints[index].name, driver, self._blueprints[target].name, driven))
+
+        return '\n'.join(lines)
+
+    @property
+    def blueprints(self):
+        """Get the blueprints of the graph"""
+        return self._blueprints
+
+    @property
+    def nodes(self):
+        """Get all the linked methods in topological order, as tuple (blueprint index, method name)"""
+        return list(self._order)
+
+    @property
+    def edges(self):
+        """Get all the links of the graph, as tuple (driver node, driven node)"""
+        return [(node, target) for node in sorted(self._edges, key=self._sortKey) for target in self._edges[node]]
+
+    def getLinks(self, index, method):
+        """Get the nodes directly triggered by the given method of the given blueprint.
+
+        Parameters
+        -----------
+        index: int
+            The index of the blueprint in the env.
+        method: str
+            The name of the method.
+
+        Returns
+        --------
+        list
+            The nodes linked to the given one, as tuple (blueprint index, method name).
+        """
+
+        return list(self._edges.get((index, method), ()))
+
+    def getDownstream(self, index, method):
+        """Get all the nodes triggered by the given method of the given blueprint, directly or through other links.
+
+        Parameters
+        -----------
+        index: int
+            The index of the blueprint in the env.
+        method: str
+            The name of the method.
+
+        Returns
+        --------
+        list
+            The nodes triggered, in the order they would be run.
+        """
+
+        reached = set()
+        toVisit = [(index, method)]
+        while toVisit:
+            for target in self._edges.get(toVisit.pop(), ()):
+                if target not in reached:
+                    reached.add(target)
+                    toVisit.append(target)
+
+        return [node for node in self._order if node in reached]
+
+    def getGroups(self):
+        """Get the indexes of the blueprints connected by links, whatever the direction of the links.
+
+        Returns
+        --------
+        list
+            List of list of blueprints indexes. Each group and the groups are sorted in the env `header` order.
+        """
+
+        parents = list(range(len(self._blueprints)))
+
+        def find(index):
+            while parents[index] != index:
+                parents[index] = parents[parents[index]]
+                index = parents[index]
+            return index
+
+        for (index, _), (target, _) in self.edges:
+            parents[find(target)] = find(index)
+
+        groups = {}
+        for index in range(len(self._blueprints)):
+            groups.setdefault(find(index), []).append(index)
+
+        return sorted(groups.values())
+
+    def run(self, blueprint, method):
+        """Run the methods triggered by the given method of the given blueprint, each one only once.
+
+        The methods are those resolved by `Blueprint.resolveLinks`, they can trigger their own links, these calls are
+        ignored since all the methods downstream of the first one are already scheduled in the current wave.
+
+        Parameters
+        -----------
+        blueprint: Blueprint
+            The blueprint which method have been run.
+        method: str
+            The name of the method that have been run.
+        """
+
+        # A wave is already running in this thread, it already contain all the methods triggered from here.
+        if getattr(self._wave, 'running', False):
+            return
+
+        index = self._indexes.get(id(blueprint), None)
+        if index is None:
+            return
+
+        # Collect the methods reachable through the resolved links, a link that is not resolved stop the propagation.
+        links = {}
+        toVisit = [(index, method)]
+        while toVisit:
+            driverIndex, driver = toVisit.pop()
+            for target, link in self._blueprints[driverIndex]._links.get(driver, ()):
+                if target not in links:
+                    links[target] = link
+                    toVisit.append(target)
+
+        self._wave.running = True
+        try:
+            for node in self._order:
+                if node in links:
+                    links[node]()
+        finally:
+            self._wave.running = False
+
+    def _sort(self):
+        """Sort the nodes in topological order, ties are sorted in the env `header` order.
+
+        Returns
+        --------
+        list
+            All the nodes of the graph.
+
+        Raises
+        -------
+        RuntimeError
+            The links contain a cycle.
+        """
+
+        nodes = set(self._edges)
+        for targets in self._edges.values():
+            nodes.update(targets)
+
+        inDegree = dict.fromkeys(nodes, 0)
+        for targets in self._edges.values():
+            for target in targets:
+                inDegree[target] += 1
+
+        order = []
+        ready = sorted((node for node, degree in inDegree.items() if not degree), key=self._sortKey)
+        while ready:
+            node = ready.pop(0)
+            order.append(node)
+            for target in self._edges.get(node, ()):
+                inDegree[target] -= 1
+                if not inDegree[target]:
+                    ready.append(target)
+            ready.sort(key=self._sortKey)
+
+        if len(order) != len(nodes):
+            cycle = self._findCycle(set(node for node, degree in inDegree.items() if degree))
+            raise RuntimeError('Links contain a cycle: {0}'.format(' -> '.join(
+                '{0}.{1}'.format(self._blueprints[index].name, method) for index, method in cycle
+            )))
+
+        return order
+
+    def _findCycle(self, nodes):
+        """Find a cycle among the given nodes, they must be the nodes left by the topological sort."""
+
+        # Each remaining node have a remaining predecessor, following them backward always end on a cycle.
+        predecessors = {}
+        for node, targets in self._edges.items():
+            for target in targets:
+                if node in nodes and target in nodes:
+                    predecessors.setdefault(target, node)
+
+        path = [min(nodes, key=self._sortKey)]
+        while path.count(path[-1]) < 2:
+            path.append(predecessors[path[-1]])
+
+        cycle = path[path.index(path[-1]):]
+        cycle.reverse()
+
+        return cycle
+
+    def _sortKey(self, node):
+        """Key used to sort the nodes in the env `header` order."""
+
+        index, method = node
+        return (index, self.METHODS_ORDER.index(method) if method in self.METHODS_ORDER else len(self.METHODS_ORDER), method)
+
+
 class Tag(object):
     """Tags are modifiers used by Athena to affect the way a process could be run, through or outside a ui.
     It Allow processes to be optional, non blocking, hide their checks and more.
@@ -1,7 +1,8 @@
-from Athena import AtCore, AtUtils, AtConstants
+from Athena import AtCore, AtUtils, AtProgress, AtConstants
 
 from functools import partial
 
+import contextlib
 import os
 import sys
 import random
@@ -9,11 +10,17 @@ import string
 import traceback
 import webbrowser
 
+import six
+
 # Use PySide2 or PyQt5.
 try: from PySide2 import QtCore, QtGui, QtWidgets
 except: from PyQt5 import QtCore, QtGui, QtWidgets
 finally: __QTBINDING__ = QtCore.__name__.partition('.')[0]
 
+Signal = QtCore.Signal if hasattr(QtCore, 'Signal') else QtCore.pyqtSignal
+
+QWIDGETSIZE_MAX = (1 << 24) - 1
+
 
 class Athena(QtWidgets.QMainWindow):
     """Main ui for Athena, it offer all possible features available from The API and is Available on multiple softwares.
@@ -32,7 +39,7 @@ class Athena(QtWidgets.QMainWindow):
 
     """
 
-    def __init__(self, context=None, env=None, displayMode=AtConstants.AVAILABLE_DISPLAY_MODE[0], dev=False, verbose=False):
+    def __init__(self, context=None, env=None, displayMode=AtConstants.AVAILABLE_DISPLAY_MODE[0], dev=False, verbose=False, virtualized=False):
         """ Initialise the Athena tool by loading ressources, getting register and all other data for ui.
 
         Parameters
@@ -47,6 +54,9 @@ class Athena(QtWidgets.QMainWindow):
             Define the mode used to launch the tool ang give different access to some options. (default: 'user')
         verbose: bool
             Should the tool print informations about its execution. (default: False)
+        virtualized: bool
+            Display the processes in a virtualized ProcessesView instead of creating a widget for each of them, for
+            the envs with a lot of processes. (default: False)
         """
 
         self.parentApplication = getParentApplication()
@@ -57,6 +67,7 @@ class Athena(QtWidgets.QMainWindow):
         self.software = self.register.software
         self.defaultDisplayMode = displayMode if displayMode in AtConstants.AVAILABLE_DISPLAY_MODE else AtConstants.AVAILABLE_DISPLAY_MODE[0]
         self.dev = dev
+        self.virtualized = virtualized
         self.blueprints = {}
 
         self.verbose = verbose
@@ -175,8 +186,8 @@ class Athena(QtWidgets.QMainWindow):
         self.searchAndProgress_QStackedLayout = searchAndProgress_QStackedLayout
         self.mainLayout.addWidget(self.searchAndProgress_QWidget)     
 
-        # -- Process Scroll Area
-        self.processes_ProcessesScrollArea = ProcessesScrollArea(self.register, self.dev, self)
+        # -- Process Scroll Area, or the virtualized view that display the same processes without a widget for each.
+        self.processes_ProcessesScrollArea = (ProcessesView if self.virtualized else ProcessesScrollArea)(self.register, self.dev, self)
         self.processes_ProcessesScrollArea.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
         self.mainLayout.addWidget(self.processes_ProcessesScrollArea)
 
@@ -417,17 +428,25 @@ class Athena(QtWidgets.QMainWindow):
     def getBlueprints(self):
         """ Get the blueprint from the register from current context and env. """
 
-        return  self.register.getBlueprints(self.contexts_QComboBox.currentText(), self.envs_QComboBox.currentText(), forceReload=self.dev)
+        return  self.register.getBlueprints(self.contexts_QComboBox.currentText(), self.envs_QComboBox.currentText(), forceReload=self.dev, lazy=True)
 
 
 # View
 class ProcessView(QtWidgets.QListView):
+    """ Virtualized list of processes, only the visible rows are painted by the ProcessDelegate. """
 
     def __init__(self, parent=None):
         super(ProcessView, self).__init__(parent)
 
+        # All rows have the same height, the view does not have to measure them to layout the list.
+        self.setUniformItemSizes(True)
+        self.setMouseTracking(True)
+        self.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+        self.setSpacing(0)
+
     def paintEvent(self, event):
-        if self.model().rowCount(0):
+        if self.model() is not None and self.model().rowCount():
             return super(ProcessView, self).paintEvent(event)
         
         viewport = self.viewport()
@@ -437,70 +456,695 @@ class ProcessView(QtWidgets.QListView):
 
 # Model
 class ProcessModel(QtCore.QAbstractListModel):
+    """ Model of the processes of an env, each row is a ProcessItem or the name of a category.
 
-    #TODO: https://github.com/trufont/defconQt/blob/master/Lib/defconQt/controls/listView.py (1)
+    The rows are ordered according to the display mode, the items keep the blueprints order to be run.
+    """
+
+    BlueprintRole = QtCore.Qt.UserRole + 1
+    ItemRole = QtCore.Qt.UserRole + 2
 
-    BlueprintRole = QtCore.Qt.UserRole + 1 #TODO: Think about an eventual refacto.
+    feedbackChanged = Signal(object)
 
-    def __init__(self, data=None, parent=None):
+    def __init__(self, parent=None):
         super(ProcessModel, self).__init__(parent)
 
-        self._data = data or {}
+        self.displayMode = AtConstants.AVAILABLE_DISPLAY_MODE[0]
+
+        self._items = []
+        self._rows = []
+        self._rowByItem = {}
 
-    def data(self, index, role=QtCore.Qt.DisplayRole):
-        
-        if index.isValid():
-            if role == QtCore.Qt.DisplayRole:
-                return 'index.internalPointer.blueprint()'
+    @property
+    def items(self):
+        """ Get the ProcessItems of the model, in the blueprints order. """
+        return self._items
 
-            if role == self.BlueprintRole:
-                return self._data
+    def setItems(self, items):
+        """ Replace all the items of the model. """
 
-    def setData(self, index, value, role):
+        self.beginResetModel()
+        self._items = list(items)
+        self.buildRows()
+        self.endResetModel()
 
-        if role == self.BlueprintRole:
-            self._data = value
-            self.dataChanged.emit(index, index, [self.BlueprintRole])
+    def setDisplayMode(self, displayMode):
+        """ Order the rows by blueprint order, category or alphabetically. (see `AtConstants.AVAILABLE_DISPLAY_MODE`) """
 
-    def flags(self, index):
-        default_flags = super(ProcessModel, self).flags(index)
+        self.beginResetModel()
+        self.displayMode = displayMode
+        self.buildRows()
+        self.endResetModel()
 
+    def buildRows(self):
+        """ Build the rows from the items according to the display mode. """
+
+        mode = self.displayMode
+
+        if mode == AtConstants.AVAILABLE_DISPLAY_MODE[1]:
+            categories = []
+            orderedByCategory = {}
+            for item in self._items:
+                category = item.blueprint.category
+                if category not in orderedByCategory:
+                    categories.append(category)
+                    orderedByCategory[category] = []
+                orderedByCategory[category].append(item)
+
+            rows = []
+            for category in categories:
+                rows.append('{0}'.format(category))
+                rows.extend(orderedByCategory[category])
+
+        elif mode == AtConstants.AVAILABLE_DISPLAY_MODE[2]:
+            rows = sorted(self._items, key=lambda item: item.blueprint.name)
+
+        else:
+            rows = list(self._items)
+
+        self._rows = rows
+        self._rowByItem = {id(row): index for index, row in enumerate(rows) if isinstance(row, ProcessItem)}
+
+    def indexOf(self, item):
+        """ Get the model index of the given ProcessItem. """
+
+        row = self._rowByItem.get(id(item), None)
+        if row is None:
+            return QtCore.QModelIndex()
+
+        return self.index(row, 0)
+
+    def refresh(self, item=None):
+        """ Notify the view that the given item changed, all the rows are refreshed if None. """
+
+        if item is None:
+            if self._rows:
+                self.dataChanged.emit(self.index(0, 0), self.index(len(self._rows) - 1, 0))
+            return
+
+        index = self.indexOf(item)
         if index.isValid():
-            return QtCore.Qt.ItemIsEnabled | default_flags
+            self.dataChanged.emit(index, index)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
 
-        return default_flags
+        if not index.isValid():
+            return None
 
-    def index(self, row, column, parent=QtCore.QModelIndex()):
-        
-        if parent.isValid():
-            return self.createIndex(row, column, parent.internalPointer().children[row])
-        
-        return self.createIndex(row, column, self._data.get(row, 0))
+        row = self._rows[index.row()]
+
+        # Categories only have a name to display.
+        if not isinstance(row, ProcessItem):
+            return row if role == QtCore.Qt.DisplayRole else None
+
+        if role == QtCore.Qt.DisplayRole:
+            return row.name
+        elif role == QtCore.Qt.ToolTipRole:
+            return row.blueprint._docstring
+        elif role == QtCore.Qt.CheckStateRole:
+            return QtCore.Qt.Checked if row.checked else QtCore.Qt.Unchecked
+        elif role == self.ItemRole:
+            return row
+        elif role == self.BlueprintRole:
+            return row.blueprint
+
+        return None
+
+    def setData(self, index, value, role=QtCore.Qt.EditRole):
+
+        if not index.isValid() or role != QtCore.Qt.CheckStateRole:
+            return False
+
+        row = self._rows[index.row()]
+        if not isinstance(row, ProcessItem):
+            return False
+
+        row.checked = value == QtCore.Qt.Checked
+        self.dataChanged.emit(index, index)
+
+        return True
+
+    def flags(self, index):
+        default_flags = super(ProcessModel, self).flags(index)
 
-    def columnCount(self, index):
-        return 1
+        if index.isValid() and isinstance(self._rows[index.row()], ProcessItem):
+            return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsUserCheckable | default_flags
 
-    def rowCount(self, index):
-        return len(self._data)
+        return QtCore.Qt.ItemIsEnabled
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
 
 
 # Delegate
 class ProcessDelegate(QtWidgets.QStyledItemDelegate):
+    """ Paint the ProcessItems like the ProcessWidgets and run their methods when their buttons are clicked. """
+
+    ROW_HEIGHT = 26  # The ProcessWidget height and the layout spacing.
+
+    ICON_SIZE = 15
+
+    BUTTON_WIDTH = 25
+
+    ACTIONS = {AtConstants.CHECK: 'execCheck', AtConstants.FIX: 'execFix', AtConstants.TOOL: 'execTool'}
 
     def __init__(self, parent=None, *args):
         super(ProcessDelegate, self).__init__(parent, *args)
 
+        resourcesManager = AtUtils.RessourcesManager(__file__, backPath='..{0}ressources'.format(os.sep), key=AtConstants.PROGRAM_NAME)
+        self.icons = {
+            name: resourcesManager.get('{0}.png'.format(name), AtConstants.PROGRAM_NAME, QtGui.QIcon)
+            for name in (AtConstants.CHECK, AtConstants.FIX, AtConstants.TOOL, 'help', 'right-arrow', 'bottom-arrow')
+        }
+
+        self.categoryFont = QtGui.QFont()
+        self.categoryFont.setPointSize(11)
+        self.categoryFont.setBold(True)
+
+    def sizeHint(self, option, index):
+        return QtCore.QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    def getRects(self, rect, item):
+        """ Get the rect of each part of a row, the buttons that are not available for the item are not returned. """
+
+        size = self.ICON_SIZE
+        top = rect.top() + (rect.height() - size) // 2
+
+        rects = {
+            'enable': QtCore.QRect(rect.left() + 5, top, size, size),
+            'arrow': QtCore.QRect(rect.left() + 25, top, size, size),
+        }
+
+        # The buttons are aligned on the right, in the same order than in the ProcessWidget.
+        right = rect.right() - 5
+        for name, isVisible in (('help', True), (AtConstants.CHECK, item.isCheckable), (AtConstants.FIX, item.isFixVisible), (AtConstants.TOOL, item.hasTool)):
+            if not isVisible:
+                continue
+            right -= self.BUTTON_WIDTH
+            rects[name] = QtCore.QRect(right + (self.BUTTON_WIDTH - size) // 2, top, size, size)
+
+        rects['name'] = QtCore.QRect(rect.left() + 45, rect.top(), right - rect.left() - 45, rect.height())
+
+        return rects
+
     def paint(self, painter, option, index):
 
+        item = index.data(ProcessModel.ItemRole)
+        widget = option.widget
+        style = widget.style() if widget is not None else QtWidgets.QApplication.style()
+
         painter.save()
+        try:
+            if item is None:
+                painter.setFont(self.categoryFont)
+                painter.drawText(option.rect, QtCore.Qt.AlignCenter | QtCore.Qt.AlignBottom, index.data(QtCore.Qt.DisplayRole))
+                return
 
-        itemData = index.data(QtCore.Qt.UserRole + 1)[index.row()]
-        
-        painter.setFont(QtGui.QFont('Cantarell', 10, QtGui.QFont.Bold))
+            rect = option.rect.adjusted(0, 0, 0, -1)
+
+            color = item.status.color
+            if option.state & QtWidgets.QStyle.State_MouseOver:
+                color = color.lighter(125)
+            painter.fillRect(rect, color)
+
+            # While it run, the row only display the progress of the process.
+            if item.isRunning:
+                progress = QtWidgets.QStyleOptionProgressBar()
+                progress.rect = rect
+                progress.minimum = 0
+                progress.maximum = 100
+                progress.progress = int(item.progressValue)
+                progress.text = AtConstants.PROGRESSBAR_FORMAT.format(item.progressText or item.name).replace('%p', str(progress.progress))
+                progress.textVisible = True
+                progress.textAlignment = QtCore.Qt.AlignLeft
+                style.drawControl(QtWidgets.QStyle.CE_ProgressBar, progress, painter, widget)
+                return
+
+            rects = self.getRects(rect, item)
+
+            radio = QtWidgets.QStyleOptionButton()
+            radio.rect = rects['enable']
+            radio.state = QtWidgets.QStyle.State_Enabled | (QtWidgets.QStyle.State_On if item.checked else QtWidgets.QStyle.State_Off)
+            style.drawPrimitive(QtWidgets.QStyle.PE_IndicatorRadioButton, radio, painter, widget)
+
+            self.icons['bottom-arrow' if item.isOpened else 'right-arrow'].paint(painter, rects['arrow'])
+
+            painter.setPen(option.palette.color(QtGui.QPalette.Text))
+            painter.drawText(rects['name'], QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter, item.name)
+
+            for name in (AtConstants.TOOL, AtConstants.FIX, AtConstants.CHECK, 'help'):
+                if name in rects:
+                    self.icons[name].paint(painter, rects[name])
+
+        finally:
+            painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+
+        item = index.data(ProcessModel.ItemRole)
+        if item is None or item.isRunning or event.type() != QtCore.QEvent.MouseButtonRelease:
+            return super(ProcessDelegate, self).editorEvent(event, model, option, index)
+
+        toggle = QtCore.Qt.Unchecked if item.checked else QtCore.Qt.Checked
+
+        if event.button() == QtCore.Qt.RightButton:
+            return model.setData(index, toggle, QtCore.Qt.CheckStateRole)
+
+        if event.button() != QtCore.Qt.LeftButton:
+            return super(ProcessDelegate, self).editorEvent(event, model, option, index)
+
+        for name, rect in self.getRects(option.rect.adjusted(0, 0, 0, -1), item).items():
+            if not rect.adjusted(-5, -5, 5, 5).contains(event.pos()):
+                continue
+
+            if name == 'enable':
+                return model.setData(index, toggle, QtCore.Qt.CheckStateRole)
+
+            elif name in self.ACTIONS:
+                getattr(item, self.ACTIONS[name])()
+                return True
+
+        return super(ProcessDelegate, self).editorEvent(event, model, option, index)
+
+    def helpEvent(self, event, view, option, index):
+
+        item = index.data(ProcessModel.ItemRole)
+        if item is None or event.type() != QtCore.QEvent.ToolTip:
+            return super(ProcessDelegate, self).helpEvent(event, view, option, index)
+
+        tooltips = {
+            'help': item.blueprint._docstring,
+            AtConstants.CHECK: 'Run "{0}" check'.format(item.name),
+            AtConstants.FIX: 'Run "{0}" fix'.format(item.name),
+            AtConstants.TOOL: 'Launch "{0}" tool'.format(item.name),
+        }
+
+        for name, rect in self.getRects(option.rect.adjusted(0, 0, 0, -1), item).items():
+            if name in tooltips and rect.contains(event.pos()):
+                QtWidgets.QToolTip.showText(event.globalPos(), tooltips[name], view)
+                return True
+
+        QtWidgets.QToolTip.hideText()
+        return True
+
+
+class ProcessItem(object):
+    """ State of a blueprint displayed in the ProcessView, it replace the ProcessWidget without creating any widget.
+
+    It implement the same `execCheck`, `execFix` and `execTool` methods so the blueprints links can be resolved on it.
+    """
+
+    def __init__(self, blueprint, model, window=None):
+        """ Initialise the item from a blueprint.
+
+        parameters:
+        -----------
+        blueprint: AtCore.Blueprint
+            A Athena Blueprint that will be drived through ui.
+        model: ProcessModel
+            The model that display this item.
+        window: QWidget
+            The window to parent the tools to.
+        """
+
+        self.blueprint = blueprint
+        self.model = model
+        self.window = window
+
+        self.isCheckable = blueprint._isCheckable
+        self.isFixable = blueprint._isFixable
+        self.hasTool = blueprint._hasTool
+        self.isNonBlocking = blueprint._isNonBlocking
+
+        self.checked = blueprint._isEnabled
+        self.status = Status.DEFAULT
+        self.feedback = None
+        self.isOpened = False
+        self.isFixVisible = False
+
+        self.isRunning = False
+        self.progressValue = 0
+        self.progressText = None
+
+        self.runner = getRunner()
+
+        self._progressSink = blueprint.progress.addSink(QueuedProgressSink(ModelProgressSink(self)))
+
+    def __repr__(self):
+        return "<{0} '{1}' - {2}>".format(self.__class__.__name__, self.name, self.status.__name__)
+
+    @property
+    def name(self):
+        """ Get the blueprint name, a lazy blueprint only get its process name once it is instantiated. """
+        return self.blueprint.name
+
+    def release(self):
+        """ Disconnect the item from its blueprint progress. """
+
+        self.blueprint.progress.removeSink(self._progressSink)
+
+    def isChecked(self):
+        """ Return Wheter the item is checked or not. """
+        return self.checked
+
+    def setChecked(self, state):
+        """ Check the item """
+
+        self.checked = state
+        self.model.refresh(self)
+
+    def execCheck(self):
+        """ Run the `check` method of the Blueprint's Process and update the item status and feedback. """
+
+        try:
+            result, state = self.execute(AtConstants.CHECK)
+
+            if state:
+                self.status = Status.WARNING if self.isNonBlocking else Status.ERROR  # There is warning(s) or error(s).
+                self.setFeedback(result)
+                self.isFixVisible = self.isFixable
+            else:
+                self.status = Status.SUCCESS # The process succeed.
+                self.setFeedback(None)
+                self.isFixVisible = False
+
+        except AtCore.ProcessCancelled:
+            self.status = Status.DEFAULT  # The process have been interrupted by the user.
+            self.setFeedback(None)
+
+        except Exception:
+            self.status = Status.EXCEPTION  # The process encounter an exception during it's execution.
+            self.setFeedback(traceback.format_exc().rstrip())
+            traceback.print_exc()
 
-        painter.drawText(option.rect.adjusted(0, option.rect.height(), option.rect.width(), option.rect.height()), itemData[0])
+        self.model.refresh(self)
+
+    def execFix(self):
+        """ Run the `fix` method of the Blueprint's Process, then launch the `execCheck` to update the item. """
+
+        try:
+            self.execute(AtConstants.FIX)
+
+        except AtCore.ProcessCancelled:
+            self.status = Status.DEFAULT  # The process have been interrupted by the user.
+            self.setFeedback(None)
+            return self.model.refresh(self)
+
+        except Exception:
+            self.status = Status.EXCEPTION  # The process encounter an exception during it's execution.
+            self.setFeedback(traceback.format_exc().rstrip())
+            traceback.print_exc()
+            return self.model.refresh(self)
+
+        # After a fix, re-launch a check to ensure everything is clean.
+        self.execCheck()
+
+    def execTool(self):
+        """ Run the `tool` method of the Blueprint's Process and show the returned widget. """
+
+        try:
+            result = self.execute(AtConstants.TOOL)
+
+            if result is not None and hasattr(result, 'show'):
+                result.setParent(self.window, QtCore.Qt.Window)
+                result.show()
+
+        except AtCore.ProcessCancelled:
+            pass  # The tool have been interrupted by the user.
+
+        except Exception:
+            self.status = Status.EXCEPTION  # The process encounter an exception during it's execution.
+            self.setFeedback(traceback.format_exc().rstrip())
+            traceback.print_exc()
+            self.model.refresh(self)
+
+    def execute(self, method):
+        """ Run the given method of the blueprint, the row display the progress while it run. """
+
+        self.isRunning = True
+        self.progressValue = 0
+        self.progressText = None
+        self.model.refresh(self)
+
+        try:
+            return self.runner.run(self.blueprint, method, window=self.window)
+        finally:
+            self.isRunning = False
+            self.model.refresh(self)
+
+    def setFeedback(self, value):
+        """ Store the feedback or the traceback of the last execution and notify the model. """
+
+        self.feedback = value
+        self.model.feedbackChanged.emit(self)
+
+
+class ModelProgressSink(AtProgress.ProgressSink):
+    """ Display the progress of a blueprint in its row of the ProcessView. """
+
+    def __init__(self, item):
+        self.item = item
+
+    def update(self, name, value, text):
+        self.item.progressValue = value
+        if text:
+            self.item.progressText = text
+
+        self.item.model.refresh(self.item)
+
+
+class QueuedProgressSink(QtCore.QObject, AtProgress.ProgressSink):
+    """ Send the progress to a sink in the main thread, the BlueprintRunner can run the processes in a worker thread.
+
+    The values reported from another thread are sent through a queued signal. Those reported from the main thread, by a
+    process that run in it, are sent directly and the events are processed so the widgets are repainted and [ESCAPE]
+    is received, the rest of the user input is discarded by the BlueprintRunner while it runs. (see `InputBlocker`)
+    """
+
+    updated = Signal(object, object, object)
+
+    def __init__(self, sink):
+        super(QueuedProgressSink, self).__init__()
+
+        self.sink = sink
+
+        self.updated.connect(self.send, QtCore.Qt.QueuedConnection)
+
+    def update(self, name, value, text):
+
+        if QtCore.QThread.currentThread() != self.thread():
+            self.updated.emit(name, value, text)
+            return
+
+        self.send(name, value, text)
+        QtWidgets.QApplication.processEvents()
+
+    def send(self, name, value, text):
+        """ Send the progress to the sink, always called in the main thread. """
+
+        self.sink.update(name, value, text)
+
+
+class BlueprintTask(QtCore.QRunnable):
+    """ Run a method of a blueprint in a thread of the BlueprintRunner pool, `done` is emitted when it is over. """
+
+    class Signals(QtCore.QObject):
+        done = Signal()
+
+    def __init__(self, blueprint, method):
+        super(BlueprintTask, self).__init__()
+
+        self.setAutoDelete(False)  # The task is kept by the runner until its result is read.
+
+        self.blueprint = blueprint
+        self.method = method
+
+        self.result = None
+        self.excInfo = None
+
+        self.signals = self.Signals()
+
+    def run(self):
+
+        try:
+            # The links trigger the methods of other widgets, they are run by the runner in the main thread.
+            self.result = getattr(self.blueprint, self.method)(links=False)
+        except BaseException:
+            self.excInfo = sys.exc_info()
+        finally:
+            self.signals.done.emit()
+
+
+class InputBlocker(QtCore.QObject):
+    """ Event filter that discard the user input, except [ESCAPE], sent to the busy windows of the BlueprintRunner.
+
+    The events are processed during a run to repaint the ui and receive [ESCAPE], without it a click could start
+    another run, switch the env or close the window before the running process returns.
+    The filter is installed on the application to also reach the widgets created during the run (e.g. the lazy
+    process widgets), but only the input sent to a busy window or to one of its children is discarded, the host
+    software stays usable.
+    """
+
+    BLOCKED_EVENTS = frozenset((
+        QtCore.QEvent.MouseButtonPress,
+        QtCore.QEvent.MouseButtonRelease,
+        QtCore.QEvent.MouseButtonDblClick,
+        QtCore.QEvent.Wheel,
+        QtCore.QEvent.KeyPress,
+        QtCore.QEvent.KeyRelease,
+        QtCore.QEvent.ShortcutOverride,
+        QtCore.QEvent.Shortcut,
+        QtCore.QEvent.ContextMenu,
+        QtCore.QEvent.Close,
+    ))
+
+    KEY_EVENTS = frozenset((QtCore.QEvent.KeyPress, QtCore.QEvent.KeyRelease, QtCore.QEvent.ShortcutOverride))
+
+    def __init__(self, parent=None):
+        super(InputBlocker, self).__init__(parent)
+
+        self.windows = []
+
+    def isBlocked(self, watched):
+        """ Get if the given object is one of the busy windows or one of their children, at any level. """
+
+        while watched is not None:
+            if any(watched is window for window in self.windows):
+                return True
+            watched = watched.parent()
+
+        return False
+
+    def eventFilter(self, watched, event):
+        eventType = event.type()
+        if eventType not in self.BLOCKED_EVENTS or not self.isBlocked(watched):
+            return False
+
+        if eventType in self.KEY_EVENTS and event.key() == QtCore.Qt.Key_Escape:
+            return False
+
+        if eventType == QtCore.QEvent.Close:
+            # Only the window manager close request come from the user, the code can still close its widgets.
+            if not event.spontaneous():
+                return False
+            event.ignore()
+
+        return True
 
-        painter.restore()
+
+class BlueprintRunner(QtCore.QObject):
+    """ Execution backend of the ui, run the blueprints methods in a QThreadPool to keep the ui responsive.
+
+    `run` wait for the method in a local event loop, so the ui is repainted, display the progress sent through the
+    QueuedProgressSinks and receive [ESCAPE] while the process run, and then return its value or raise its exception
+    in the main thread like a direct call. The widgets are only updated in the main thread and the process can be
+    cancelled, it will stop the next time it poll its token. (see `AtCore.Blueprint.cancel`)
+    While the runner is busy the user input sent to the running window, except [ESCAPE], is discarded so a run can not
+    be started, or the window closed, in the middle of another one. (see `InputBlocker`)
+
+    Most of the softwares API can only be used from the main thread, so the blueprints are run directly in the main
+    thread unless they have the `threaded` option, the tools, that create widgets, are always run in the main thread.
+    """
+
+    def __init__(self, workers=AtConstants.UI_WORKERS, parent=None):
+        super(BlueprintRunner, self).__init__(parent)
+
+        self.pool = QtCore.QThreadPool(self)
+        self.pool.setMaxThreadCount(workers)
+
+        self._inputBlocker = InputBlocker(self)
+
+    @property
+    def isBusy(self):
+        """ Get if a run is in progress, the user input of its window is blocked until it ends. """
+        return bool(self._inputBlocker.windows)
+
+    @contextlib.contextmanager
+    def busy(self, window):
+        """ Block the user input of the window, except [ESCAPE], while the instructions under the context statement run.
+
+        The contexts can be nested, the input is only released when the outermost one exits.
+
+        parameters:
+        -----------
+        window: QWidget
+            The widget whose input, and the input of all its children, is blocked. Nothing is blocked if it is None.
+        """
+
+        if window is None:
+            yield
+            return
+
+        windows = self._inputBlocker.windows
+        if not windows:
+            QtWidgets.QApplication.instance().installEventFilter(self._inputBlocker)
+        windows.append(window)
+
+        try:
+            yield
+        finally:
+            windows.remove(window)
+            if not windows:
+                QtWidgets.QApplication.instance().removeEventFilter(self._inputBlocker)
+
+    def isThreaded(self, blueprint, method):
+        """ Get if the given method of the blueprint can be run in a worker thread. """
+        return method != AtConstants.TOOL and blueprint._options.get('threaded', False)
+
+    def run(self, blueprint, method, links=True, window=None):
+        """ Run the given method of the blueprint and wait for its result while the ui events are processed.
+
+        parameters:
+        -----------
+        blueprint: AtCore.Blueprint
+            The blueprint to run.
+        method: str
+            The name of the blueprint method to run. (check, fix or tool)
+        links: bool
+            Should the runner launch the connected links or not, they are always run in the main thread.
+        window: QWidget
+            The window that launched the run, its user input is blocked until the run ends.
+
+        return:
+        -------
+        type
+            The value returned by the blueprint method.
+        """
+
+        if not self.isThreaded(blueprint, method):
+            with self.busy(window), BusyCursor():
+                return getattr(blueprint, method)(links=links)
+
+        task = BlueprintTask(blueprint, method)
+
+        loop = QtCore.QEventLoop()
+        task.signals.done.connect(loop.quit, QtCore.Qt.QueuedConnection)
+
+        with self.busy(window):
+            with BusyCursor(QtCore.Qt.BusyCursor):
+                self.pool.start(task)
+                loop.exec_()
+
+            if task.excInfo is not None:
+                six.reraise(*task.excInfo)
+
+            if links:
+                blueprint.runLinks(method)
+
+        return task.result
+
+
+_RUNNER = None
+
+def getRunner():
+    """ Get the BlueprintRunner shared by all the widgets, it is created the first time it is needed. """
+
+    global _RUNNER
+
+    if _RUNNER is None:
+        _RUNNER = BlueprintRunner()
+
+    return _RUNNER
 
 
 class Status(object):
@@ -618,6 +1262,9 @@ class ProcessWidget(QtWidgets.QWidget):
 
         self.status = Status.DEFAULT
         self.isOpened = False
+        self.isRunning = False
+
+        self.runner = getRunner()
 
         self._feedback = None
 
@@ -756,8 +1403,11 @@ class ProcessWidget(QtWidgets.QWidget):
         # -- Check PushButton
         self.check_QPushButton.clicked.connect(self.execCheck)
 
-        # -- Connect the progressbar to the process _progressbar attribute.
-        self.blueprint.setProgressbar(self.progressbar_QProgressBar)
+        # -- Result Widget
+        self.result_QListWidget.contentSizeChanged.connect(self.resizeTraceback)
+
+        # -- Connect the progressbar to the blueprint progress reporter, the values are sent from the runner thread.
+        self.blueprint.setProgressbar(QueuedProgressSink(AtProgress.WidgetSink(self.progressbar_QProgressBar)))
 
     def enterEvent(self, event):
         """ Event handled by Qt to manage mouse enter event and lighter the widget color.
@@ -867,10 +1517,16 @@ class ProcessWidget(QtWidgets.QWidget):
             return
         self.name_QLabel.setIcon(self.resourcesManager.get('bottom-arrow.png', AtConstants.PROGRAM_NAME, QtGui.QIcon))
         self.isOpened = True
-        self.setFixedHeight(45 + self.result_QListWidget.getContentSize().height())
+        self.resizeTraceback()
 
         self.result_QListWidget.setVisible(self.isOpened)
 
+    def resizeTraceback(self):
+        """ Resize the widget to the content of the traceback widget, when it is opened. (see `TracebackList.getContentSize`) """
+
+        if self.isOpened:
+            self.setFixedHeight(45 + self.result_QListWidget.getContentSize().height())
+
     def closeTraceback(self):
         """ Hide the traceback widget and change the displayed arrow shape. """
 
@@ -904,6 +1560,29 @@ class ProcessWidget(QtWidgets.QWidget):
 
         self.enable_QCheckBox.setChecked(state)
 
+    def getState(self):
+        """ Get the state of the widget, to restore it on another ProcessWidget of the same blueprint. (see `setState`) """
+
+        return {
+            'checked': self.isChecked(),
+            'status': self.status,
+            'feedback': self._feedback,
+            'isOpened': self.isOpened,
+        }
+
+    def setState(self, state):
+        """ Restore the state returned by `getState`. """
+
+        self.setChecked(state['checked'])
+        self.status = state['status']
+        self.feedback = state['feedback']
+        self.fix_QPushButton.setVisible(self.isFixable and self.status in (Status.WARNING, Status.ERROR))
+
+        if not state['isOpened']:
+            self.closeTraceback()
+
+        self.leaveEvent(None)
+
     def execCheck(self):
         """ Run the `check` method of the Blueprint's Process.
 
@@ -911,9 +1590,9 @@ class ProcessWidget(QtWidgets.QWidget):
         Handle any Exception to switch the ProcessWidget state to 'Exception' and log the Exception's feedback in it.
         """
 
-        with self.ExecContext(self), BusyCursor():
+        with self.ExecContext(self):
             try:
-                result, state = self.blueprint.check()
+                result, state = self.runner.run(self.blueprint, AtConstants.CHECK, window=self.window)
                     #TODO: Why this ?
 
                 if state:
@@ -928,6 +1607,10 @@ class ProcessWidget(QtWidgets.QWidget):
                     self.feedback = None
                     self.fix_QPushButton.setVisible(False)
 
+            except AtCore.ProcessCancelled:
+                self.status = Status.DEFAULT  # The process have been interrupted by the user.
+                self.feedback = None
+
             except Exception as error:
                 self.status = Status.EXCEPTION  # The process encounter an exception during it's execution.
                 self.feedback = traceback.format_exc(error).rstrip() #TODO: Test another way
@@ -941,9 +1624,14 @@ class ProcessWidget(QtWidgets.QWidget):
         Then, launch the `execCheck` method to catch any other error to update the ProcessWidget.
         """
 
-        with self.ExecContext(self), BusyCursor():
+        with self.ExecContext(self):
             try:
-                result = self.blueprint.fix()
+                result = self.runner.run(self.blueprint, AtConstants.FIX, window=self.window)
+
+            except AtCore.ProcessCancelled:
+                self.status = Status.DEFAULT  # The process have been interrupted by the user.
+                self.feedback = None
+                return
 
             except Exception as error:
                 self.status = Status.EXCEPTION  # The process encounter an exception during it's execution.
@@ -962,14 +1650,17 @@ class ProcessWidget(QtWidgets.QWidget):
         Exception's feedback in it.
         """
 
-        with self.ExecContext(self), BusyCursor():
+        with self.ExecContext(self):
             try:
-                result = self.blueprint.tool()
+                result = self.runner.run(self.blueprint, AtConstants.TOOL, window=self.window)
 
                 if result is not None and hasattr(result, 'show'):
                     result.setParent(self.window, QtCore.Qt.Window)
                     result.show()
 
+            except AtCore.ProcessCancelled:
+                pass  # The tool have been interrupted by the user.
+
             except Exception as error:
                 self.status = Status.EXCEPTION  # The process encounter an exception during it's execution.
                 self.feedback = traceback.format_exc(error).rstrip() #TODO: Test another way
@@ -983,32 +1674,440 @@ class ProcessWidget(QtWidgets.QWidget):
         def __enter__(self):
             self.instance.leaveEvent(None)
 
+            self.instance.isRunning = True
             self.instance.header_QStackedLayout.setCurrentIndex(1)
             self.instance.progressbar_QProgressBar.setValue(0)
 
         def __exit__(self, exception_type, exception_value, traceback):
             
+            self.instance.isRunning = False
             self.instance.header_QStackedLayout.setCurrentIndex(0)
 
+            # The process may have been instantiated during the execution, its docstring can now be formatted.
+            self.instance.docstring = self.instance.blueprint._docstring
+            self.instance.help_QPushButton.setToolTip(self.instance.docstring)
+
             if self.instance.underMouse():
                 self.instance.enterEvent(None)
             else:
                 self.instance.leaveEvent(None)
 
 
-class TracebackList(QtWidgets.QTreeWidget):
-
-    def __init__(self, parent):
-        super(TracebackList, self).__init__(parent)
-
-        self.parent = parent
+class ProcessPlaceholder(QtWidgets.QWidget):
+    """ Row of the ProcessesScrollArea that only build its ProcessWidget when it is scrolled into view.
 
-        self.resourcesManager = AtUtils.RessourcesManager(__file__, backPath='..{0}ressources'.format(os.sep), key=AtConstants.PROGRAM_NAME)
+    The placeholder has the height of a closed ProcessWidget until it is built, and keep the height of its widget when
+    it is released, so the scroll area does not jump. It store the state of the widget (check state, status and
+    feedback) while it is released and give the same api than the ProcessWidget to the scroll area and the links,
+    building the widget when it have to run the process.
+    """
 
-        self.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+    def __init__(self, blueprint, parent, window=None):
+        """ Initialise the placeholder from a blueprint, the ProcessWidget is not built.
 
-        self.itemExpanded.connect(self.expand)
-        self.itemCollapsed.connect(self.collapse)
+        parameters:
+        -----------
+        blueprint: AtCore.Blueprint
+            A Athena Blueprint that will be drived through ui.
+        parent: QWidget
+            The QWidget parent of this widget.
+        window: QWidget
+            The window to parent the tools to.
+        """
+
+        super(ProcessPlaceholder, self).__init__(parent)
+
+        self.parent = parent
+        self.window = window or parent
+
+        self.blueprint = blueprint
+        self.name = blueprint._name
+        self.isCheckable = blueprint._isCheckable
+        self.isFixable = blueprint._isFixable
+
+        self.widget = None
+        self.state = {'checked': blueprint._isEnabled, 'status': Status.DEFAULT, 'feedback': None, 'isOpened': False}
+
+        self.mainLayout = QtWidgets.QVBoxLayout(self)
+        self.mainLayout.setContentsMargins(0, 0, 0, 0)
+        self.mainLayout.setSpacing(0)
+
+        self.setAutoFillBackground(True)
+        self.setFixedHeight(25)
+        self.leaveEvent(None)
+
+    @property
+    def isBuilt(self):
+        """ Get if the ProcessWidget of the placeholder is built. """
+        return self.widget is not None
+
+    @property
+    def status(self):
+        """ Get the status of the ProcessWidget, or the one it had when it was released. """
+        return self.widget.status if self.widget is not None else self.state['status']
+
+    def build(self):
+        """ Build the ProcessWidget and restore its state, the placeholder now follow the widget height. """
+
+        if self.widget is not None:
+            return self.widget
+
+        with AtUtils.PROFILER.profile('ProcessWidget', self.blueprint.processStr):
+            self.widget = ProcessWidget(self.blueprint, parent=self, window=self.window)
+            self.widget.setState(self.state)
+
+        self.setMinimumHeight(0)
+        self.setMaximumHeight(QWIDGETSIZE_MAX)
+        self.mainLayout.addWidget(self.widget)
+
+        return self.widget
+
+    def release(self):
+        """ Store the state of the ProcessWidget and delete it, unless its process is running. """
+
+        widget = self.widget
+        if widget is None or widget.isRunning:
+            return
+
+        self.state = widget.getState()
+        self.setFixedHeight(widget.height())
+
+        self.blueprint.setProgressbar(None)
+        self.mainLayout.removeWidget(widget)
+        widget.setParent(None)
+        widget.deleteLater()
+        self.widget = None
+
+        self.leaveEvent(None)
+
+    def leaveEvent(self, event):
+
+        if self.widget is not None:
+            return self.widget.leaveEvent(event)
+
+        palette = self.palette()
+        palette.setColor(palette.Background, self.state['status'].color)
+        self.setPalette(palette)
+
+    def isChecked(self):
+        """ Return Wheter the process is checked or not. """
+        return self.widget.isChecked() if self.widget is not None else self.state['checked']
+
+    def setChecked(self, state):
+        """ Check the process """
+
+        if self.widget is not None:
+            self.widget.setChecked(state)
+        else:
+            self.state['checked'] = state
+
+    def execCheck(self):
+        """ Build the ProcessWidget and run its check. """
+        self.build().execCheck()
+
+    def execFix(self):
+        """ Build the ProcessWidget and run its fix. """
+        self.build().execFix()
+
+    def execTool(self):
+        """ Build the ProcessWidget and run its tool. """
+        self.build().execTool()
+
+
+class FeedbackModel(QtCore.QAbstractItemModel):
+    """ Model of the feedback of a process, each feedback is a top level row and its objects are its children.
+
+    The objects are only added to the model by pages, through the Qt incremental loading (`canFetchMore` and
+    `fetchMore`) that the view use when a feedback is expanded, and their display string is only created when a row
+    is painted, so a feedback with millions of objects cost the same as a small one to open.
+    The rows of a collapsed feedback are removed. While some objects are not loaded, a `Show more...` row is added
+    after the children to fetch the next page.
+    """
+
+    SelectionRole = QtCore.Qt.UserRole
+
+    MoreRole = QtCore.Qt.UserRole + 1
+
+    FeedbackRole = QtCore.Qt.UserRole + 2
+
+    def __init__(self, parent=None):
+        super(FeedbackModel, self).__init__(parent)
+
+        self._feedback = []
+        self._loaded = []
+        self._hasMore = []
+        self._lines = None
+
+    @property
+    def isException(self):
+        """ Get if the model display the lines of a traceback instead of a feedback. """
+        return self._lines is not None
+
+    def setFeedback(self, feedback):
+        """ Display the given feedback, a list of feedback as returned by `AtCore.Blueprint.check`. """
+
+        self.beginResetModel()
+
+        self._feedback = list(feedback)
+        self._loaded = [0] * len(self._feedback)
+        self._hasMore = [False] * len(self._feedback)
+        self._lines = None
+
+        # The first chunk of the streams is read to display their count.
+        for each in self._feedback:
+            toDisplay = each['toDisplay']
+            if isinstance(toDisplay, AtCore.FeedbackStream) and not toDisplay.count:
+                toDisplay.read()
+
+        self.endResetModel()
+
+    def setException(self, lines):
+        """ Display the given lines of a traceback. """
+
+        self.beginResetModel()
+
+        self._feedback = []
+        self._loaded = []
+        self._hasMore = []
+        self._lines = list(lines)
+
+        self.endResetModel()
+
+    def clear(self):
+        """ Remove all rows. """
+
+        self.setFeedback([])
+
+    def getFeedback(self, row):
+        """ Get the feedback displayed at the given top level row. """
+        return self._feedback[row]
+
+    def getAvailable(self, row):
+        """ Get the number of objects of the feedback at the given row that can be loaded without reading a stream. """
+
+        toDisplay = self._feedback[row]['toDisplay']
+        if isinstance(toDisplay, AtCore.FeedbackStream):
+            return toDisplay.count
+
+        return len(toDisplay) if toDisplay and toDisplay is not Ellipsis else 0
+
+    def getObject(self, row, index):
+        """ Get the object to display and the object to select at the given index of the feedback at the given row. """
+
+        feedback = self._feedback[row]
+        toDisplay = feedback['toDisplay']
+        if isinstance(toDisplay, AtCore.FeedbackStream):
+            return toDisplay.items(index, index + 1)[0]
+
+        return toDisplay[index], feedback['toSelect'][index]
+
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+
+        if not self.hasIndex(row, column, parent):
+            return QtCore.QModelIndex()
+
+        # The internal id of a child is the row of its feedback + 1, 0 for the top level rows.
+        if not parent.isValid():
+            return self.createIndex(row, column, 0)
+
+        return self.createIndex(row, column, parent.row() + 1)
+
+    def parent(self, index):
+
+        if not index.isValid() or not index.internalId():
+            return QtCore.QModelIndex()
+
+        return self.createIndex(index.internalId() - 1, 0, 0)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+
+        if not parent.isValid():
+            return len(self._lines) if self._lines is not None else len(self._feedback)
+
+        if self._lines is not None or parent.internalId() or parent.column():
+            return 0
+
+        row = parent.row()
+        return self._loaded[row] + self._hasMore[row]
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 1 if self._lines is not None else 2
+
+    def hasChildren(self, parent=QtCore.QModelIndex()):
+
+        if not parent.isValid():
+            return self.rowCount(parent) > 0
+
+        if self._lines is not None or parent.internalId() or parent.column():
+            return False
+
+        return self.rowCount(parent) > 0 or self.hasMore(parent)
+
+    def hasMore(self, parent):
+        """ Get if the feedback at the given index have objects that are not loaded yet. """
+
+        if self._lines is not None or not parent.isValid() or parent.internalId():
+            return False
+
+        row = parent.row()
+        toDisplay = self._feedback[row]['toDisplay']
+        if isinstance(toDisplay, AtCore.FeedbackStream) and not toDisplay.isExhausted:
+            return True
+
+        return self._loaded[row] < self.getAvailable(row)
+
+    def canFetchMore(self, parent):
+        return self.hasMore(parent)
+
+    def fetchMore(self, parent, size=AtConstants.FEEDBACK_CHUNK_SIZE):
+
+        if not self.canFetchMore(parent):
+            return
+
+        row = parent.row()
+        loaded = self._loaded[row]
+
+        toDisplay = self._feedback[row]['toDisplay']
+        if isinstance(toDisplay, AtCore.FeedbackStream) and loaded + size > toDisplay.count:
+            toDisplay.read(loaded + size - toDisplay.count)
+
+        count = min(loaded + size, self.getAvailable(row))
+        if count > loaded:
+            self.beginInsertRows(parent, loaded, count - 1)
+            self._loaded[row] = count
+            self.endInsertRows()
+
+        # The `Show more...` row is after the loaded objects while there is still objects to load.
+        hasMore = self.hasMore(parent)
+        if hasMore and not self._hasMore[row]:
+            self.beginInsertRows(parent, count, count)
+            self._hasMore[row] = True
+            self.endInsertRows()
+        elif not hasMore and self._hasMore[row]:
+            self.beginRemoveRows(parent, count, count)
+            self._hasMore[row] = False
+            self.endRemoveRows()
+
+        # A stream count change when it is read.
+        countIndex = self.index(row, 1)
+        self.dataChanged.emit(countIndex, countIndex)
+
+    def unload(self, parent):
+        """ Remove the children of the given feedback, they will be loaded again when needed. """
+
+        if self._lines is not None or not parent.isValid() or parent.internalId():
+            return
+
+        row = parent.row()
+        rowCount = self.rowCount(parent)
+        if not rowCount:
+            return
+
+        self.beginRemoveRows(parent, 0, rowCount - 1)
+        self._loaded[row] = 0
+        self._hasMore[row] = False
+        self.endRemoveRows()
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+
+        if not index.isValid():
+            return None
+
+        if self._lines is not None:
+            return self._lines[index.row()] if role == QtCore.Qt.DisplayRole else None
+
+        # Top level rows display the feedback title and the number of objects found.
+        if not index.internalId():
+            feedback = self._feedback[index.row()]
+
+            if role == QtCore.Qt.DisplayRole:
+                if index.column() == 0:
+                    return str(feedback['title'])
+                if self.getAvailable(index.row()) or AtCore.isTruncated(feedback):
+                    return '        found {0}'.format(TracebackList.getCount(feedback))
+                return ''
+
+            elif role == QtCore.Qt.ToolTipRole:
+                return feedback['documentation'] or None
+
+            elif role == self.FeedbackRole:
+                return feedback
+
+            return None
+
+        row, child = index.internalId() - 1, index.row()
+        if child >= self._loaded[row]:
+            if role == QtCore.Qt.DisplayRole and index.column() == 0:
+                return 'Show more...'
+            return True if role == self.MoreRole else None
+
+        if index.column() != 0:
+            return None
+
+        if role == QtCore.Qt.DisplayRole:
+            return str(self.getObject(row, child)[0])
+        elif role == self.SelectionRole:
+            return self.getObject(row, child)[1]
+
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+
+        if orientation != QtCore.Qt.Horizontal or role != QtCore.Qt.DisplayRole:
+            return None
+
+        if section == 0 and self._lines is None:
+            return 'Found {0} error{1}'.format(len(self._feedback), 's' if len(self._feedback) > 1 else '')
+
+        return ''
+
+    def flags(self, index):
+
+        if not index.isValid():
+            return QtCore.Qt.NoItemFlags
+
+        return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+
+
+class TracebackList(QtWidgets.QTreeView):
+    """ Display the feedback of a process from a FeedbackModel, or the traceback of its exception.
+
+    The objects of a feedback are loaded by pages when it is expanded, the view fetch them from the model, when the
+    view is scrolled to the last loaded object or when the `Show more...` row is clicked. `contentSizeChanged` is
+    emitted when the number of rows change so the parent can be resized to the content.
+
+    The number of visible rows is counted again from the model each time its rows change, only the top level rows
+    are walked, and all rows have the same height, so the content size is known without walking the objects. It is
+    capped to `AtConstants.FEEDBACK_MAX_ROWS` rows, the view scroll through the others.
+    """
+
+    contentSizeChanged = Signal()
+
+    def __init__(self, parent):
+        super(TracebackList, self).__init__(parent)
+
+        self.parent = parent
+
+        self.resourcesManager = AtUtils.RessourcesManager(__file__, backPath='..{0}ressources'.format(os.sep), key=AtConstants.PROGRAM_NAME)
+
+        self.feedbackModel = FeedbackModel(self)
+        self.setModel(self.feedbackModel)
+
+        self._visibleRows = 0
+        self._rowHeight = 0
+
+        # All rows have the same height, the view does not have to measure each of them.
+        self.setUniformRowHeights(True)
+        self.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+
+        self.expanded.connect(self.loadChildren)
+        self.collapsed.connect(self.unloadChildren)
+        self.clicked.connect(self.readMore)
+        self.verticalScrollBar().valueChanged.connect(self.fetchVisible)
+
+        self.feedbackModel.rowsInserted.connect(self.countRows)
+        self.feedbackModel.rowsRemoved.connect(self.countRows)
+        self.feedbackModel.modelReset.connect(self.countRows)
 
         self.header().setSectionResizeMode(QtWidgets.QHeaderView.Interactive)
 
@@ -1018,15 +2117,17 @@ class TracebackList(QtWidgets.QTreeWidget):
             return event.ignore()
 
         toSelect = []
-        for item in self.selectedItems():
-            data = item.data(0, QtCore.Qt.UserRole)
-            if not data: 
+        for index in self.selectionModel().selectedRows(0):
+            if index.data(FeedbackModel.MoreRole):
                 continue
 
-            if item.parent() is None:
-                toSelect.extend(data['toSelect'])
-            else: 
-                toSelect.append(data)
+            feedback = index.data(FeedbackModel.FeedbackRole)
+            if feedback is not None:
+                toSelect.extend(self.getSelection(feedback))
+            else:
+                data = index.data(FeedbackModel.SelectionRole)
+                if data:
+                    toSelect.append(data)
         
         AtUtils.softwareSelection(list(set(toSelect)))
 
@@ -1058,88 +2159,128 @@ class TracebackList(QtWidgets.QTreeWidget):
     def logFeedback(self, text):
 
         self.setHeaderHidden(False)
-        self.setHeaderLabels(['Found {0} error{1}'.format(len(text), 's' if len(text) > 1 else ''), ''])
+        self.feedbackModel.setFeedback(text)
 
-        for feedback in text:
-            toDisplay = feedback['toDisplay']
+        self.resizeColumnToContents(0)
 
-            if toDisplay:
-                parent = QtWidgets.QTreeWidgetItem([str(feedback['title']), '        found {0}'.format(str(len(toDisplay)))])
-                parent.setChildIndicatorPolicy(QtWidgets.QTreeWidgetItem.ShowIndicator)
-            else:
-                parent = QtWidgets.QTreeWidgetItem([str(feedback['title'])])
-                parent.setChildIndicatorPolicy(QtWidgets.QTreeWidgetItem.DontShowIndicator)
+    def logException(self, exception):
 
-            # If there is a documentation for this error display it in a tooltip.
-            if feedback['documentation']:
-                parent.setToolTip(0, feedback['documentation'])
+        self.setHeaderHidden(True)
+        self.feedbackModel.setException(exception)
+
+        self.resizeColumnToContents(0)
+
+    def clear(self):
+
+        self.feedbackModel.clear()
+
+    def countRows(self, *args):
+        """ Count the displayed rows, the top level rows and the children of the expanded feedback. """
 
-            parent.setData(0, QtCore.Qt.UserRole, feedback)
+        model = self.feedbackModel
+        rowCount = model.rowCount()
 
-            self.addTopLevelItem(parent)
+        self._visibleRows = rowCount
+        if not model.isException:
+            for row in range(rowCount):
+                index = model.index(row, 0)
+                if self.isExpanded(index):
+                    self._visibleRows += model.rowCount(index)
 
-    def expand(self, item):
+        self.contentSizeChanged.emit()
 
+    def loadChildren(self, index):
+        """ Load the first page of objects of the expanded feedback if the view did not fetch it already. """
+
+        # The view fetch the first page itself when its layout is up to date, the rows are counted by `countRows`.
         with BusyCursor():
-            self.clearChildren(item)
+            if not self.feedbackModel.rowCount(index) and self.feedbackModel.canFetchMore(index):
+                self.feedbackModel.fetchMore(index)
 
-            data = item.data(0, QtCore.Qt.UserRole)
-            for toDisplay, toSelect in zip(data['toDisplay'], data['toSelect']):
-                if not toDisplay:
-                    continue
-                child = QtWidgets.QTreeWidgetItem([str(toDisplay)])
-                child.setData(0, QtCore.Qt.UserRole, toSelect)
-                item.addChild(child)
+        self.resizeColumnToContents(0)
+        self.countRows()
+
+    def unloadChildren(self, index):
+        """ Remove the objects of the collapsed feedback from the model. """
+
+        self.feedbackModel.unload(index)
+        self.countRows()
 
-            self.parent.setFixedHeight(45 + self.getContentSize().height())
+    def readMore(self, index):
+        """ Load the next page of objects of a feedback when its `Show more...` row is clicked. """
 
-    def collapse(self, item):
+        if not index.data(FeedbackModel.MoreRole):
+            return
 
         with BusyCursor():
-            self.clearChildren(item)
+            if self.feedbackModel.canFetchMore(index.parent()):
+                self.feedbackModel.fetchMore(index.parent())
+
+        self.resizeColumnToContents(0)
 
-            self.parent.setFixedHeight(45 + self.getContentSize().height())
+    def fetchVisible(self, value):
+        """ Load the next page of objects of the last expanded feedback when the view is scrolled to its end. """
 
-    def clearChildren(self, item):
+        if value < self.verticalScrollBar().maximum():
+            return
 
-        for i in reversed(range(item.childCount())):
-            child = item.takeChild(i)
-            del child
+        index = self.indexAt(self.viewport().rect().bottomLeft())
+        if index.isValid() and index.data(FeedbackModel.MoreRole):
+            self.readMore(index)
 
-    def logException(self, exception):
+    @staticmethod
+    def getCount(feedback):
+        """ Get the number of objects found as a string, with a `+` for streams not entirely read and truncated feedback. """
 
-        self.setHeaderHidden(True)
+        toDisplay = feedback['toDisplay']
+        if isinstance(toDisplay, AtCore.FeedbackStream) and not toDisplay.count:
+            toDisplay.read()
 
-        for line in exception:
-            parent = QtWidgets.QTreeWidgetItem([line])
-            self.addTopLevelItem(parent)
+        return AtCore.getFoundCount(feedback)
+
+    @staticmethod
+    def getSelection(feedback):
+        """ Get the objects to select for the given feedback, only those already read for streams. """
+
+        if isinstance(feedback['toDisplay'], AtCore.FeedbackStream):
+            return [toSelect for _, toSelect in feedback['toDisplay'].items()]
+
+        return feedback['toSelect']
 
     def selectAll(self):
 
-        items = [self.topLevelItem(i) for i in range(self.topLevelItemCount())]
+        if self.feedbackModel.isException:
+            return
 
         toSelect = []
-        for item in items:
-            item.setSelected(True)
-            data = item.data(0, QtCore.Qt.UserRole)
-            toSelect.extend(data['toSelect'])
+        for row in range(self.feedbackModel.rowCount()):
+            index = self.feedbackModel.index(row, 0)
+            self.selectionModel().select(index, QtCore.QItemSelectionModel.Select | QtCore.QItemSelectionModel.Rows)
+            toSelect.extend(self.getSelection(self.feedbackModel.getFeedback(row)))
 
         AtUtils.softwareSelection(list(set(toSelect)))
 
     def expandAll(self):
 
-        items = [self.topLevelItem(i) for i in range(self.topLevelItemCount())]
-        for item in items:
-            item.setExpanded(True)
+        with BusyCursor():
+            for row in range(self.feedbackModel.rowCount()):
+                self.expand(self.feedbackModel.index(row, 0))
 
     def collapseAll(self):
 
-        items = [self.topLevelItem(i) for i in range(self.topLevelItemCount())]
-        for item in items:
-            item.setExpanded(False)
+        for row in range(self.feedbackModel.rowCount()):
+            self.collapse(self.feedbackModel.index(row, 0))
+
+    def getRowHeight(self):
+        """ Get the height of a row, measured once on the first row displayed. """
+
+        if not self._rowHeight and self.feedbackModel.rowCount():
+            self._rowHeight = self.sizeHintForRow(0)
+
+        return self._rowHeight
 
     def getContentSize(self):
-        """  """
+        """ Get the size needed to display the rows, up to `AtConstants.FEEDBACK_MAX_ROWS` rows. """
 
         height = 2 * self.frameWidth() # border around tree
 
@@ -1148,15 +2289,8 @@ class TracebackList(QtWidgets.QTreeWidget):
             headerSizeHint = header.sizeHint()
             height += headerSizeHint.height()
 
-        rows = 0
-        it = QtWidgets.QTreeWidgetItemIterator(self)
-        while it.value() is not None:
-            rows += 1
-            index = self.indexFromItem(it.value())
-            height += self.rowHeight(index)
-            it += 1
+        height += min(self._visibleRows, AtConstants.FEEDBACK_MAX_ROWS) * self.getRowHeight()
 
-        self.resizeColumnToContents(0)
         return QtCore.QSize(header.length() + 2 * self.frameWidth(), height)
 
 
@@ -1166,6 +2300,10 @@ class ProcessesScrollArea(QtWidgets.QScrollArea):
     Manage the display and give a global control over all ProcessWidgets.
     This widget only need to have its data changed to display the new ProcessWidgets that it will create and delete when needed.
     It also give controll over all Process Widgets like check/unchek, run check/fix and filter.
+
+    Each process is a ProcessPlaceholder that only build its ProcessWidget when it is scrolled into view, and release
+    it when it is scrolled `AtConstants.WIDGET_RELEASE_DISTANCE` screens away, so a big env display its first screen
+    immediately.
     """
 
     def __init__(self, register, dev=False, parent=None):
@@ -1180,11 +2318,13 @@ class ProcessesScrollArea(QtWidgets.QScrollArea):
         self.processes = {}
 
         self.stopRequested = False
+        self.runner = getRunner()
 
         self.mainLayout = QtWidgets.QVBoxLayout(self)
 
         self.buildUi()
         self.setupUi()
+        self.connectUi()
         self.setWidgetResizable(True)
 
         self.showNoProcess()
@@ -1215,14 +2355,45 @@ class ProcessesScrollArea(QtWidgets.QScrollArea):
         except: pass
         self.scrollAreaWidgetContents.setContentsMargins(2, 2, 2, 2)
 
+    def connectUi(self):
+        """ Build the ProcessWidgets scrolled into view. """
+
+        self.verticalScrollBar().valueChanged.connect(self.updateWidgets)
+
     def keyPressEvent(self, event):
 
         if event.key() == QtCore.Qt.Key_Escape:
-            self.stopRequested = True
+            self.stop()
             return event.accept()
 
         return super(ProcessesScrollArea, self).keyPressEvent(event)
 
+    def resizeEvent(self, event):
+
+        super(ProcessesScrollArea, self).resizeEvent(event)
+        self.updateWidgets()
+
+    def updateWidgets(self, *args):
+        """ Build the ProcessWidgets of the placeholders in view and release those that are far out of view.
+
+        The widgets in the screen above and the screen below the view are also built, so they are ready when scrolling.
+        """
+
+        height = self.viewport().height()
+        top = self.verticalScrollBar().value()
+        bottom = top + height
+        distance = height * AtConstants.WIDGET_RELEASE_DISTANCE
+
+        for process in self.processes.values():
+            if process.isHidden():
+                continue
+
+            geometry = process.geometry()
+            if geometry.bottom() >= top - height and geometry.top() <= bottom + height:
+                process.build()
+            elif geometry.bottom() < top - distance or geometry.top() > bottom + distance:
+                process.release()
+
     def refreshDisplay(self): #TODO: Maybe remove this wrapper. By renaming the addWidget.
         """ Refresh the display of the widget by removing all Widgets and rebuild the new one. """
 
@@ -1269,6 +2440,21 @@ class ProcessesScrollArea(QtWidgets.QScrollArea):
         # noProcesses_QLabel.setFont(self.noProcesses_QFont)
         self.layout.addWidget(noProcesses_QLabel)
 
+    def stop(self):
+        """ Stop the current run, the running process is cancelled and will stop the next time it poll its token. """
+
+        self.stopRequested = True
+
+        for process in self.processes.values():
+            process.blueprint.cancel()
+
+    def isStopRequested(self):
+        """ Process the pending events to receive the [ESCAPE] key and get if the run have to stop. """
+
+        QtWidgets.QApplication.processEvents()
+
+        return self.stopRequested
+
     def runAllCheck(self):
         """ Execute check method on all visible processes that could be run.
 
@@ -1283,19 +2469,23 @@ class ProcessesScrollArea(QtWidgets.QScrollArea):
         self.parent.statusBar.showMessage('Check in progress... Press [ESCAPE] to interrupt', 1)
         self.parent.searchAndProgress_QStackedLayout.setCurrentIndex(1)
 
-        progressbarLen = 100.0/len(self.processes)
-        for i, process in self.processes.items():
-            if self.stopRequested:
-                raise
+        try:
+            with self.runner.busy(self.parent):
+                progressbarLen = 100.0/len(self.processes)
+                for i, process in self.processes.items():
+                    if self.isStopRequested():
+                        self.parent.statusBar.showMessage('Check interrupted', 3000)
+                        return
 
-            self.parent.generalProgress_QProgressbar.setValue(progressbarLen*i)
+                    self.parent.generalProgress_QProgressbar.setValue(progressbarLen*i)
 
-            if process.blueprint._isCheckable and process.isChecked() and (process.isVisible() or not self.parent.canClose):
-                self.ensureWidgetVisible(process)
-                process.execCheck()
-        
-        self.parent.searchAndProgress_QStackedLayout.setCurrentIndex(0)
-        self.parent.generalProgress_QProgressbar.reset()
+                    if process.blueprint._isCheckable and process.isChecked() and (process.isVisible() or not self.parent.canClose):
+                        self.ensureWidgetVisible(process)
+                        process.execCheck()
+
+        finally:
+            self.parent.searchAndProgress_QStackedLayout.setCurrentIndex(0)
+            self.parent.generalProgress_QProgressbar.reset()
 
     def runAllFix(self):
         """ Execute fix method on all visible processes that could be run.
@@ -1311,22 +2501,26 @@ class ProcessesScrollArea(QtWidgets.QScrollArea):
         self.parent.statusBar.showMessage('Fix in progress... Press [ESCAPE] to interrupt', 1)
         self.parent.searchAndProgress_QStackedLayout.setCurrentIndex(1)
 
-        progressbarLen = 100.0/len(self.processes)
-        for i, process in self.processes.items():
-            if self.stopRequested:
-                raise
+        try:
+            with self.runner.busy(self.parent):
+                progressbarLen = 100.0/len(self.processes)
+                for i, process in self.processes.items():
+                    if self.isStopRequested():
+                        self.parent.statusBar.showMessage('Fix interrupted', 3000)
+                        return
 
-            self.parent.generalProgress_QProgressbar.setValue(progressbarLen*i)
+                    self.parent.generalProgress_QProgressbar.setValue(progressbarLen*i)
 
-            if not process.status.isFail and process.status is not Status.EXCEPTION:
-                continue
+                    if not process.status.isFail and process.status is not Status.EXCEPTION:
+                        continue
 
-            if process.isFixable and process.isChecked() and (process.isVisible() or not self.parent.canClose):
-                self.ensureWidgetVisible(process)
-                process.execFix()
+                    if process.isFixable and process.isChecked() and (process.isVisible() or not self.parent.canClose):
+                        self.ensureWidgetVisible(process)
+                        process.execFix()
 
-        self.parent.searchAndProgress_QStackedLayout.setCurrentIndex(0)
-        self.parent.generalProgress_QProgressbar.reset()
+        finally:
+            self.parent.searchAndProgress_QStackedLayout.setCurrentIndex(0)
+            self.parent.generalProgress_QProgressbar.reset()
 
         if self.register.getData('parameters').get('recheck', False):
             self.runAllCheck()
@@ -1346,8 +2540,9 @@ class ProcessesScrollArea(QtWidgets.QScrollArea):
             if not blueprint._inUi:
                 uiLinkResolveBlueprints.append(None)
                 continue  # Skip this check if it does not be run in ui
-            processes[index] = processWidget = ProcessWidget(blueprint, parent=self, window=self.parent)
-            uiLinkResolveBlueprints.append(processWidget)
+            # The ProcessWidget is only built when the placeholder is scrolled into view. (see `updateWidgets`)
+            processes[index] = processPlaceholder = ProcessPlaceholder(blueprint, parent=self, window=self.parent)
+            uiLinkResolveBlueprints.append(processPlaceholder)
         self.register.setData('widget', processes)
 
         for blueprint in self._data:
@@ -1369,6 +2564,9 @@ class ProcessesScrollArea(QtWidgets.QScrollArea):
         for widget in self.processes.values():
             widget.leaveEvent(None)
 
+        # The placeholders geometry is only known once the layout is done.
+        QtCore.QTimer.singleShot(0, self.updateWidgets)
+
     def addWidgetsByHeader(self):
         """ Add widget in the scroll area by Blueprint order (default) """
 
@@ -1444,6 +2642,8 @@ class ProcessesScrollArea(QtWidgets.QScrollArea):
         for process in self.processes.values():
             process.setVisible(text.lower() in process.blueprint.name.lower())
 
+        QtCore.QTimer.singleShot(0, self.updateWidgets)
+
         if not text:
             self.parent.statusBar.showMessage('{} processes available'.format(len(self.processes)), 3000)
             return
@@ -1473,7 +2673,7 @@ class ProcessesScrollArea(QtWidgets.QScrollArea):
 
             if layoutItem.widget() is not None:
                 widgetToRemove = layoutItem.widget()
-                if safe and isinstance(widgetToRemove, ProcessWidget):
+                if safe and isinstance(widgetToRemove, ProcessPlaceholder):
                     widgetToRemove.setParent(None)
                     layout.removeWidget(widgetToRemove)  #FIXME: It seems that in normal mode widget lose their color (not reset)
                     continue
@@ -1491,6 +2691,330 @@ class ProcessesScrollArea(QtWidgets.QScrollArea):
                 del layoutItem
 
 
+class ProcessesView(QtWidgets.QWidget):
+    """ Virtualized alternative to the ProcessesScrollArea, for the envs with a lot of processes.
+
+    The processes are rows of a ProcessView painted by a ProcessDelegate, no widget is created for them so only the
+    visible rows cost anything. The feedback of the selected process is displayed in a single TracebackList under the
+    list. It give the same control over all processes than the ProcessesScrollArea.
+    """
+
+    def __init__(self, register, dev=False, parent=None):
+        super(ProcessesView, self).__init__()
+
+        self.register = register
+        self.dev = dev
+        self.parent = parent
+        self.displayMode = AtConstants.AVAILABLE_DISPLAY_MODE[0]
+
+        self._data = []
+        self._filter = ''
+
+        self.stopRequested = False
+        self.runner = getRunner()
+
+        self.buildUi()
+        self.setupUi()
+        self.connectUi()
+
+    def buildUi(self):
+        """ Build the view and the feedback panel """
+
+        self.model = ProcessModel(self)
+
+        self.view = ProcessView(self)
+        self.view.setModel(self.model)
+        self.view.setItemDelegate(ProcessDelegate(self.view))
+
+        self.feedback_QWidget = QtWidgets.QWidget(self)
+        self.traceback = TracebackList(self.feedback_QWidget)
+        feedback_QVBoxLayout = QtWidgets.QVBoxLayout(self.feedback_QWidget)
+        feedback_QVBoxLayout.addWidget(self.traceback)
+
+        self.mainLayout = QtWidgets.QVBoxLayout(self)
+        self.mainLayout.addWidget(self.view)
+        self.mainLayout.addWidget(self.feedback_QWidget)
+
+        self.feedback_QVBoxLayout = feedback_QVBoxLayout
+
+    def setupUi(self):
+        """ Setup the view and the feedback panel """
+
+        palette = self.view.palette()
+        palette.setColor(QtGui.QPalette.Base, QtGui.QColor(50, 50, 50))
+        self.view.setPalette(palette)
+
+        self.mainLayout.setContentsMargins(0, 0, 0, 0)
+        self.mainLayout.setSpacing(2)
+        self.feedback_QVBoxLayout.setContentsMargins(0, 0, 0, 0)
+
+        self.feedback_QWidget.setVisible(False)
+
+    def connectUi(self):
+        """ Connect the view to the feedback panel """
+
+        self.view.clicked.connect(self.toggleFeedback)
+        self.model.feedbackChanged.connect(self.showFeedback)
+        self.traceback.contentSizeChanged.connect(self.resizeFeedback)
+
+    def keyPressEvent(self, event):
+
+        if event.key() == QtCore.Qt.Key_Escape:
+            self.stop()
+            return event.accept()
+
+        return super(ProcessesView, self).keyPressEvent(event)
+
+    def refreshDisplay(self):
+        """ Order the rows according to the display mode. """
+
+        self.model.setDisplayMode(self.displayMode)
+        self.filterProcesses(self._filter)
+
+    @property
+    def processes(self):
+        """ Get the ProcessItems of the current env, by blueprint index. """
+        return dict(enumerate(self.model.items))
+
+    @property
+    def data(self):
+        """ Getter that return value of `self._data`. """
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        """ Setter for `self._data`, create the ProcessItems of the new blueprints.
+
+        parameters:
+        -----------
+        value: list(Blueprint)
+            List containing Blueprint object to use as source for ProcessItems.
+        """
+
+        self._data = value
+
+        self.closeFeedback()
+        self.model.setItems(self.buildItems())
+        self.model.setDisplayMode(self.displayMode)
+
+    def buildItems(self):
+        """ Create the ProcessItems of the blueprints and resolve the links on them.
+
+        The items are stored in the register like the ProcessWidgets, they are only created again in dev mode.
+        """
+
+        items = self.register.getData('items')
+        if items is not None and not self.dev:
+            return items
+
+        for item in items or []:
+            item.release()
+
+        items = []
+        uiLinkResolveBlueprints = []
+        for blueprint in self._data:
+            if not blueprint._inUi:
+                uiLinkResolveBlueprints.append(None)
+                continue  # Skip this check if it does not be run in ui
+
+            item = ProcessItem(blueprint, self.model, window=self.parent)
+            items.append(item)
+            uiLinkResolveBlueprints.append(item)
+        self.register.setData('items', items)
+
+        for blueprint in self._data:
+            blueprint.resolveLinks(uiLinkResolveBlueprints, check='execCheck', fix='execFix', tool='execTool')
+
+        return items
+
+    def toggleFeedback(self, index):
+        """ Open the feedback of the clicked process or close it if it is already opened. """
+
+        item = index.data(ProcessModel.ItemRole)
+        if item is None:
+            return
+
+        if item.isOpened:
+            self.closeFeedback()
+        else:
+            self.openFeedback(item)
+
+    def showFeedback(self, item):
+        """ Display the new feedback of the given item, the feedback of a process is opened when it found errors. """
+
+        if item.feedback:
+            self.openFeedback(item)
+        elif item.isOpened:
+            self.closeFeedback()
+
+    def openFeedback(self, item):
+        """ Display the feedback of the given item in the feedback panel. """
+
+        self.closeFeedback()
+        if not item.feedback:
+            return
+
+        item.isOpened = True
+        self.traceback.clear()
+        if isinstance(item.feedback, str):
+            self.traceback.logException(item.feedback.split('\n'))
+        else:
+            self.traceback.logFeedback(item.feedback)
+
+        self.feedback_QWidget.setVisible(True)
+        self.resizeFeedback()
+
+        self.view.setCurrentIndex(self.model.indexOf(item))
+        self.model.refresh(item)
+
+    def resizeFeedback(self):
+        """ Resize the feedback panel to the content of the traceback widget. (see `TracebackList.getContentSize`) """
+
+        if not self.feedback_QWidget.isHidden():
+            self.feedback_QWidget.setFixedHeight(20 + self.traceback.getContentSize().height())
+
+    def closeFeedback(self):
+        """ Hide the feedback panel. """
+
+        for item in self.model.items:
+            if item.isOpened:
+                item.isOpened = False
+                self.model.refresh(item)
+
+        self.traceback.clear()
+        self.feedback_QWidget.setVisible(False)
+
+    def stop(self):
+        """ Stop the current run, the running process is cancelled and will stop the next time it poll its token. """
+
+        self.stopRequested = True
+
+        for item in self.model.items:
+            item.blueprint.cancel()
+
+    def isStopRequested(self):
+        """ Process the pending events to receive the [ESCAPE] key and get if the run have to stop. """
+
+        QtWidgets.QApplication.processEvents()
+
+        return self.stopRequested
+
+    def isVisibleItem(self, item):
+        """ Get if the given item is not hidden by the filter. """
+
+        index = self.model.indexOf(item)
+        return index.isValid() and not self.view.isRowHidden(index.row())
+
+    def runAll(self, method):
+        """ Execute the given method on all visible and checked items that can run it, in blueprint order. """
+
+        items = self.model.items
+        if not items:
+            return False
+
+        self.stopRequested = False
+        self.parent.statusBar.showMessage('{0} in progress... Press [ESCAPE] to interrupt'.format(method.capitalize()), 1)
+        self.parent.searchAndProgress_QStackedLayout.setCurrentIndex(1)
+
+        try:
+            with self.runner.busy(self.parent):
+                progressbarLen = 100.0/len(items)
+                for i, item in enumerate(items):
+                    if self.isStopRequested():
+                        self.parent.statusBar.showMessage('{0} interrupted'.format(method.capitalize()), 3000)
+                        return False
+
+                    self.parent.generalProgress_QProgressbar.setValue(progressbarLen*i)
+
+                    if not item.isChecked() or not (self.isVisibleItem(item) or not self.parent.canClose):
+                        continue
+
+                    if method == AtConstants.CHECK and item.isCheckable:
+                        self.view.scrollTo(self.model.indexOf(item))
+                        item.execCheck()
+
+                    elif method == AtConstants.FIX and item.isFixable and (item.status.isFail or item.status is Status.EXCEPTION):
+                        self.view.scrollTo(self.model.indexOf(item))
+                        item.execFix()
+
+        finally:
+            self.parent.searchAndProgress_QStackedLayout.setCurrentIndex(0)
+            self.parent.generalProgress_QProgressbar.reset()
+
+        return True
+
+    def runAllCheck(self):
+        """ Execute check method on all visible processes that could be run. """
+
+        self.runAll(AtConstants.CHECK)
+
+    def runAllFix(self):
+        """ Execute fix method on all visible processes that could be run, then check them again if the env ask it. """
+
+        if self.runAll(AtConstants.FIX) and self.register.getData('parameters').get('recheck', False):
+            self.runAllCheck()
+
+    def checkAll(self):
+        """ Check all processes """
+
+        for item in self.model.items:
+            item.checked = True
+        self.model.refresh()
+
+    def uncheckAll(self):
+        """ Uncheck all processes """
+
+        for item in self.model.items:
+            item.checked = False
+        self.model.refresh()
+
+    def defaultAll(self):
+        """ Reset all processes check state """
+
+        for item in self.model.items:
+            item.checked = item.blueprint.isEnabled
+        self.model.refresh()
+
+    def filterProcesses(self, text):
+        """ Hide the rows of the processes whose name does not match the given string, and the empty categories.
+
+        parameters:
+        -----------
+        text: str
+            Text used to filter processes in the view.
+        """
+
+        self._filter = text
+
+        visibleProcesses = []
+        categoryRow = None
+        categoryIsVisible = False
+        for row in range(self.model.rowCount()):
+            item = self.model.index(row, 0).data(ProcessModel.ItemRole)
+
+            if item is None:
+                if categoryRow is not None:
+                    self.view.setRowHidden(categoryRow, not categoryIsVisible)
+                categoryRow, categoryIsVisible = row, False
+                continue
+
+            isVisible = text.lower() in item.blueprint.name.lower()
+            self.view.setRowHidden(row, not isVisible)
+            if isVisible:
+                visibleProcesses.append(item)
+                categoryIsVisible = True
+
+        if categoryRow is not None:
+            self.view.setRowHidden(categoryRow, not categoryIsVisible)
+
+        if not text:
+            self.parent.statusBar.showMessage('{} processes available'.format(len(self.model.items)), 3000)
+        elif not visibleProcesses:
+            self.parent.statusBar.showMessage('No process match name "{}"'.format(text), 3000)
+        else:
+            self.parent.statusBar.showMessage('Found {} processes that match name "{}"'.format(len(visibleProcesses), text), 3000)
+
+
 ######################################################################################################################################
 
 
@@ -1524,8 +3048,11 @@ class BlockSignals():
 class BusyCursor():
     """ Change the cursor type during execution of the instruction under the context statement. """
 
+    def __init__(self, shape=QtCore.Qt.WaitCursor):
+        self.shape = shape
+
     def __enter__(self):
-        QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.WaitCursor)
+        QtWidgets.QApplication.setOverrideCursor(self.shape)
 
     def __exit__(self, exception_type, exception_value, traceback):
         QtWidgets.QApplication.restoreOverrideCursor()
@@ -0,0 +1,500 @@
+import os
+import sys
+import json
+import numbers
+import logging
+import argparse
+
+import six
+
+from Athena import AtUtils
+from Athena import AtConstants
+
+LOGGER = logging.getLogger(AtConstants.PROGRAM_NAME)
+
+
+class DiscoveryManifest(object):
+    """Persistent record of the contexts and envs discovered in each Athena package.
+
+    The Register need to import every env module of every context to list them, which can be really slow when the
+    packages lives on a network mount. The manifest store on disk what have been found for a package (envs, icons and
+    env `parameters`) with the modification time of each file in the `envs` package. On the next start, if none of
+    theses files changed, the envs can be retrieved from the manifest without importing anything.
+    """
+
+    def __init__(self, path=None):
+        """Load the manifest from the given path.
+
+        Parameters
+        -----------
+        path: str, optional
+            Path to the manifest file. (default: `AtConstants.CACHE_DIRECTORY`/`AtConstants.DISCOVERY_MANIFEST`)
+        """
+
+        self.path = path or os.path.join(AtConstants.CACHE_DIRECTORY, AtConstants.DISCOVERY_MANIFEST)
+
+        self._data = {}
+        self._isDirty = False
+
+        self.load()
+
+    def __repr__(self):
+        """Return the representation of the manifest"""
+
+        return "<{0} '{1}' - {2} package(s)>".format(self.__class__.__name__, self.path, len(self._data))
+
+    def load(self):
+        """Read the manifest file from disk.
+
+        If the file does not exists, can't be read or have been written by another version of the manifest, the manifest
+        will start empty.
+        """
+
+        self._data = {}
+        self._isDirty = False
+
+        if not os.path.isfile(self.path):
+            return
+
+        try:
+            with open(self.path, 'r') as manifestFile:
+                data = json.load(manifestFile)
+        except (IOError, OSError, ValueError):
+            LOGGER.warning('Unable to read the discovery manifest "{0}"'.format(self.path))
+            return
+
+        if data.get('version') != AtConstants.MANIFEST_VERSION:
+            return
+
+        self._data = data.get('packages', {})
+
+    def save(self):
+        """Write the manifest on disk if it have been modified.
+
+        The file is first written next to the manifest and then moved to prevent other process to read a partial file.
+
+        Returns
+        --------
+        bool
+            True if the manifest have been written, False otherwise.
+        """
+
+        if not self._isDirty:
+            return False
+
+        directory = os.path.dirname(self.path)
+        temporaryPath = '{0}.{1}.tmp'.format(self.path, os.getpid())
+
+        try:
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+
+            with open(temporaryPath, 'w') as manifestFile:
+                json.dump({'version': AtConstants.MANIFEST_VERSION, 'packages': self._data}, manifestFile, separators=(',', ':'))
+
+            replaceFile(temporaryPath, self.path)
+
+        except (IOError, OSError):
+            LOGGER.warning('Unable to write the discovery manifest "{0}"'.format(self.path))
+            return False
+
+        self._isDirty = False
+        return True
+
+    def getEnvs(self, packageData, software):
+        """Get the envs recorded for the given package if they are still up to date.
+
+        Parameters
+        -----------
+        packageData: dict
+            Package data as returned by `AtUtils.getPackages`, need at least the `path` key.
+        software: str
+            The software for which to get envs.
+
+        Returns
+        --------
+        dict or NoneType
+            Return a dict of `AtUtils.LazyEnv` like `AtUtils.getEnvs` or None if the package is not in the manifest or
+            some files have changed since it was recorded.
+        """
+
+        record = self._data.get(self.getKey(packageData, software), None)
+        if record is None:
+            return None
+
+        signature = getSignature(getEnvsDirectory(packageData, software))
+        if signature is None or signature != record['signature']:
+            return None
+
+        envs = {}
+        for env, envData in record['envs'].items():
+            data = {'parameters': envData['parameters']} if 'parameters' in envData else {}
+            envs[env] = AtUtils.LazyEnv(envData['import'], envData['path'], envData['icon'], **data)
+
+        return envs
+
+    def setEnvs(self, packageData, software, envs):
+        """Record the envs found for the given package.
+
+        Parameters
+        -----------
+        packageData: dict
+            Package data as returned by `AtUtils.getPackages`, need at least the `path` key.
+        software: str
+            The software for which the envs have been retrieved.
+        envs: dict
+            Envs as returned by `AtUtils.getEnvs`.
+
+        Returns
+        --------
+        bool
+            True if the envs have been recorded, False if they can't be. (e.g. `parameters` that can't be serialized)
+            The manifest only need to be saved if the record changed. (see `save`)
+        """
+
+        signature = getSignature(getEnvsDirectory(packageData, software))
+        if signature is None or envs is None:
+            return False
+
+        record = {'context': packageData.get('import'), 'icon': packageData.get('icon'), 'signature': signature, 'envs': {}}
+        for env, envData in envs.items():
+            record['envs'][env] = {
+                'import': envData['import'],
+                'path': envData['path'],
+                'icon': envData['icon'],
+            }
+
+            # Only record the parameters already retrieved, querying them would import the env module.
+            if 'parameters' in envData:
+                record['envs'][env]['parameters'] = envData['parameters']
+
+        # Parameters are user data, if they can't be serialized the package will simply be scanned at each start.
+        # The record is compared as it is read from the file. (e.g. the tuples of the parameters become lists)
+        try:
+            record = json.loads(json.dumps(record))
+        except (TypeError, ValueError):
+            return False
+
+        # The manifest is only written again if the record changed, most sessions find the same envs.
+        key = self.getKey(packageData, software)
+        if self._data.get(key) != record:
+            self._data[key] = record
+            self._isDirty = True
+
+        return True
+
+    def clear(self):
+        """Remove all records from the manifest."""
+
+        self._data = {}
+        self._isDirty = True
+
+    @staticmethod
+    def getKey(packageData, software):
+        """Get the key used to store the given package for the given software"""
+        return '{0}|{1}'.format(os.path.normcase(os.path.abspath(packageData['path'])), software)
+
+
+def compileEnv(envStr):
+    """Compile the `register` of the given env module to a file that can be loaded without executing the env module.
+
+    The env module is imported, its `register` is validated against `AtConstants.BLUEPRINT_TEMPLATE` and written next
+    to the env module as a list of blueprints ordered by ID. The Register will then load this file
+    instead of importing the env module as long as the env module is not modified.
+
+    Parameters
+    -----------
+    envStr: str
+        The python import string of the env module to compile.
+
+    Returns
+    --------
+    str
+        Path of the compiled env file.
+
+    Raises
+    -------
+    ImportError
+        The env module can't be imported.
+    ValueError
+        The env `register` or `parameters` are not valid or can't be serialized.
+    """
+
+    from Athena import AtCore  # AtCore import this module, import it here to avoid circular import.
+
+    # IDs are created on first access in the env module, they must start from 0 for this env only.
+    AtCore.ID.flush()
+    try:
+        envModule = AtUtils.importFromStr(envStr)
+        if envModule is None:
+            raise ImportError('Unable to import env module "{0}"'.format(envStr))
+    finally:
+        AtCore.ID.flush()
+
+    register = getattr(envModule, 'register', {})
+    parameters = getattr(envModule, 'parameters', {})
+
+    compiledRegister = []
+    for index in range(len(register)):
+        if index not in register:
+            raise ValueError('{0}: No blueprint registered for ID {1}, IDs should be contiguous.'.format(envStr, index))
+        compiledRegister.append(validateBlueprint(register[index], len(register), '{0}[{1}]'.format(envStr, index)))
+
+    sourcePath = os.path.splitext(envModule.__file__)[0] + '.py'
+    data = {
+        'version': AtConstants.MANIFEST_VERSION,
+        'source': os.path.getmtime(sourcePath),
+        'register': compiledRegister,
+        'parameters': parameters,
+    }
+
+    try:
+        content = json.dumps(data, separators=(',', ':'))
+    except (TypeError, ValueError) as exception:
+        raise ValueError('{0}: The env can not be serialized: {1}'.format(envStr, exception))
+
+    path = getCompiledEnvPath(os.path.dirname(sourcePath), envStr.rsplit('.', 1)[-1])
+    temporaryPath = '{0}.{1}.tmp'.format(path, os.getpid())
+    with open(temporaryPath, 'w') as compiledFile:
+        compiledFile.write(content)
+    replaceFile(temporaryPath, path)
+
+    return path
+
+
+def validateBlueprint(blueprint, count, name):
+    """Check that the given blueprint match the `AtConstants.BLUEPRINT_TEMPLATE` and return its serializable version.
+
+    Parameters
+    -----------
+    blueprint: dict
+        The blueprint data as declared in the env `register`.
+    count: int
+        Number of blueprints in the env `register`, used to check the links.
+    name: str
+        Name of the blueprint used in errors messages.
+
+    Returns
+    --------
+    dict
+        The blueprint data with only builtin types.
+
+    Raises
+    -------
+    ValueError
+        The blueprint does not match the template.
+    """
+
+    def error(message, *args):
+        return ValueError('{0}: {1}'.format(name, message.format(*args)))
+
+    if not isinstance(blueprint, dict):
+        raise error('A blueprint should be a dict, got {0}', type(blueprint).__name__)
+
+    unknownKeys = set(blueprint) - set(AtConstants.BLUEPRINT_TEMPLATE)
+    if unknownKeys:
+        raise error('Unknown keys {0}', ', '.join(sorted(map(str, unknownKeys))))
+
+    process = blueprint.get('process', None)
+    if not isinstance(process, six.string_types) or not process:
+        raise error('`process` should be a non empty string.')
+
+    compiled = {'process': process}
+
+    if 'category' in blueprint:
+        if not isinstance(blueprint['category'], six.string_types):
+            raise error('`category` should be a string.')
+        compiled['category'] = blueprint['category']
+
+    if 'arguments' in blueprint:
+        arguments = {}
+        for method, value in blueprint['arguments'].items():
+            if not isinstance(value, (tuple, list)) or len(value) != 2 or not isinstance(value[1], dict):
+                raise error('`arguments` of `{0}` should be a tuple(list, dict).', method)
+            arguments[method] = [list(value[0]), dict(value[1])]
+        compiled['arguments'] = arguments
+
+    if 'tags' in blueprint:
+        if not isinstance(blueprint['tags'], numbers.Integral):
+            raise error('`tags` should be an int built from `Tag` values.')
+        compiled['tags'] = int(blueprint['tags'])
+
+    if 'links' in blueprint:
+        links = []
+        for link in blueprint['links']:
+            if not isinstance(link, (tuple, list)) or len(link) != 3:
+                raise error('Links should be of type tuple(int, str, str), got {0!r}', link)
+
+            index, driver, driven = link
+            if not isinstance(index, numbers.Integral) or not 0 <= index < count:
+                raise error('Link {0!r} target an unknown ID.', link)
+            if driver not in (AtConstants.CHECK, AtConstants.FIX, AtConstants.TOOL):
+                raise error('Link {0!r} driver should be one of `Link` values.', link)
+            if not isinstance(driven, six.string_types):
+                raise error('Link {0!r} driven should be a method name.', link)
+
+            links.append([int(index), driver, driven])
+        compiled['links'] = links
+
+    if 'options' in blueprint:
+        if not isinstance(blueprint['options'], dict):
+            raise error('`options` should be a dict.')
+        compiled['options'] = blueprint['options']
+
+    return compiled
+
+
+def loadCompiledEnv(path, env):
+    """Load the compiled version of an env if there is one and it is up to date with its env module.
+
+    Parameters
+    -----------
+    path: str
+        Path of the directory containing the env module.
+    env: str
+        Name of the env module.
+
+    Returns
+    --------
+    dict or NoneType
+        The compiled env data with the `register` as a list of blueprints ordered by ID and the env `parameters`, or
+        None if the env is not compiled or its compiled file is outdated.
+    """
+
+    compiledPath = getCompiledEnvPath(path, env)
+    try:
+        compiledTime = os.path.getmtime(compiledPath)
+    except (IOError, OSError):
+        return None
+
+    try:
+        sourceTime = os.path.getmtime(os.path.join(path, '{0}.py'.format(env)))
+    except (IOError, OSError):
+        sourceTime = None
+
+    # A compiled env without its source is still used, this allow to ship only the compiled env.
+    if sourceTime is not None and sourceTime > compiledTime:
+        LOGGER.debug('Compiled env "{0}" is outdated, the env module will be imported.'.format(compiledPath))
+        return None
+
+    with AtUtils.PROFILER.profile('loadCompiledEnv', env):
+        try:
+            with open(compiledPath, 'r') as compiledFile:
+                data = json.load(compiledFile)
+        except (IOError, OSError, ValueError):
+            LOGGER.warning('Unable to read the compiled env "{0}"'.format(compiledPath))
+            return None
+
+    if data.get('version') != AtConstants.MANIFEST_VERSION:
+        return None
+    if sourceTime is not None and data.get('source') != sourceTime:
+        return None
+
+    return data
+
+
+def getCompiledEnvPath(path, env):
+    """Get the path of the compiled version of an env.
+
+    Parameters
+    -----------
+    path: str
+        Path of the directory containing the env module.
+    env: str
+        Name of the env module.
+
+    Returns
+    --------
+    str
+        Path of the compiled env file.
+    """
+
+    return os.path.join(path, '{0}{1}'.format(env, AtConstants.COMPILED_ENV_EXTENSION))
+
+
+def getEnvsDirectory(packageData, software):
+    """Get the path to the `envs` package of the given package for the given software.
+
+    Parameters
+    -----------
+    packageData: dict
+        Package data as returned by `AtUtils.getPackages`, need at least the `path` key.
+    software: str
+        The software for which to get the `envs` package.
+
+    Returns
+    --------
+    str
+        Path of the `envs` package directory.
+    """
+
+    return os.path.join(packageData['path'], software, 'envs')
+
+
+def getSignature(directory):
+    """Get the modification time of each file in the given directory.
+
+    Parameters
+    -----------
+    directory: str
+        Path to the directory to get the signature of.
+
+    Returns
+    --------
+    dict or NoneType
+        A dict with file name as key and modification time as value or None if the directory can't be read.
+    """
+
+    try:
+        names = os.listdir(directory)
+    except (IOError, OSError):
+        return None
+
+    signature = {}
+    for name in names:
+        if not name.endswith(('.py', '.png')):
+            continue
+        try:
+            signature[name] = os.path.getmtime(os.path.join(directory, name))
+        except (IOError, OSError):
+            continue
+
+    return signature
+
+
+def replaceFile(source, destination):
+    """Move the source file to the destination, replacing it if it already exists."""
+
+    if hasattr(os, 'replace'):
+        os.replace(source, destination)
+        return
+
+    # Python 2 on Windows can't rename on an existing file.
+    if os.path.exists(destination):
+        os.remove(destination)
+    os.rename(source, destination)
+
+
+def main(argv=None):
+    """Compile the given env modules, e.g. `python -m Athena.AtManifest my_package.Athena_prod.standalone.envs.env`"""
+
+    parser = argparse.ArgumentParser(description='Compile Athena envs to load them without executing their module.')
+    parser.add_argument('envs', nargs='+', help='Python import string of the env modules to compile.')
+    args = parser.parse_args(argv)
+
+    failed = False
+    for envStr in args.envs:
+        try:
+            path = compileEnv(envStr)
+        except (ImportError, ValueError) as exception:
+            failed = True
+            sys.stderr.write('Unable to compile "{0}": {1}\n'.format(envStr, exception))
+            continue
+
+        sys.stdout.write('{0} -> {1}\n'.format(envStr, path))
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
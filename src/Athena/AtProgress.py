@@ -0,0 +1,252 @@
+"""Progress reporting of the processes, rate limited and sent to pluggable sinks.
+
+A process report its progress with `AtCore.Process.setProgressValue` or by iterating through `AtCore.Process.progress`,
+usually once per object checked. Sending each of these values to a QProgressBar cost a lot more than the check of an
+object itself, the ProgressReporter only send a value to its sinks when it changed enough and not too often.
+A sink is any object with an `update(name, value, text)` method (or a callable with this signature), the ui use a
+WidgetSink and the batch can use a TerminalSink, a LogSink or a CallbackSink.
+"""
+
+import sys
+import time
+import logging
+import threading
+
+from Athena import AtConstants
+
+LOGGER = logging.getLogger(AtConstants.PROGRAM_NAME)
+
+
+class ProgressReporter(object):
+    """Receive the progress of a process and send it to the sinks, at most every `interval` seconds.
+
+    A value is only sent if it changed by at least `delta` percent or if the text changed, the first value and the
+    completion are always sent. The last value received is sent by `flush` if it have been held back.
+    """
+
+    def __init__(self, name=None, sinks=(), interval=AtConstants.PROGRESS_INTERVAL, delta=AtConstants.PROGRESS_DELTA):
+        """Create the reporter with its sinks.
+
+        Parameters
+        -----------
+        name: str, optional
+            The name given to the sinks, usually the name of the process.
+        sinks: iterable
+            The sinks to send the progress to. (see `addSink`)
+        interval: float
+            The minimum number of seconds between two values sent. (default: `AtConstants.PROGRESS_INTERVAL`)
+        delta: float
+            The minimum change of the value, in percent, to send it. (default: `AtConstants.PROGRESS_DELTA`)
+        """
+
+        self.name = name
+        self.interval = interval
+        self.delta = delta
+
+        self._sinks = []
+        for sink in sinks:
+            self.addSink(sink)
+
+        self.reset()
+
+    def __repr__(self):
+        """Return the representation of the reporter"""
+
+        return "<{0} '{1}' - {2} sink(s)>".format(self.__class__.__name__, self.name, len(self._sinks))
+
+    @property
+    def sinks(self):
+        """Get the sinks the progress is sent to"""
+        return tuple(self._sinks)
+
+    def addSink(self, sink):
+        """Send the progress to the given sink.
+
+        Parameters
+        -----------
+        sink: ProgressSink or callable
+            An object with an `update(name, value, text)` method, a callable is wrapped in a CallbackSink.
+
+        Returns
+        --------
+        ProgressSink
+            The sink added, to remove it later.
+        """
+
+        if not hasattr(sink, 'update') and callable(sink):
+            sink = CallbackSink(sink)
+
+        self._sinks.append(sink)
+        return sink
+
+    def removeSink(self, sink):
+        """Stop sending the progress to the given sink, if it have been added."""
+
+        if sink in self._sinks:
+            self._sinks.remove(sink)
+
+    def reset(self):
+        """Forget the last value sent, the next value will be sent whatever it is. Called before each method run."""
+
+        self._value = None
+        self._text = None
+        self._time = 0.0
+
+        self._pendingValue = None
+        self._pendingText = None
+
+    def update(self, value, text=None):
+        """Receive a new progress value, it is sent to the sinks only if it changed enough since the last one sent.
+
+        Parameters
+        -----------
+        value: numbers.Number
+            The progress, in percent.
+        text: str or NoneType
+            The text to display with the progress, the last one is kept if None.
+
+        Returns
+        --------
+        bool
+            True if the value have been sent to the sinks.
+        """
+
+        if not self._sinks:
+            return False
+
+        # Cheapest tests first, this is called in the tight loops of the checks.
+        if self._value is not None and (value < 100 or self._value >= 100):
+            if abs(value - self._value) < self.delta and (text is None or text == self._text):
+                self._pendingValue, self._pendingText = value, text
+                return False
+
+            if time.time() - self._time < self.interval:
+                self._pendingValue, self._pendingText = value, text
+                return False
+
+        self._send(value, text)
+        return True
+
+    def flush(self):
+        """Send the last value received if it have been held back. Called after each method run."""
+
+        if self._pendingValue is not None:
+            self._send(self._pendingValue, self._pendingText)
+
+    def _send(self, value, text):
+        """Send the given value to all sinks."""
+
+        if text is None:
+            text = self._text
+
+        for sink in self._sinks:
+            sink.update(self.name, value, text)
+
+        self._value = value
+        self._text = text
+        self._time = time.time()
+
+        self._pendingValue = None
+        self._pendingText = None
+
+
+class ProgressSink(object):
+    """Base class of the sinks, receive the values sent by a ProgressReporter. It does nothing with them by itself."""
+
+    def update(self, name, value, text):
+        """Display the given progress, the sinks override this method. The base sink ignore the progress.
+
+        Parameters
+        -----------
+        name: str
+            The name of the reporter, usually the name of the process.
+        value: numbers.Number
+            The progress, in percent.
+        text: str or NoneType
+            The text to display with the progress.
+        """
+
+
+class WidgetSink(ProgressSink):
+    """Display the progress in a Qt progress bar, or any widget with the `setValue` and `setFormat` methods."""
+
+    def __init__(self, widget, format=AtConstants.PROGRESSBAR_FORMAT):
+        self.widget = widget
+        self.format = format
+
+        self._text = None
+
+    def update(self, name, value, text):
+        self.widget.setValue(int(value))
+
+        # The format is only changed with the text, the widget text contain the formatted value.
+        if text and text != self._text:
+            self.widget.setFormat(self.format.format(text))
+            self._text = text
+
+
+class TerminalSink(ProgressSink):
+    """Display the progress as a bar in a terminal, the line is rewritten until the progress is complete.
+
+    When several reporters are running at once (e.g. a batch with several threads), rewriting the same line would mix
+    them, each value is then written on its own line.
+    """
+
+    def __init__(self, stream=None, width=30):
+        self.stream = stream
+        self.width = width
+
+        self._running = set()
+        self._isLineOpened = False
+        self._lock = threading.Lock()
+
+    def update(self, name, value, text):
+        stream = self.stream or sys.stderr
+
+        filled = int(self.width * min(max(value, 0), 100) / 100.0)
+        line = '{0} [{1}{2}] {3:3d}% {4}'.format(name or '', '#' * filled, ' ' * (self.width - filled), int(value), text or '')
+
+        with self._lock:
+            if value < 100:
+                self._running.add(name)
+            else:
+                self._running.discard(name)
+
+            if len(self._running) > 1:
+                # Close the line of the reporter that was running alone, the next lines are not rewritten.
+                if self._isLineOpened:
+                    stream.write('\n')
+                stream.write(line + '\n')
+                self._isLineOpened = False
+            else:
+                stream.write('\r' + line)
+                self._isLineOpened = value < 100
+                if not self._isLineOpened:
+                    stream.write('\n')
+
+            stream.flush()
+
+
+class LogSink(ProgressSink):
+    """Log the progress, the values are also given in the `progress` attribute of the log record."""
+
+    def __init__(self, logger=LOGGER, level=logging.INFO):
+        self.logger = logger
+        self.level = level
+
+    def update(self, name, value, text):
+        self.logger.log(
+            self.level,
+            '{0}: {1:.0f}%{2}'.format(name, value, ' - {0}'.format(text) if text else ''),
+            extra={'progress': {'name': name, 'value': value, 'text': text}}
+        )
+
+
+class CallbackSink(ProgressSink):
+    """Call a function with the name of the reporter, the value and the text for each value sent."""
+
+    def __init__(self, callback):
+        self.callback = callback
+
+    def update(self, name, value, text):
+        self.callback(name, value, text)
@@ -1,16 +1,28 @@
 import os
 import re
 import sys
+import time
+import hashlib
 import pkgutil
 import logging
+import weakref
 import importlib
+import threading
 
 from types import FunctionType
 
+try:
+    from importlib.util import find_spec, cache_from_source
+except ImportError:  # Python 2
+    find_spec = cache_from_source = None
+
 from Athena import AtConstants
 
 LOGGER = logging.getLogger(AtConstants.PROGRAM_NAME)
 
+# Most precise clock available to measure durations.
+getTime = getattr(time, 'perf_counter', time.time)
+
 
 def getEnvs(package, software='standalone', verbose=False):
     """Retrieve available envs from imported packages.
@@ -18,6 +30,8 @@ def getEnvs(package, software='standalone', verbose=False):
     Retrieve the currently imported packages path that match the pattern to works with this tool: {program}_{prod}
     Then, generate the usual path to the env using the package, the current software for the first sub package and env to the 
     desired package.
+    The env modules are not imported here, each env is described by a `LazyEnv` that will import its module the first
+    time it is needed.
 
     parameters
     -----------
@@ -32,7 +46,7 @@ def getEnvs(package, software='standalone', verbose=False):
     --------
     dict
         Return a dict containing all envs for the given package and software.
-        The key is the env and the value is a dict containing the imported module object for the env and its str path.
+        The key is the env and the value is a `LazyEnv` containing the env str path, its directory and icon.
     """
 
     availableEnvs = {}
@@ -53,24 +67,80 @@ def getEnvs(package, software='standalone', verbose=False):
         env = '{0}.{1}'.format(envPackageStr, name)
         path = importer.path
         icon = os.path.join(path, '{0}.png'.format(name))
-        envModule = importFromStr(env)
 
-        availableEnvs[name] = {
-            'import': env,
-            'module': envModule,
-            'path': path,
-            'icon': icon if os.path.isfile(icon) else None,
-            'parameters': getattr(envModule, 'parameters', {})
-        }
+        availableEnvs[name] = LazyEnv(env, path, icon if os.path.isfile(icon) else None, verbose=verbose)
 
     return availableEnvs
 
 
+class LazyEnv(dict):
+    """Data of an env that only import the env module when it is queried.
+
+    The LazyEnv behave like the dict used to describe an env (`import`, `module`, `path`, `icon` and `parameters` keys)
+    but the `module` and `parameters` values are only retrieved on first access, importing the module at this time.
+    This allow to list a lot of envs without importing all of them and their processes modules.
+    """
+
+    def __init__(self, importStr, path, icon=None, verbose=False, **data):
+        """Init the env data with the values that do not need the module to be imported.
+
+        parameters
+        -----------
+        importStr: str
+            The python import string of the env module.
+        path: str
+            Path of the directory containing the env module.
+        icon: str or NoneType
+            Path of the env icon if there is one.
+        verbose: bool
+            Define if the import should log informations about its process. (default: False)
+        **data:
+            Other values already known for this env. (e.g. `parameters` retrieved from a manifest)
+        """
+
+        super(LazyEnv, self).__init__(data, path=path, icon=icon)
+        self['import'] = importStr
+
+        self.verbose = verbose
+
+    def __repr__(self):
+        """Return the representation of the LazyEnv"""
+
+        return "<{0} '{1}' ({2})>".format(self.__class__.__name__, self['import'], 'loaded' if self.isLoaded else 'not loaded')
+
+    def __missing__(self, key):
+        """Retrieve the values that need the env module when they are queried for the first time."""
+
+        if key == 'module':
+            value = self['module'] = importFromStr(self['import'], verbose=self.verbose)
+            return value
+
+        elif key == 'parameters':
+            value = self['parameters'] = getattr(self['module'], 'parameters', {})
+            return value
+
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        """Return the value for the given key, loading it if needed, else the default value."""
+
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    @property
+    def isLoaded(self):
+        """Get if the env module have already been imported"""
+        return dict.get(self, 'module') is not None
+
+
 def getPackages(verbose=False):
     """Get all packages that match the tool convention pattern.
 
-    Loop through all modules in sys.modules.keys() and package those who match the tool convention pattern
-    that is {PROGRAM_NAME}_???
+    The packages are retrieved from the `PackageRegistry` that record the imported modules that match the tool
+    convention pattern that is {PROGRAM_NAME}_??? through an import hook. So `sys.modules` is only scanned once,
+    when the registry is created.
 
     parameters
     -----------
@@ -84,47 +154,236 @@ def getPackages(verbose=False):
         The key is the prod and the value is a dict containing the module object and its str path.
     """
 
-    packages = {}
+    packages = PackageRegistry().getPackages()
 
-    rules = []
-    # Append the rules list with all rules used to get package that end with {PROGRAM_NAME}_?_???
-    rules.append('.*?')  # Non-greedy match on filler
-    rules.append('({}_(?:[A-Za-z0-9_]+))'.format(AtConstants.PROGRAM_NAME))  # Match {PROGRAM_NAME}_? pattern.
-    rules.append('.*?')  # Non-greedy match on filler
-    rules.append('([A-Za-z0-9_]+)')    # Word that match alpha and/or numerics, allowing '_' character.
+    if verbose:
+        for packageData in packages.values():
+            LOGGER.info('Package "{}" found'.format(packageData['import']))
 
-    regex = re.compile(''.join(rules), re.IGNORECASE|re.DOTALL)
+    return packages
 
-    for loadedPackage in sys.modules.keys():
 
-        # Ignore all module unrelated to this tool.
-        if AtConstants.PROGRAM_NAME not in loadedPackage:
-            continue
+# Regex used to get package that end with {PROGRAM_NAME}_?_???
+PACKAGE_REGEX = re.compile(''.join((
+    '.*?',  # Non-greedy match on filler
+    '({}_(?:[A-Za-z0-9_]+))'.format(AtConstants.PROGRAM_NAME),  # Match {PROGRAM_NAME}_? pattern.
+    '.*?',  # Non-greedy match on filler
+    '([A-Za-z0-9_]+)',  # Word that match alpha and/or numerics, allowing '_' character.
+)), re.IGNORECASE|re.DOTALL)
 
-        search = regex.search(loadedPackage)
-        if not search:
-            continue
+def matchPackage(moduleStr):
+    """Check if the given module name match the tool convention pattern for a context package.
 
-        groups = search.groups()
-        if not loadedPackage.endswith('.'.join(groups)):
-            continue
-            
-        module = importFromStr(loadedPackage)
+    parameters
+    -----------
+    moduleStr: str
+        Name of a python module.
 
-        path = os.path.dirname(module.__file__)
-        icon = os.path.join(path, 'icon.png')
-        
-        packages[groups[-1]] = {
-            'path': path,
-            'import': loadedPackage,
-            'module': module,
-            'icon': icon if os.path.isfile(icon) else None
-        }
+    Returns
+    --------
+    str or NoneType
+        Return the context name if the module is a context package, None otherwise.
+    """
 
-        if verbose:
-            log('Package "{}" found'.format(loadedPackage), 'info')
+    # Ignore all module unrelated to this tool.
+    if AtConstants.PROGRAM_NAME not in moduleStr:
+        return None
 
-    return packages
+    search = PACKAGE_REGEX.search(moduleStr)
+    if not search:
+        return None
+
+    groups = search.groups()
+    if not moduleStr.endswith('.'.join(groups)):
+        return None
+
+    return groups[-1]
+
+
+class PackageRegistry(object):
+    """Registry of the imported Athena packages, kept up to date through an import hook.
+
+    Scanning `sys.modules` to find the Athena packages is slow in a software session that can have tens of thousands
+    of modules imported. The registry scan it only once at creation, then a finder installed in `sys.meta_path` record
+    the name of each module that match the tool convention when it is imported. The packages are added to the registry
+    once their import is done, the next time the registry is updated, and all subscribers are notified.
+
+    Notes
+    -----
+    There is only one registry, any instantiation will return the same instance.
+    """
+
+    INSTANCE = None
+
+    def __new__(cls):
+
+        if cls.INSTANCE is None:
+            instance = super(PackageRegistry, cls).__new__(cls)
+            instance._setup()
+
+            cls.INSTANCE = instance
+
+        return cls.INSTANCE
+
+    def _setup(self):
+        """Scan the already imported modules and install the import hook."""
+
+        self._lock = threading.Lock()
+
+        self._packages = {}
+        self._pending = set(name for name in list(sys.modules.keys()) if matchPackage(name))
+        self._subscribers = []
+
+        self.finder = PackageFinder(self)
+        sys.meta_path.insert(0, self.finder)
+
+        self.update()
+
+    def __repr__(self):
+        """Return the representation of the registry"""
+
+        return "<{0} - {1} package(s)>".format(self.__class__.__name__, len(self._packages))
+
+    def record(self, moduleStr):
+        """Record a module name to be added to the registry once imported. (Called by the import hook)
+
+        parameters
+        -----------
+        moduleStr: str
+            Name of the module being imported.
+        """
+
+        if matchPackage(moduleStr) is None:
+            return
+
+        with self._lock:
+            self._pending.add(moduleStr)
+
+    def update(self):
+        """Add the recorded packages that are now imported and notify the subscribers for each new package.
+
+        Returns
+        --------
+        dict
+            The new packages added to the registry, with the same structure as `getPackages`.
+        """
+
+        with self._lock:
+            pending = self._pending
+            self._pending = set()
+
+        newPackages = {}
+        for moduleStr in pending:
+            module = sys.modules.get(moduleStr, None)
+
+            # The module is not fully imported yet (or its import failed), keep it for the next update.
+            if module is None or getattr(module, '__file__', None) is None:
+                with self._lock:
+                    self._pending.add(moduleStr)
+                continue
+
+            path = os.path.dirname(module.__file__)
+            icon = os.path.join(path, 'icon.png')
+
+            newPackages[matchPackage(moduleStr)] = {
+                'path': path,
+                'import': moduleStr,
+                'module': module,
+                'icon': icon if os.path.isfile(icon) else None
+            }
+
+        # Forget the packages that have been removed from `sys.modules`.
+        for context, packageData in list(self._packages.items()):
+            if sys.modules.get(packageData['import'], None) is not packageData['module']:
+                del self._packages[context]
+
+        self._packages.update(newPackages)
+
+        for context, packageData in newPackages.items():
+            for subscriber in list(self._subscribers):
+                callback = subscriber()
+                if callback is None:
+                    self._subscribers.remove(subscriber)
+                    continue
+                callback(context, dict(packageData))
+
+        return newPackages
+
+    def getPackages(self):
+        """Get all the packages in the registry, after updating it.
+
+        Returns
+        --------
+        dict
+            Return a copy of the dict containing all packages, with the context as key.
+        """
+
+        self.update()
+
+        return dict((context, dict(packageData)) for context, packageData in self._packages.items())
+
+    def subscribe(self, callback):
+        """Add a callback to call with the context and package data each time a new package is added.
+
+        Bound methods are only weakly referenced so subscribing does not keep their instance alive.
+
+        parameters
+        -----------
+        callback: callable
+            Function that accept the context name and the package data dict.
+        """
+
+        self._subscribers.append(WeakCallback(callback))
+
+    def unsubscribe(self, callback):
+        """Remove the given callback from the subscribers."""
+
+        self._subscribers = [subscriber for subscriber in self._subscribers if subscriber() not in (None, callback)]
+
+
+class PackageFinder(object):
+    """Meta path finder that only record the Athena packages being imported, it never import anything itself."""
+
+    def __init__(self, registry):
+        self.registry = registry
+
+    def find_spec(self, fullname, path=None, target=None):
+        """Record the module name and let the other finders find it. (Python 3)"""
+
+        self.registry.record(fullname)
+        return None
+
+    def find_module(self, fullname, path=None):
+        """Record the module name and let the other finders find it. (Python 2)"""
+
+        self.registry.record(fullname)
+        return None
+
+
+class WeakCallback(object):
+    """Weak reference to a callable, for a bound method only its instance is weakly referenced."""
+
+    def __init__(self, callback):
+
+        instance = getattr(callback, '__self__', None)
+        if instance is not None:
+            self._instance = weakref.ref(instance)
+            self._function = getattr(callback, '__func__')
+        else:
+            self._instance = None
+            self._function = callback
+
+    def __call__(self):
+        """Return the referenced callable or None if its instance have been deleted."""
+
+        if self._instance is None:
+            return self._function
+
+        instance = self._instance()
+        if instance is None:
+            return None
+
+        return self._function.__get__(instance, type(instance))
 
 
 def getSoftware(default='standalone'):
@@ -226,7 +485,8 @@ def importFromStr(moduleStr, verbose=False):
     module = None  #Maybe QC Error ?
     try:
         # module = __import__(moduleStr, fromlist=[''])
-        module = importlib.import_module(moduleStr) #TODO: if multiple checks come from same module try to load module multiple time
+        with PROFILER.profile('import', moduleStr):
+            module = importlib.import_module(moduleStr) #TODO: if multiple checks come from same module try to load module multiple time
         if verbose: 
             LOGGER.info('import {} success'.format(moduleStr))
     except ImportError as exception:
@@ -237,6 +497,140 @@ def importFromStr(moduleStr, verbose=False):
     return module
 
 
+def getModulePath(moduleStr):
+    """Get the path of the source file of the given module without importing it.
+
+    The parent packages of the module will be imported to find it, but not the module itself. If the module is
+    already imported, its `__file__` is used.
+
+    parameters
+    -----------
+    moduleStr: str
+        Path to a module.
+
+    Returns
+    --------
+    str or NoneType
+        Return the path to the module source file or None if it can't be found.
+    """
+
+    module = sys.modules.get(moduleStr, None)
+    if module is not None:
+        path = getattr(module, '__file__', None)
+
+    else:
+        try:
+            if find_spec is not None:
+                spec = find_spec(moduleStr)
+                path = spec.origin if spec is not None else None
+            else:
+                loader = pkgutil.get_loader(moduleStr)  # Python 2
+                path = loader.get_filename() if loader is not None else None
+        except (ImportError, AttributeError, ValueError):
+            return None
+
+    if not path:
+        return None
+
+    # Compiled files can be found for already imported modules, prefer the source.
+    if path.endswith(('.pyc', '.pyo')) and os.path.isfile(path[:-1]):
+        path = path[:-1]
+
+    return path if path.endswith('.py') else None
+
+
+def prefetchModules(moduleStrs, workers=AtConstants.PREFETCH_WORKERS):
+    """Read the files of the given modules concurrently to have them in the OS cache before importing them.
+
+    On slow network mounts, the import time of a module is mostly spent reading its source and bytecode files. Theses
+    files are read by a bounded pool of threads so the following imports, that are serial, only hit the cache.
+    Modules are not imported here, only their parent packages are to locate them.
+
+    parameters
+    -----------
+    moduleStrs: iterable
+        Path to the modules to prefetch.
+    workers: int
+        Maximum number of threads used to read the files. (default: `AtConstants.PREFETCH_WORKERS`)
+
+    Returns
+    --------
+    int
+        Number of bytes read.
+    """
+
+    paths = []
+    for moduleStr in set(moduleStrs):
+        if moduleStr in sys.modules:
+            continue
+
+        path = getModulePath(moduleStr)
+        if path is None:
+            continue
+        paths.append(path)
+
+        if cache_from_source is not None:
+            try:
+                paths.append(cache_from_source(path))
+            except NotImplementedError:
+                pass
+        else:
+            paths.append(path + 'c')  # Python 2
+
+    if not paths:
+        return 0
+
+    from multiprocessing.pool import ThreadPool  # Only imported when needed, it is slow to import.
+
+    pool = ThreadPool(max(1, min(workers, len(paths))))
+    try:
+        return sum(pool.map(_readFile, paths))
+    finally:
+        pool.close()
+        pool.join()
+
+
+def _readFile(path):
+    """Read the given file by chunks and return the number of bytes read, or 0 if it can't be read."""
+
+    size = 0
+    try:
+        with open(path, 'rb') as fileToRead:
+            for chunk in iter(lambda: fileToRead.read(65536), b''):
+                size += len(chunk)
+    except (IOError, OSError):
+        pass
+
+    return size
+
+
+def getFileHash(path, algorithm='sha1'):
+    """Get the hash of the content of the given file, read by chunks to handle big files.
+
+    parameters
+    -----------
+    path: str
+        Path of the file to hash.
+    algorithm: str
+        Name of the `hashlib` algorithm to use. (default: 'sha1')
+
+    Returns
+    --------
+    str or NoneType
+        The hexadecimal digest of the file content or None if the file can't be read.
+    """
+
+    digest = hashlib.new(algorithm)
+    try:
+        with open(path, 'rb') as fileToHash:
+            for chunk in iter(lambda: fileToHash.read(65536), b''):
+                digest.update(chunk)
+    except (IOError, OSError):
+        return None
+
+    return digest.hexdigest()
+
+
 # could be only with instance of class. (get inheritance and return dict with each one as key and list of overriden as value)
 def getOverriddedMethods(instance, cls):
     """Detect all methods that have been overridden from a subclass of a class
@@ -341,6 +735,203 @@ def logHeader(message):
     ))
 '''
 
+class Profiler(object):
+    """Opt-in instrumentation that record the wall time and call count of each phase of Athena.
+
+    The phases are recorded through the `profile` context manager, when the profiler is disabled (default) it return
+    a shared context that does nothing so the instrumentation cost almost nothing.
+    Once enabled, each profiled call is recorded and can be reported as a dict, a printed table or a Chrome trace file
+    (to open in `chrome://tracing` or https://ui.perfetto.dev).
+
+    Notes
+    -----
+    Use the `PROFILER` instance of this module, it is the one used by Athena.
+    >>> AtUtils.PROFILER.enable()
+    >>> Athena.launch()
+    >>> AtUtils.PROFILER.printReport()
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._events = []
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        """Return the representation of the profiler"""
+
+        return "<{0} {1} - {2} event(s)>".format(self.__class__.__name__, 'enabled' if self.enabled else 'disabled', len(self._events))
+
+    def enable(self, reset=True):
+        """Start recording the profiled phases.
+
+        parameters
+        -----------
+        reset: bool
+            Remove the events already recorded. (default: True)
+        """
+
+        if reset:
+            self.reset()
+        self.enabled = True
+
+    def disable(self):
+        """Stop recording the profiled phases, the recorded events are kept."""
+        self.enabled = False
+
+    def reset(self):
+        """Remove all recorded events."""
+
+        with self._lock:
+            self._events = []
+
+    def profile(self, phase, name=None):
+        """Get a context manager that record the time spent in it for the given phase.
+
+        parameters
+        -----------
+        phase: str
+            Name of the phase to record. (e.g. 'getEnvs')
+        name: str or NoneType
+            Optional name of the item profiled in this phase. (e.g. the context name)
+
+        Returns
+        --------
+        object
+            A context manager to use in a `with` statement.
+        """
+
+        if not self.enabled:
+            return _NULL_PROFILE_SCOPE
+
+        return _ProfileScope(self, phase, name)
+
+    def addEvent(self, phase, name, start, duration):
+        """Record a profiled event, used by the profile context manager."""
+
+        with self._lock:
+            self._events.append((phase, name, start, duration, threading.current_thread().ident))
+
+    def report(self):
+        """Get the recorded data by phase.
+
+        Returns
+        --------
+        dict
+            The phase as key and a dict with the `calls` count, the `total` and `max` time in seconds and the `items`
+            dict (item name as key and dict with `calls` and `total` as value) as value.
+        """
+
+        report = {}
+        for phase, name, _, duration, _ in list(self._events):
+            phaseData = report.setdefault(phase, {'calls': 0, 'total': 0.0, 'max': 0.0, 'items': {}})
+            phaseData['calls'] += 1
+            phaseData['total'] += duration
+            phaseData['max'] = max(phaseData['max'], duration)
+
+            if name is not None:
+                itemData = phaseData['items'].setdefault(name, {'calls': 0, 'total': 0.0})
+                itemData['calls'] += 1
+                itemData['total'] += duration
+
+        return report
+
+    def formatReport(self, items=5):
+        """Format the report as a table, phases are sorted from the slowest to the fastest.
+
+        parameters
+        -----------
+        items: int
+            Number of the slowest items to display under each phase. (default: 5)
+
+        Returns
+        --------
+        str
+            The formatted table.
+        """
+
+        lines = ['{0:<50} {1:>8} {2:>12} {3:>12}'.format('Phase', 'Calls', 'Total (ms)', 'Max (ms)')]
+        lines.append('-' * len(lines[0]))
+
+        for phase, phaseData in sorted(self.report().items(), key=lambda item: -item[1]['total']):
+            lines.append('{0:<50} {1:>8} {2:>12.2f} {3:>12.2f}'.format(
+                phase, phaseData['calls'], phaseData['total'] * 1000, phaseData['max'] * 1000))
+
+            slowestItems = sorted(phaseData['items'].items(), key=lambda item: -item[1]['total'])[:items]
+            for name, itemData in slowestItems:
+                lines.append('    {0:<46} {1:>8} {2:>12.2f}'.format(
+                    str(name)[-46:], itemData['calls'], itemData['total'] * 1000))
+
+        return '\n'.join(lines)
+
+    def printReport(self, items=5):
+        """Print the report table. (see `formatReport`)"""
+
+        print(self.formatReport(items=items))
+
+    def writeChromeTrace(self, path):
+        """Write the recorded events in a Chrome trace event file.
+
+        parameters
+        -----------
+        path: str
+            Path of the json file to write.
+        """
+
+        import json
+
+        pid = os.getpid()
+        events = []
+        for phase, name, start, duration, thread in list(self._events):
+            events.append({
+                'name': phase if name is None else '{0}: {1}'.format(phase, name),
+                'cat': phase,
+                'ph': 'X',
+                'ts': start * 1e6,
+                'dur': duration * 1e6,
+                'pid': pid,
+                'tid': thread,
+            })
+
+        with open(path, 'w') as traceFile:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, traceFile)
+
+
+class _ProfileScope(object):
+    """Context manager that record the time spent in it into a profiler."""
+
+    __slots__ = ('profiler', 'phase', 'name', 'start')
+
+    def __init__(self, profiler, phase, name):
+        self.profiler = profiler
+        self.phase = phase
+        self.name = name
+        self.start = None
+
+    def __enter__(self):
+        self.start = getTime()
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.profiler.addEvent(self.phase, self.name, self.start, getTime() - self.start)
+
+
+class _NullProfileScope(object):
+    """Context manager that does nothing, used when the profiler is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        return None
+
+
+_NULL_PROFILE_SCOPE = _NullProfileScope()
+
+PROFILER = Profiler()
+
+
 class RessourcesManager(object):
     #TODO: Document this class
 
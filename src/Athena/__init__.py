@@ -7,56 +7,42 @@
  /_/    \_\__|_| |_|\___|_| |_|\__,_|
 """
 
-from Athena.AtGui import AtUi
-from Athena import AtCore, AtUtils, AtConstants
+import sys
+
+from Athena import AtCore, AtUtils, AtConstants, AtBatch, AtProgress
 
 __version__ = AtConstants.VERSION
 
-def launch(context=None, env=None, displayMode='Blueprint', dev=False, verbose=False):
-    """ Main function to launch the tool. """
+def launch(context=None, env=None, displayMode='Blueprint', dev=False, verbose=False, virtualized=False):
+    """ Main function to launch the tool. 
+    
+    The ui module is only imported here so the API and `batch` can be used without any Qt binding.
+    With `virtualized`, the processes are painted in a list view instead of having a widget each. (see `AtUi.ProcessesView`)
+    """
 
     if dev:
         safeReload()
 
-    window = AtUi.Athena(context=context, env=env, displayMode=displayMode, dev=dev, verbose=verbose)
+    from Athena.AtGui import AtUi
+
+    window = AtUi.Athena(context=context, env=env, displayMode=displayMode, dev=dev, verbose=verbose, virtualized=virtualized)
     window.show()
 
     return window
 
-def batch(context, env, dev=False, verbose=False):
-    """ Used to run blueprintes without any AtUi """
+def batch(context, env, dev=False, verbose=False, workers=None, executor=None, resultCache=None, progress=None):
+    """ Used to run blueprintes without any AtUi 
+    
+    Independent blueprints can be run concurrently, the concurrency is read from the env `parameters` (`workers` and
+    `executor`) unless `workers` or `executor` are given. (see `AtBatch.BatchExecutor`)
+    The checks feedback can be stored and reused from a persistent `resultCache`. (see `AtCache.ResultCache`)
+    The progress of the blueprints can be followed with a `progress` sink, e.g. `AtProgress.TerminalSink()`.
+    """
 
     if dev:
         safeReload()
 
-    register = AtCore.Register(verbose=verbose)
-    blueprints = register.getBlueprints(context, env)
-
-    traceback = []
-    toFix = []
-    for blueprint in blueprints:
-
-        if not blueprint._isCheckable or blueprint._isNonBlocking or not blueprint._inBatch:
-            continue
-
-        try:
-            result, state = blueprint.check()
-            if state:
-                toFix.append(blueprint)
-
-        except Exception as exception:
-            pass  #TODO: Raise an error
-
-    for blueprint in toFix:
-        try:
-            blueprint.fix()
-            result, state = blueprint.check()
-            
-            if state:
-                traceback.append((blueprint.name, result))
-
-        except Exception as exception:
-            pass  #TODO: Raise an error
+    traceback = AtBatch.BatchExecutor(context, env, workers=workers, executor=executor, resultCache=resultCache, progress=progress, verbose=verbose).run()
 
     if traceback:
         log = "\nErrors found during execution of {0}'s {1} blueprints:\n".format(context, env)
@@ -66,8 +52,19 @@ def batch(context, env, dev=False, verbose=False):
             log += '\n\t{0}:'.format(blueprintName)
 
             for each in result:
+                toDisplay = each['toDisplay']
+
+                # Only the first chunk of a stream is logged, it may contain a lot of objects.
+                if isinstance(toDisplay, AtCore.FeedbackStream):
+                    toDisplay = '{0}{1}'.format(toDisplay.head(), '' if toDisplay.isExhausted and toDisplay.count <= AtConstants.FEEDBACK_CHUNK_SIZE else ' ...')
+
                 log += '\n\t\t- {0}:'.format(each['title'])
-                log += '\n\t\t\t{0}'.format(each['toDisplay'])
+
+                # A feedback truncated by the `maxErrors` option only contain the first objects found.
+                if AtCore.isTruncated(each):
+                    log += ' (truncated, found at least {0})'.format(AtCore.getFoundCount(each).rstrip('+'))
+
+                log += '\n\t\t\t{0}'.format(toDisplay)
         
         if verbose: print(log)
         return False
@@ -82,5 +79,11 @@ def safeReload():
     AtCore.Process = _legacyProcess
     
     reload(AtUtils)
-    reload(AtUi)
     reload(AtConstants)
+    reload(AtBatch)
+    reload(AtProgress)
+
+    # The ui is only reloaded if it have already been imported.
+    AtUi = sys.modules.get('Athena.AtGui.AtUi', None)
+    if AtUi is not None:
+        reload(AtUi)